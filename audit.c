@@ -0,0 +1,28 @@
+#define _GNU_SOURCE
+#include <link.h>
+#include <stdio.h>
+#include <string.h>
+#define HOOK_MARKER "LD_AUDIT_HOOKED"
+#include "hook_targets.h"
+// Loaded with LD_AUDIT: the dynamic linker asks la_symbind64 for every symbol
+// it binds between audited objects and uses the address returned. The hooks
+// live in the audit namespace but run on the caller's stack like any callee
+unsigned int la_version(unsigned int version) {
+    return version < LAV_CURRENT ? version : LAV_CURRENT;
+}
+unsigned int la_objopen(struct link_map* map, Lmid_t lmid, uintptr_t* cookie) {
+    return LA_FLG_BINDTO | LA_FLG_BINDFROM;
+}
+uintptr_t la_symbind64(Elf64_Sym* sym, unsigned int ndx, uintptr_t* refcook, uintptr_t* defcook,
+                       unsigned int* flags, const char* symname) {
+    struct hook_target* target = find_hook_target(symname);
+    if (!target) {
+        return sym->st_value;
+    }
+    if (target->original) {
+        *target->original = (void*)sym->st_value;
+    }
+    // No la_pltenter/la_pltexit, so later calls go straight to the hook
+    *flags |= LA_SYMB_NOPLTENTER | LA_SYMB_NOPLTEXIT;
+    return (uintptr_t)target->replacement;
+}
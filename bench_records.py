@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+import json
+import sys
+
+RECORD_FIELDS = ('phase', 'iterations', 'elapsed_ns', 'max_rss_kb', 'validation')
+
+
+def iter_records(lines):
+    for line in lines:
+        line = line.strip()
+        if not line.startswith('{'):
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A run killed mid-write leaves at most one truncated trailing line
+            continue
+        if all(field in record for field in RECORD_FIELDS):
+            yield record
+
+
+def read_records(path):
+    with open(path) as f:
+        return {record['phase']: record for record in iter_records(f)}
+
+
+def iter_memory_samples(lines):
+    # BENCH_MEMORY samples share the records file, tagged with phase "memory"
+    for line in lines:
+        line = line.strip()
+        if not line.startswith('{"phase":"memory"'):
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
+def read_memory_samples(path):
+    with open(path) as f:
+        return list(iter_memory_samples(f))
+
+
+if __name__ == '__main__':
+    for path in sys.argv[1:]:
+        for phase, record in read_records(path).items():
+            print(f"{phase:12s} {record['elapsed_ns'] / 1000:12.3f} us  {record['max_rss_kb']:8d} KB  {record['validation']}")
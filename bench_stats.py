@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+import hashlib
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = 'results/.cache'
+SUMMARY_VERSION = 2
+BASELINE_FOR = {'complex_ops': 'baseline_complex'}
+# Methods that bind recursive_sum through the PLT only, so they hook the
+# outermost frame of a recursion and none of the nested ones
+OUTER_FRAME_ONLY = {'ldaudit'}
+DEFAULT_CALLS = {
+    'hot_path': 1000000,
+    'heavy_work': 1000000,
+    'recursive': 1000000,
+    'array_ops': 100000,
+    'memory_ops': 1000000,
+    'complex_ops': 1000000,
+}
+BOOTSTRAP_SAMPLES = 2000
+CI_LEVEL = 0.95
+
+
+def bootstrap_medians(values, samples=BOOTSTRAP_SAMPLES, seed=0):
+    values = np.asarray(values, dtype=float)
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(values), size=(samples, len(values)))
+    return np.median(values[idx], axis=1)
+
+
+def ci_bounds(distribution):
+    alpha = (1 - CI_LEVEL) / 2
+    return tuple(np.quantile(distribution, [alpha, 1 - alpha]))
+
+
+def median_ci(values):
+    return ci_bounds(bootstrap_medians(values))
+
+
+def overhead_ci(values, baseline_values):
+    return ci_bounds(bootstrap_medians(values, seed=1) - bootstrap_medians(baseline_values, seed=2))
+
+
+def rankdata(values):
+    order = np.argsort(values, kind='mergesort')
+    sorted_values = values[order]
+    ranks = np.empty(len(values))
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    ends = np.r_[starts[1:], len(values)]
+    ranks[order] = np.repeat((starts + ends + 1) / 2.0, ends - starts)
+    return ranks, ends - starts
+
+
+def mann_whitney_u(candidate, reference):
+    # One-sided test that candidate tends to be larger than reference, normal
+    # approximation with tie correction; returns (U, p, Cliff's delta)
+    candidate = np.asarray(candidate, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    n1, n2 = len(candidate), len(reference)
+    ranks, tie_counts = rankdata(np.concatenate([candidate, reference]))
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    sigma = np.sqrt(n1 * n2 / 12.0 * ((n + 1) - (tie_counts ** 3 - tie_counts).sum() / (n * (n - 1))))
+    if sigma == 0:
+        p = 1.0
+    else:
+        z = (u - n1 * n2 / 2.0 - 0.5) / sigma
+        p = 0.5 * math.erfc(z / math.sqrt(2))
+    return u, p, 2.0 * u / (n1 * n2) - 1.0
+
+
+def data_hash(*frames):
+    h = hashlib.sha1()
+    for df in frames:
+        h.update(','.join(map(str, df.columns)).encode())
+        h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()[:16]
+
+
+def describe(grouped):
+    summary = grouped.agg(['count', 'median', 'min', 'max'])
+    quantiles = grouped.quantile([0.25, 0.75]).unstack()
+    summary['q1'] = quantiles[0.25]
+    summary['q3'] = quantiles[0.75]
+    summary['iqr'] = summary['q3'] - summary['q1']
+    return summary.reset_index()
+
+
+def compute_timing_summary(df_timing):
+    summary = describe(df_timing.groupby(['Method', 'Function'])['Time_us'])
+
+    medians = summary.set_index(['Method', 'Function'])['median']
+    baseline_method = summary['Function'].map(BASELINE_FOR).fillna('baseline')
+    baseline_key = pd.MultiIndex.from_arrays([baseline_method, summary['Function']])
+    summary['baseline_median'] = medians.reindex(baseline_key).values
+    summary['overhead_us'] = summary['median'] - summary['baseline_median']
+    summary['overhead_pct'] = (summary['overhead_us'] / summary['baseline_median'] * 100).where(
+        summary['baseline_median'] > 0, 0.0)
+
+    calls = summary['Function'].map(DEFAULT_CALLS).fillna(1000000)
+    if 'Calls' in df_timing:
+        recorded = df_timing.groupby(['Method', 'Function'])['Calls'].max()
+        recorded = recorded.reindex(pd.MultiIndex.from_frame(summary[['Method', 'Function']])).values
+        calls = calls.where(~(recorded > 0), recorded)
+    summary['calls'] = calls
+    summary['overhead_ns_per_call'] = summary['overhead_us'] * 1000 / summary['calls']
+
+    samples = {key: group.to_numpy() for key, group in df_timing.groupby(['Method', 'Function'])['Time_us']}
+    bounds = []
+    for method, function in zip(summary['Method'], summary['Function']):
+        values = samples[(method, function)]
+        baseline_values = samples.get((BASELINE_FOR.get(function, 'baseline'), function))
+        low, high = median_ci(values)
+        if baseline_values is None:
+            bounds.append((low, high, np.nan, np.nan))
+        else:
+            bounds.append((low, high) + overhead_ci(values, baseline_values))
+    summary[['ci_low', 'ci_high', 'overhead_ci_low', 'overhead_ci_high']] = pd.DataFrame(
+        bounds, index=summary.index, dtype=float)
+    return summary
+
+
+def compute_memory_summary(df_memory):
+    return describe(df_memory.groupby('Method')['Memory_KB'])
+
+
+def compute_counter_summary(df_counters):
+    counters = [c for c in df_counters.columns if c not in ('Method', 'Function', 'Calls')]
+    per_call = df_counters[counters].div(df_counters['Calls'], axis=0).add_suffix('_per_call')
+    per_call['ipc'] = df_counters['instructions'] / df_counters['cycles']
+    per_call[['Method', 'Function']] = df_counters[['Method', 'Function']]
+    grouped = per_call.groupby(['Method', 'Function'])
+    summary = grouped.median()
+    summary.insert(0, 'count', grouped.size())
+    return summary.reset_index()
+
+
+STARTUP_STAGES = ['spawned', 'agent_loaded', 'script_loaded', 'hooks_installed', 'resumed', 'main', 'first_call']
+
+
+def startup_breakdown(df_startup):
+    # Time spent reaching each stage from the previous one recorded for the same
+    # launch, as the median over launches, plus the peak memory seen at any stage
+    df = df_startup.assign(order=df_startup['stage'].map(STARTUP_STAGES.index))
+    df = df.sort_values(['run_id', 'method', 'iteration', 'order'])
+    previous = df.groupby(['run_id', 'method', 'iteration'])['t_ns'].shift(fill_value=0)
+    df['duration_ms'] = (df['t_ns'] - previous) / 1e6
+    durations = df.pivot_table(index='method', columns='stage', values='duration_ms', aggfunc='median')
+    durations = durations[[s for s in STARTUP_STAGES if s in durations.columns]]
+    totals = df[df['stage'] == 'first_call'].groupby('method')['t_ns'].median() / 1e6
+    peaks = df.groupby(['run_id', 'method', 'iteration'])['hwm_kb'].max().groupby('method').median()
+    return durations.assign(total_ms=totals, peak_kb=peaks)
+
+
+def scaling_summary(df):
+    # Aggregate throughput over all threads, and the latency each thread sees
+    df = df.assign(calls_per_sec=df['calls'] / (df['time_ns'] / 1e9),
+                   thread_ns_per_call=df['thread_ns_median'] / (df['calls'] / df['threads']))
+    return df.groupby(['method', 'phase', 'threads'], as_index=False)[['calls_per_sec', 'thread_ns_per_call']].median()
+
+
+def stream_summary(df):
+    # Medians over launches of each streaming mode; dropped is a share of the
+    # events the hook produced
+    df = df.assign(drop_pct=df['dropped'] / df['produced'].clip(lower=1) * 100,
+                   slowdown=df['time_ns'] / df['baseline_ns'])
+    return df.groupby(['mode', 'runtime'], as_index=False, sort=False)[
+        ['events_per_sec', 'drop_pct', 'slowdown']].median()
+
+
+def mser_truncation(values, max_fraction=0.5):
+    # MSER: the number of leading points d whose removal minimises the squared
+    # standard error of the mean of the rest, var(x[d:]) / (n - d), with d
+    # searched over the first max_fraction of the series
+    x = np.asarray(values, dtype=float)
+    n = len(x)
+    if n < 4:
+        return 0
+    tail_n = np.arange(n, 0, -1)
+    tail_sum = np.cumsum(x[::-1])[::-1]
+    tail_sq = np.cumsum((x * x)[::-1])[::-1]
+    variance = tail_sq / tail_n - (tail_sum / tail_n) ** 2
+    limit = int(n * max_fraction) + 1
+    return int(np.argmin(variance[:limit] / tail_n[:limit]))
+
+
+def warmup_summary(df_chunks):
+    # Per run, the chunks MSER truncates are the warm-up: its cost is the time
+    # they took beyond the steady-state rate of the remaining chunks. Medians
+    # over runs, with the steady-state overhead taken against the baseline
+    runs = []
+    for (method, phase, _, _), run in df_chunks.groupby(['method', 'phase', 'run_id', 'iteration'], sort=False):
+        run = run.sort_values('chunk')
+        time_ns = run['time_ns'].to_numpy(dtype=float)
+        calls = run['calls'].to_numpy(dtype=float)
+        d = mser_truncation(time_ns / calls)
+        steady = time_ns[d:].sum() / calls[d:].sum()
+        runs.append({
+            'method': method,
+            'phase': phase,
+            'warmup_chunks': d,
+            'warmup_calls': calls[:d].sum(),
+            'warmup_ns': time_ns[:d].sum() - steady * calls[:d].sum(),
+            'steady_ns_per_call': steady,
+        })
+    if not runs:
+        return pd.DataFrame(columns=['method', 'phase', 'runs', 'warmup_chunks', 'warmup_calls', 'warmup_ns',
+                                     'steady_ns_per_call', 'steady_overhead_ns'])
+    df = pd.DataFrame(runs)
+    summary = df.groupby(['method', 'phase'], as_index=False, sort=False).median()
+    summary.insert(2, 'runs', df.groupby(['method', 'phase'], sort=False).size().to_numpy())
+    steady = summary.set_index(['method', 'phase'])['steady_ns_per_call']
+    summary['steady_overhead_ns'] = [
+        row.steady_ns_per_call - steady.get((BASELINE_FOR.get(row.phase, 'baseline'), row.phase), np.nan)
+        for row in summary.itertuples()]
+    return summary
+
+
+def fit_hook_cost(df_sweep):
+    # Least-squares fit of time_ns = fixed + calls * (callee + hook) per phase and
+    # method, jointly with the baseline runs of the same sweep: each launch type
+    # gets its own fixed cost, each callee setting its own per-call slope shared
+    # by both, and the hooked runs one extra per-call slope, the hook cost
+    z = 1.959963984540054
+    rows = []
+    for phase, by_phase in df_sweep.groupby('phase'):
+        baseline = BASELINE_FOR.get(phase, 'baseline')
+        base = by_phase[by_phase['method'] == baseline]
+        if base.empty:
+            continue
+        for method, hooked in by_phase[by_phase['method'] != baseline].groupby('method'):
+            df = pd.concat([base, hooked])
+            is_hooked = (df['method'] == method).to_numpy(dtype=float)
+            calls = df['calls'].to_numpy(dtype=float)
+            settings = pd.get_dummies(df['setting']).to_numpy(dtype=float)
+            X = np.column_stack([1 - is_hooked, is_hooked, settings * calls[:, None], calls * is_hooked])
+            y = df['time_ns'].to_numpy(dtype=float)
+            coef, _, rank, _ = np.linalg.lstsq(X, y, rcond=None)
+            dof = len(y) - rank
+            sigma2 = ((y - X @ coef) ** 2).sum() / dof if dof > 0 else np.nan
+            se = np.sqrt(sigma2 * np.linalg.pinv(X.T @ X)[-1, -1])
+            rows.append({
+                'method': method,
+                'phase': phase,
+                'runs': int(is_hooked.sum()),
+                'hook_ns': coef[-1],
+                'ci_low_ns': coef[-1] - z * se,
+                'ci_high_ns': coef[-1] + z * se,
+                'fixed_us': coef[1] / 1000,
+                'baseline_fixed_us': coef[0] / 1000,
+            })
+    return pd.DataFrame(rows)
+
+
+def depth_summary(df_depth):
+    # Median time per outer call at each recursion depth, and what the hook
+    # adds per hooked frame over the baseline at the same depth. A flat
+    # per-frame cost means the invocation stack costs the same at any depth.
+    # Methods in OUTER_FRAME_ONLY hook one frame per call whatever the depth
+    df = df_depth.assign(ns_per_call=df_depth['time_ns'] / df_depth['calls'])
+    medians = df.groupby(['method', 'depth'], as_index=False)['ns_per_call'].median()
+    base = medians[medians['method'] == 'baseline'].set_index('depth')['ns_per_call']
+    medians = medians[medians['depth'].isin(base.index)]
+    hook_ns = medians['ns_per_call'] - medians['depth'].map(base)
+    outer_only = medians['method'].isin(OUTER_FRAME_ONLY)
+    hooked_frames = medians['depth'].where(~outer_only, 1)
+    return medians.assign(hooked_frames=hooked_frames, outer_frame_only=outer_only,
+                          hook_ns_per_frame=hook_ns / hooked_frames)
+
+
+def density_summary(df_density):
+    # Medians over launches per method, function count and call pattern. The
+    # baseline loads the same library, so the differences leave only what
+    # hooking all N functions costs at start-up, in memory and per call
+    df = df_density.assign(ns_per_call=df_density['time_ns'] / df_density['calls'])
+    medians = df.groupby(['method', 'functions', 'pattern'], as_index=False, sort=False)[
+        ['ns_per_call', 'startup_ns', 'ready_kb', 'hwm_kb']].median()
+    base = medians[medians['method'] == 'baseline'].set_index(['functions', 'pattern'])
+    key = pd.MultiIndex.from_frame(medians[['functions', 'pattern']])
+    medians = medians.assign(
+        overhead_ns_per_call=medians['ns_per_call'].to_numpy() - base['ns_per_call'].reindex(key).to_numpy(),
+        attach_ms=(medians['startup_ns'].to_numpy() - base['startup_ns'].reindex(key).to_numpy()) / 1e6,
+        extra_kb=medians['ready_kb'].to_numpy() - base['ready_kb'].reindex(key).to_numpy())
+    return medians.sort_values(['method', 'pattern', 'functions'], kind='stable')
+
+
+def cached(name, df, compute):
+    path = os.path.join(CACHE_DIR, f'{name}-v{SUMMARY_VERSION}-{data_hash(df)}.parquet')
+    if os.path.exists(path):
+        return pd.read_parquet(path)
+    summary = compute(df)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = path + '.tmp'
+    summary.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return summary
+
+
+def summarize(df_timing, df_memory):
+    return (cached('timing', df_timing, compute_timing_summary),
+            cached('memory', df_memory, compute_memory_summary))
+
+
+def method_stats(summary, methods, function=None):
+    rows = summary if function is None else summary[summary['Function'] == function]
+    rows = rows.set_index('Method')
+    return [dict(rows.loc[m], method=m) for m in methods if m in rows.index]
@@ -1,3 +1,8 @@
+#define _GNU_SOURCE
+#include <dlfcn.h>
+#include <getopt.h>
+#include <pthread.h>
+#include <sched.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
@@ -5,6 +10,13 @@
 #include <stdint.h>
 #include <inttypes.h>
 #include <sys/resource.h>
+#include <sys/ioctl.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+#include <linux/perf_event.h>
+#if defined(__x86_64__) || defined(__i386__)
+#include <x86intrin.h>
+#endif
 #include "libfuncs.h"
 void validate_interception();
 static int is_intercepted = 0;
@@ -23,10 +35,549 @@ void check_intercept_failure_u64(const char* func_name, uint64_t result, uint32_
     }
 }
 int64_t get_memory_usage() {
+    FILE* status = fopen("/proc/self/status", "r");
+    if (status) {
+        char line[256];
+        int64_t hwm_kb = -1;
+        while (fgets(line, sizeof(line), status)) {
+            if (sscanf(line, "VmHWM: %" SCNd64 " kB", &hwm_kb) == 1) {
+                break;
+            }
+        }
+        fclose(status);
+        if (hwm_kb >= 0) {
+            return hwm_kb;
+        }
+    }
     struct rusage usage;
     getrusage(RUSAGE_SELF, &usage);
     return (int64_t)usage.ru_maxrss;
 }
+#define HIST_SUB_BITS 5
+#define HIST_SUB_COUNT (1U << HIST_SUB_BITS)
+#define HIST_MAX_BITS 48
+#define HIST_BUCKETS (HIST_SUB_COUNT * (HIST_MAX_BITS - HIST_SUB_BITS + 1))
+static struct {
+    uint32_t batch;
+    uint32_t next;
+    uint32_t open;
+    double ns_per_tick;
+    uint64_t last;
+    uint64_t max;
+    uint64_t total;
+    uint64_t timer_ticks;
+    uint64_t counts[HIST_BUCKETS];
+} hist;
+static inline __attribute__((always_inline)) uint64_t read_ticks() {
+#if defined(__x86_64__) || defined(__i386__)
+    _mm_lfence();
+    uint64_t t = __rdtsc();
+    _mm_lfence();
+    return t;
+#else
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC_RAW, &ts);
+    return (uint64_t)ts.tv_sec * 1000000000ULL + (uint64_t)ts.tv_nsec;
+#endif
+}
+static uint32_t hist_bucket(uint64_t value) {
+    if (value < HIST_SUB_COUNT) {
+        return (uint32_t)value;
+    }
+    uint32_t msb = 63U - (uint32_t)__builtin_clzll(value);
+    if (msb >= HIST_MAX_BITS) {
+        return HIST_BUCKETS - 1U;
+    }
+    uint32_t shift = msb - HIST_SUB_BITS;
+    uint32_t sub = (uint32_t)(value >> shift) - HIST_SUB_COUNT;
+    return HIST_SUB_COUNT + shift * HIST_SUB_COUNT + sub;
+}
+static uint64_t hist_bucket_floor(uint32_t idx) {
+    if (idx < HIST_SUB_COUNT) {
+        return idx;
+    }
+    uint32_t shift = (idx - HIST_SUB_COUNT) / HIST_SUB_COUNT;
+    uint64_t sub = (idx - HIST_SUB_COUNT) % HIST_SUB_COUNT;
+    return (HIST_SUB_COUNT + sub) << shift;
+}
+void init_histogram() {
+    const char* batch = getenv("BENCH_HISTOGRAM");
+    if (!batch || atoi(batch) <= 0) {
+        return;
+    }
+    hist.batch = (uint32_t)atoi(batch);
+#if defined(__x86_64__) || defined(__i386__)
+    struct timespec start, now;
+    clock_gettime(CLOCK_MONOTONIC_RAW, &start);
+    uint64_t t0 = read_ticks();
+    do {
+        clock_gettime(CLOCK_MONOTONIC_RAW, &now);
+    } while ((now.tv_sec - start.tv_sec) * 1000000000LL + (now.tv_nsec - start.tv_nsec) < 50000000LL);
+    uint64_t t1 = read_ticks();
+    hist.ns_per_tick = (double)((now.tv_sec - start.tv_sec) * 1000000000LL + (now.tv_nsec - start.tv_nsec)) / (double)(t1 - t0);
+#else
+    hist.ns_per_tick = 1.0;
+#endif
+    hist.timer_ticks = UINT64_MAX;
+    for (int i = 0; i < 1000; i++) {
+        uint64_t a = read_ticks();
+        uint64_t b = read_ticks();
+        if (b - a < hist.timer_ticks) {
+            hist.timer_ticks = b - a;
+        }
+    }
+}
+// The samplers are forced inline, so a sampled loop pays the boundary
+// compare and the clock reads, not two calls per iteration
+static inline __attribute__((always_inline)) void hist_record(uint64_t now, uint32_t calls) {
+    uint64_t per_call = (now - hist.last) / calls;
+    hist.counts[hist_bucket(per_call)]++;
+    hist.total++;
+    if (per_call > hist.max) {
+        hist.max = per_call;
+    }
+}
+void hist_begin() {
+    hist.next = hist.batch ? 0 : UINT32_MAX;
+}
+static inline __attribute__((always_inline)) void hist_sample(uint32_t i) {
+    // Like chunk_sample, the loop compares against the next boundary rather than dividing
+    if (i != hist.next) {
+        return;
+    }
+    uint64_t now = read_ticks();
+    if (i != 0) {
+        hist_record(now, hist.batch);
+    }
+    hist.last = now;
+    hist.open = i;
+    hist.next += hist.batch;
+}
+void hist_close(uint32_t iterations) {
+    // The batch still open when the loop ends has no boundary after it, so it
+    // is recorded here, over the calls it actually ran
+    if (hist.batch == 0 || iterations == 0) {
+        return;
+    }
+    hist_record(read_ticks(), iterations - hist.open);
+}
+void hist_reset() {
+    memset(hist.counts, 0, sizeof(hist.counts));
+    hist.max = 0;
+    hist.total = 0;
+}
+double hist_percentile_ns(double q) {
+    uint64_t target = (uint64_t)(q * (double)hist.total);
+    uint64_t seen = 0;
+    for (uint32_t idx = 0; idx < HIST_BUCKETS; idx++) {
+        seen += hist.counts[idx];
+        if (seen > target) {
+            return (double)hist_bucket_floor(idx) * hist.ns_per_tick;
+        }
+    }
+    return (double)hist.max * hist.ns_per_tick;
+}
+void write_histogram(FILE* out) {
+    fprintf(out, ",\"hist_batch\":%u,\"hist_timer_ns\":%.3f,\"hist_max_ns\":%.3f,\"hist_ns\":[",
+            hist.batch, (double)hist.timer_ticks * hist.ns_per_tick, (double)hist.max * hist.ns_per_tick);
+    int first = 1;
+    for (uint32_t idx = 0; idx < HIST_BUCKETS; idx++) {
+        if (hist.counts[idx] == 0) {
+            continue;
+        }
+        fprintf(out, "%s[%.3f,%" PRIu64 "]", first ? "" : ",",
+                (double)hist_bucket_floor(idx) * hist.ns_per_tick, hist.counts[idx]);
+        first = 0;
+    }
+    fprintf(out, "]");
+}
+#define MAX_CHUNKS 10000
+// BENCH_CHUNKS=<k> splits every phase into k equal runs of calls and stamps
+// the start of each into a preallocated array, so warm-up (JIT tier-up,
+// trampolines, allocator growth) can be separated from the steady state.
+// The loops compare against the next boundary rather than dividing
+static struct {
+    uint32_t count;
+    uint32_t size;
+    uint32_t next;
+    uint32_t taken;
+    int64_t start_ns[MAX_CHUNKS];
+} chunks;
+void init_chunks() {
+    const char* count = getenv("BENCH_CHUNKS");
+    if (!count || atoi(count) <= 0) {
+        return;
+    }
+    chunks.count = (uint32_t)atoi(count);
+    if (chunks.count > MAX_CHUNKS) {
+        chunks.count = MAX_CHUNKS;
+    }
+}
+void chunk_begin(uint32_t iterations) {
+    chunks.size = iterations / chunks.count;
+    if (chunks.size == 0) {
+        chunks.size = 1;
+    }
+    chunks.next = 0;
+    chunks.taken = 0;
+}
+static inline __attribute__((always_inline)) void chunk_sample(uint32_t i) {
+    if (chunks.count == 0 || i != chunks.next) {
+        return;
+    }
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    chunks.start_ns[chunks.taken++] = (int64_t)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+    // The last chunk also takes the remainder of the division
+    chunks.next = chunks.taken < chunks.count ? chunks.next + chunks.size : UINT32_MAX;
+}
+void write_chunks(FILE* out, uint32_t iterations, const struct timespec* end) {
+    int64_t end_ns = (int64_t)end->tv_sec * 1000000000LL + end->tv_nsec;
+    fprintf(out, ",\"chunk_calls\":[");
+    for (uint32_t c = 0; c < chunks.taken; c++) {
+        fprintf(out, "%s%u", c ? "," : "", c + 1 < chunks.taken ? chunks.size : iterations - c * chunks.size);
+    }
+    fprintf(out, "],\"chunk_ns\":[");
+    for (uint32_t c = 0; c < chunks.taken; c++) {
+        int64_t stop = c + 1 < chunks.taken ? chunks.start_ns[c + 1] : end_ns;
+        fprintf(out, "%s%" PRId64, c ? "," : "", stop - chunks.start_ns[c]);
+    }
+    fprintf(out, "]");
+}
+#define MAX_THREADS 256
+static struct {
+    uint32_t count;
+    int cpus[MAX_THREADS];
+    pthread_barrier_t barrier;
+    struct timespec start[MAX_THREADS];
+    struct timespec end[MAX_THREADS];
+} threads;
+#define PERF_CACHE(cache) (PERF_COUNT_HW_CACHE_##cache | (PERF_COUNT_HW_CACHE_OP_READ << 8) | \
+                          (PERF_COUNT_HW_CACHE_RESULT_MISS << 16))
+static struct {
+    const char* name;
+    uint32_t type;
+    uint64_t config;
+    int fd;
+    int64_t value;
+} perf_counters[] = {
+    {"cycles", PERF_TYPE_HARDWARE, PERF_COUNT_HW_CPU_CYCLES, -1, -1},
+    {"instructions", PERF_TYPE_HARDWARE, PERF_COUNT_HW_INSTRUCTIONS, -1, -1},
+    {"branch_misses", PERF_TYPE_HARDWARE, PERF_COUNT_HW_BRANCH_MISSES, -1, -1},
+    {"l1i_misses", PERF_TYPE_HW_CACHE, PERF_CACHE(L1I), -1, -1},
+    {"l1d_misses", PERF_TYPE_HW_CACHE, PERF_CACHE(L1D), -1, -1},
+    {"llc_misses", PERF_TYPE_HW_CACHE, PERF_CACHE(LL), -1, -1},
+    {"itlb_misses", PERF_TYPE_HW_CACHE, PERF_CACHE(ITLB), -1, -1},
+    {"context_switches", PERF_TYPE_SOFTWARE, PERF_COUNT_SW_CONTEXT_SWITCHES, -1, -1},
+};
+#define PERF_COUNTERS (sizeof(perf_counters) / sizeof(perf_counters[0]))
+static int perf_enabled = 0;
+void init_perf_counters() {
+    const char* perf = getenv("BENCH_PERF");
+    if (!perf || strcmp(perf, "1") != 0) {
+        return;
+    }
+    for (size_t i = 0; i < PERF_COUNTERS; i++) {
+        struct perf_event_attr attr;
+        memset(&attr, 0, sizeof(attr));
+        attr.size = sizeof(attr);
+        attr.type = perf_counters[i].type;
+        attr.config = perf_counters[i].config;
+        attr.disabled = 1;
+        attr.exclude_hv = 1;
+        // In threaded mode the counters follow the phase threads created later
+        attr.inherit = threads.count > 0;
+        attr.read_format = PERF_FORMAT_TOTAL_TIME_ENABLED | PERF_FORMAT_TOTAL_TIME_RUNNING;
+        // Only the main thread is counted, so Frida's agent threads are left out;
+        // kernel counting needs perf_event_paranoid < 2, so fall back to user only
+        perf_counters[i].fd = (int)syscall(SYS_perf_event_open, &attr, 0, -1, -1, 0);
+        if (perf_counters[i].fd < 0 && attr.type != PERF_TYPE_SOFTWARE) {
+            attr.exclude_kernel = 1;
+            perf_counters[i].fd = (int)syscall(SYS_perf_event_open, &attr, 0, -1, -1, 0);
+        }
+        if (perf_counters[i].fd < 0) {
+            fprintf(stderr, "WARNING: perf counter %s unavailable\n", perf_counters[i].name);
+            continue;
+        }
+        perf_enabled = 1;
+    }
+}
+void perf_start() {
+    for (size_t i = 0; i < PERF_COUNTERS && perf_enabled; i++) {
+        if (perf_counters[i].fd >= 0) {
+            ioctl(perf_counters[i].fd, PERF_EVENT_IOC_RESET, 0);
+            ioctl(perf_counters[i].fd, PERF_EVENT_IOC_ENABLE, 0);
+        }
+    }
+}
+void perf_stop() {
+    for (size_t i = 0; i < PERF_COUNTERS && perf_enabled; i++) {
+        perf_counters[i].value = -1;
+        if (perf_counters[i].fd < 0) {
+            continue;
+        }
+        ioctl(perf_counters[i].fd, PERF_EVENT_IOC_DISABLE, 0);
+        uint64_t data[3];
+        if (read(perf_counters[i].fd, data, sizeof(data)) != (ssize_t)sizeof(data) || data[2] == 0) {
+            continue;
+        }
+        // Scale up when the PMU multiplexed this event with the others
+        perf_counters[i].value = (int64_t)((double)data[0] * (double)data[1] / (double)data[2]);
+    }
+}
+void write_perf_counters(FILE* out) {
+    for (size_t i = 0; i < PERF_COUNTERS; i++) {
+        if (perf_counters[i].value >= 0) {
+            fprintf(out, ",\"%s\":%" PRId64, perf_counters[i].name, perf_counters[i].value);
+        }
+    }
+}
+static FILE* records_file = NULL;
+// Called with every finished record line. It does nothing itself and is
+// exported so an injected agent can forward records to its host
+__attribute__((noinline)) void bench_record_hook(const char* line) {
+    __asm__ volatile("" : : "r"(line) : "memory");
+}
+void emit_record(const char* line) {
+    fputs(line, records_file);
+    fflush(records_file);
+    bench_record_hook(line);
+}
+void open_records() {
+    const char* path = getenv("BENCH_RECORDS");
+    if (path && path[0] != '\0') {
+        records_file = fopen(path, "a");
+        if (!records_file) {
+            fprintf(stderr, "ERROR: cannot open BENCH_RECORDS file %s\n", path);
+            exit(1);
+        }
+    }
+}
+int64_t elapsed_ns(const struct timespec* start, const struct timespec* end) {
+    return (int64_t)(end->tv_sec - start->tv_sec) * 1000000000LL + (end->tv_nsec - start->tv_nsec);
+}
+void write_thread_times(FILE* out) {
+    fprintf(out, ",\"threads\":%u,\"thread_ns\":[", threads.count);
+    for (uint32_t t = 0; t < threads.count; t++) {
+        fprintf(out, "%s%" PRId64, t ? "," : "", elapsed_ns(&threads.start[t], &threads.end[t]));
+    }
+    fprintf(out, "]");
+}
+void report_phase(const char* label, const char* phase, uint32_t iterations,
+                  const struct timespec* start, const struct timespec* end) {
+    perf_stop();
+    int64_t ns = elapsed_ns(start, end);
+    printf("%s: %" PRId64 " us\n", label, ns / 1000);
+    if (hist.batch) {
+        printf("%s latency: p50 %.1f ns, p99 %.1f ns, p99.9 %.1f ns, max %.1f ns\n", label,
+               hist_percentile_ns(0.5), hist_percentile_ns(0.99), hist_percentile_ns(0.999),
+               (double)hist.max * hist.ns_per_tick);
+    }
+    if (records_file) {
+        char* line = NULL;
+        size_t len = 0;
+        FILE* out = open_memstream(&line, &len);
+        fprintf(out,
+                "{\"phase\":\"%s\",\"iterations\":%u,\"elapsed_ns\":%" PRId64 ",\"max_rss_kb\":%" PRId64 ",\"validation\":\"%s\"",
+                phase, iterations, ns, get_memory_usage(), is_intercepted ? "intercepted" : "unchecked");
+        if (hist.batch) {
+            write_histogram(out);
+        }
+        if (chunks.count) {
+            write_chunks(out, iterations, end);
+        }
+        if (perf_enabled) {
+            write_perf_counters(out);
+        }
+        if (threads.count) {
+            write_thread_times(out);
+        }
+        fprintf(out, "}\n");
+        fclose(out);
+        emit_record(line);
+        free(line);
+    }
+    hist_reset();
+}
+int64_t monotonic_ns() {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (int64_t)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+}
+int run_startup_probe() {
+    int64_t main_ns = monotonic_ns();
+    volatile int32_t first = compute_sum(1, 2);
+    int64_t first_call_ns = monotonic_ns();
+    int64_t first_call_kb = get_memory_usage();
+    open_records();
+    if (!records_file) {
+        fprintf(stderr, "ERROR: BENCH_STARTUP requires BENCH_RECORDS\n");
+        return 1;
+    }
+    // Built in memory and passed through emit_record like the phase records,
+    // so persistent Frida sessions receive it through bench_record_hook
+    char* line = NULL;
+    size_t len = 0;
+    FILE* out = open_memstream(&line, &len);
+    fprintf(out,
+            "{\"phase\":\"startup\",\"main_ns\":%" PRId64 ",\"first_call_ns\":%" PRId64 ",\"first_call_kb\":%" PRId64
+            ",\"intercepted\":%s",
+            main_ns, first_call_ns, first_call_kb, first == 0x42 ? "true" : "false");
+    // Stamped by the LD_PRELOAD constructor in hook.c, absent for other methods
+    const int64_t* hook_ns = dlsym(RTLD_DEFAULT, "hook_startup_ns");
+    if (hook_ns) {
+        fprintf(out, ",\"hook_init_start_ns\":%" PRId64 ",\"hook_init_end_ns\":%" PRId64,
+                hook_ns[0], hook_ns[1]);
+    }
+    fprintf(out, "}\n");
+    fclose(out);
+    emit_record(line);
+    free(line);
+    fclose(records_file);
+    return 0;
+}
+// BENCH_MEMORY=<ms>: sample smaps_rollup and the smaps mappings of interest
+// at start-up, after every phase and, if ms > 0, every ms milliseconds from a
+// timer thread. Samples are kept in memory and written once at exit
+#define MEM_MAX_SAMPLES 4096
+struct mem_sample {
+    int64_t t_ns;
+    const char* label;
+    int64_t rss_kb;
+    int64_t pss_kb;
+    int64_t anon_kb;
+    int64_t file_kb;
+    int64_t rwx_kb;
+    int64_t anon_exec_kb;
+    int64_t agent_kb;
+};
+static struct {
+    int enabled;
+    uint32_t interval_ms;
+    int64_t origin_ns;
+    pthread_t timer;
+    pthread_mutex_t lock;
+    volatile int stop;
+    uint32_t count;
+    struct mem_sample samples[MEM_MAX_SAMPLES];
+} mem = {.lock = PTHREAD_MUTEX_INITIALIZER};
+static void read_rollup(struct mem_sample* sample) {
+    FILE* rollup = fopen("/proc/self/smaps_rollup", "r");
+    if (!rollup) {
+        return;
+    }
+    char line[256];
+    int64_t kb;
+    while (fgets(line, sizeof(line), rollup)) {
+        if (sscanf(line, "Rss: %" SCNd64 " kB", &kb) == 1) {
+            sample->rss_kb = kb;
+        } else if (sscanf(line, "Pss: %" SCNd64 " kB", &kb) == 1) {
+            sample->pss_kb = kb;
+        } else if (sscanf(line, "Anonymous: %" SCNd64 " kB", &kb) == 1) {
+            sample->anon_kb = kb;
+        }
+    }
+    fclose(rollup);
+    sample->file_kb = sample->rss_kb - sample->anon_kb;
+}
+static void read_mappings(struct mem_sample* sample) {
+    // JIT code shows up as rwx or anonymous executable mappings; the Frida
+    // agent is mapped from a file (or memfd) named frida-agent-*.so
+    FILE* smaps = fopen("/proc/self/smaps", "r");
+    if (!smaps) {
+        return;
+    }
+    char line[512];
+    int rwx = 0, anon_exec = 0, agent = 0;
+    while (fgets(line, sizeof(line), smaps)) {
+        unsigned long lo, hi;
+        char perms[8];
+        int path_at = 0;
+        int64_t kb;
+        if (sscanf(line, "%lx-%lx %7s %*s %*s %*s %n", &lo, &hi, perms, &path_at) == 3) {
+            const char* path = line + path_at;
+            int named = path_at > 0 && *path != '\n' && *path != '\0';
+            rwx = strcmp(perms, "rwxp") == 0 || strcmp(perms, "rwxs") == 0;
+            anon_exec = perms[2] == 'x' && !rwx && !named;
+            agent = named && strstr(path, "frida-agent") != NULL;
+        } else if (sscanf(line, "Rss: %" SCNd64 " kB", &kb) == 1) {
+            if (rwx) {
+                sample->rwx_kb += kb;
+            }
+            if (anon_exec) {
+                sample->anon_exec_kb += kb;
+            }
+            if (agent) {
+                sample->agent_kb += kb;
+            }
+        }
+    }
+    fclose(smaps);
+}
+void memory_sample(const char* label) {
+    if (!mem.enabled) {
+        return;
+    }
+    struct mem_sample sample = {.t_ns = monotonic_ns() - mem.origin_ns, .label = label};
+    read_rollup(&sample);
+    read_mappings(&sample);
+    pthread_mutex_lock(&mem.lock);
+    if (mem.count < MEM_MAX_SAMPLES) {
+        mem.samples[mem.count++] = sample;
+    }
+    pthread_mutex_unlock(&mem.lock);
+}
+void* memory_timer(void* arg) {
+    struct timespec next;
+    clock_gettime(CLOCK_MONOTONIC, &next);
+    while (!mem.stop) {
+        next.tv_nsec += (long)mem.interval_ms * 1000000L;
+        next.tv_sec += next.tv_nsec / 1000000000L;
+        next.tv_nsec %= 1000000000L;
+        clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME, &next, NULL);
+        if (!mem.stop) {
+            memory_sample("timer");
+        }
+    }
+    return NULL;
+}
+void init_memory_sampling() {
+    const char* interval = getenv("BENCH_MEMORY");
+    if (!interval || atoi(interval) < 0) {
+        return;
+    }
+    mem.enabled = 1;
+    mem.interval_ms = (uint32_t)atoi(interval);
+    mem.origin_ns = monotonic_ns();
+    memory_sample("start");
+    if (mem.interval_ms > 0 && pthread_create(&mem.timer, NULL, memory_timer, NULL) != 0) {
+        fprintf(stderr, "ERROR: cannot create memory sampling thread\n");
+        exit(1);
+    }
+}
+void finish_memory_sampling() {
+    if (!mem.enabled) {
+        return;
+    }
+    if (mem.interval_ms > 0) {
+        mem.stop = 1;
+        pthread_join(mem.timer, NULL);
+    }
+    if (!records_file) {
+        return;
+    }
+    char line[512];
+    for (uint32_t i = 0; i < mem.count; i++) {
+        const struct mem_sample* m = &mem.samples[i];
+        snprintf(line, sizeof(line),
+                 "{\"phase\":\"memory\",\"label\":\"%s\",\"t_ns\":%" PRId64 ",\"rss_kb\":%" PRId64
+                 ",\"pss_kb\":%" PRId64 ",\"anon_kb\":%" PRId64 ",\"file_kb\":%" PRId64 ",\"rwx_kb\":%" PRId64
+                 ",\"anon_exec_kb\":%" PRId64 ",\"agent_kb\":%" PRId64 "}\n",
+                 m->label, m->t_ns, m->rss_kb, m->pss_kb, m->anon_kb, m->file_kb, m->rwx_kb, m->anon_exec_kb,
+                 m->agent_kb);
+        emit_record(line);
+    }
+}
 void validate_interception() {
     const char* intercept_status = test_intercept();  
     printf("Test intercept: %s\n", intercept_status);
@@ -37,6 +588,7 @@ void validate_interception() {
     int32_t test_compute = compute_sum(5, 5);
     int32_t test_heavy = compute_sum_heavy(3, 4);
     uint64_t test_fact = factorial(5);
+    uint64_t test_recursive = recursive_sum(5);
     int32_t test_result;
     int32_t test_array[5] = {1, 2, 3, 4, 5};
     process_array(test_array, 5, &test_result);
@@ -53,6 +605,11 @@ void validate_interception() {
         fprintf(stderr, "ERROR: factorial not overriding return value! Got %" PRIu64 ", expected 0x42\n", test_fact);
         exit(1);
     }
+    if (test_recursive != 0x42) {
+        fprintf(stderr, "ERROR: recursive_sum not overriding return value! Got %" PRIu64 ", expected 0x42\n",
+                test_recursive);
+        exit(1);
+    }
     if (test_alloc != 0x42) {
         fprintf(stderr, "ERROR: allocate_and_free not overriding return value! Got %d, expected 0x42\n", test_alloc);
         exit(1);
@@ -60,79 +617,311 @@ void validate_interception() {
     printf("All return value overrides working (all functions return 0x42)\n");
     is_intercepted = 1;
 }
-int main() {
-    const uint32_t HOT_ITERATIONS = 1000000U; 
-    struct timespec start, end;
-    printf("Starting benchmark...\n");
-    validate_interception();
-    clock_gettime(CLOCK_MONOTONIC, &start);
+// Each phase loop is compiled twice through an always-inlined body: with the
+// BENCH_HISTOGRAM/BENCH_CHUNKS sampling, and without it for default runs,
+// whose timed loops then match the ones without any sampling support
+#define PHASE_RUNNER(name) \
+    void run_##name(uint32_t iterations) { \
+        if (hist.batch || chunks.count) { \
+            hist_begin(); \
+            name##_loop(iterations, 1); \
+            hist_close(iterations); \
+        } else { \
+            name##_loop(iterations, 0); \
+        } \
+    }
+static inline __attribute__((always_inline)) void hot_path_loop(uint32_t iterations, const int sampled) {
     volatile int32_t sum = 0;
-    for (uint32_t i = 0; i < HOT_ITERATIONS; i++) {
+    for (uint32_t i = 0; i < iterations; i++) {
+        if (sampled) {
+            hist_sample(i);
+            chunk_sample(i);
+        }
         sum = compute_sum((int32_t)i, (int32_t)i + 1);
         if (i % 100000U == 0) {
             check_intercept_failure("compute_sum", sum, i);
         }
     }
-    check_intercept_failure("compute_sum", sum, HOT_ITERATIONS);
-    clock_gettime(CLOCK_MONOTONIC, &end);
-    int64_t us = (end.tv_sec - start.tv_sec) * 1000000LL + (end.tv_nsec - start.tv_nsec) / 1000LL;
-    printf("Hot path: %" PRId64 " us\n", us);
-    clock_gettime(CLOCK_MONOTONIC, &start);
-    for (uint32_t i = 0; i < HOT_ITERATIONS; i++) {
+    check_intercept_failure("compute_sum", sum, iterations);
+}
+PHASE_RUNNER(hot_path)
+static inline __attribute__((always_inline)) void heavy_work_loop(uint32_t iterations, const int sampled) {
+    volatile int32_t sum = 0;
+    for (uint32_t i = 0; i < iterations; i++) {
+        if (sampled) {
+            hist_sample(i);
+            chunk_sample(i);
+        }
         sum = compute_sum_heavy((int32_t)i, (int32_t)i + 1);
         if (i % 100000U == 0) {
             check_intercept_failure("compute_sum_heavy", sum, i);
         }
     }
-    check_intercept_failure("compute_sum_heavy", sum, HOT_ITERATIONS);
-    clock_gettime(CLOCK_MONOTONIC, &end);
-    us = (end.tv_sec - start.tv_sec) * 1000000LL + (end.tv_nsec - start.tv_nsec) / 1000LL;
-    printf("Heavy work: %" PRId64 " us\n", us);
-    clock_gettime(CLOCK_MONOTONIC, &start);
-    for (uint32_t i = 0; i < HOT_ITERATIONS; i++) {
+    check_intercept_failure("compute_sum_heavy", sum, iterations);
+}
+PHASE_RUNNER(heavy_work)
+static struct {
+    uint32_t iterations;
+    size_t array_len;
+    size_t alloc_size;
+    int work_factor;
+    int depth;
+    const char* phases;
+} params = {1000000U, 1000, 1024, 100, 20, NULL};
+static inline __attribute__((always_inline)) void recursive_loop(uint32_t iterations, const int sampled) {
+    for (uint32_t i = 0; i < iterations; i++) {
+        if (sampled) {
+            hist_sample(i);
+            chunk_sample(i);
+        }
         volatile uint64_t f = factorial(20);
         if (i % 100000U == 0) {
             check_intercept_failure_u64("factorial", f, i);
         }
         (void)f;
     }
-    clock_gettime(CLOCK_MONOTONIC, &end);
-    us = (end.tv_sec - start.tv_sec) * 1000000LL + (end.tv_nsec - start.tv_nsec) / 1000LL;
-    printf("Recursive: %" PRId64 " us\n", us);
-    int32_t arr[1000];
+}
+PHASE_RUNNER(recursive)
+static inline __attribute__((always_inline)) void recursive_depth_loop(uint32_t iterations, const int sampled) {
+    for (uint32_t i = 0; i < iterations; i++) {
+        if (sampled) {
+            hist_sample(i);
+            chunk_sample(i);
+        }
+        volatile uint64_t f = recursive_sum(params.depth);
+        if (i % 100000U == 0) {
+            check_intercept_failure_u64("recursive_sum", f, i);
+        }
+        (void)f;
+    }
+}
+PHASE_RUNNER(recursive_depth)
+static inline __attribute__((always_inline)) void array_ops_loop(uint32_t iterations, const int sampled) {
+    int32_t* arr = calloc(params.array_len, sizeof(int32_t));
     int32_t result;
-    clock_gettime(CLOCK_MONOTONIC, &start);
-    for (uint32_t i = 0; i < HOT_ITERATIONS / 10U; i++) {
-        int32_t array_result = process_array(arr, 1000, &result);
+    if (!arr) {
+        fprintf(stderr, "ERROR: cannot allocate %zu-element array\n", params.array_len);
+        exit(1);
+    }
+    for (uint32_t i = 0; i < iterations; i++) {
+        if (sampled) {
+            hist_sample(i);
+            chunk_sample(i);
+        }
+        int32_t array_result = process_array(arr, params.array_len, &result);
         if (i % 10000U == 0) {
             check_intercept_failure("process_array", array_result, i);
         }
     }
-    clock_gettime(CLOCK_MONOTONIC, &end);
-    us = (end.tv_sec - start.tv_sec) * 1000000LL + (end.tv_nsec - start.tv_nsec) / 1000LL;
-    printf("Array ops: %" PRId64 " us\n", us);
-    clock_gettime(CLOCK_MONOTONIC, &start);
-    for (uint32_t i = 0; i < HOT_ITERATIONS; i++) {
-        int32_t alloc_result = allocate_and_free(1024);
+    free(arr);
+}
+PHASE_RUNNER(array_ops)
+static inline __attribute__((always_inline)) void memory_ops_loop(uint32_t iterations, const int sampled) {
+    for (uint32_t i = 0; i < iterations; i++) {
+        if (sampled) {
+            hist_sample(i);
+            chunk_sample(i);
+        }
+        int32_t alloc_result = allocate_and_free(params.alloc_size);
         if (i % 100000U == 0) {
             check_intercept_failure("allocate_and_free", alloc_result, i);
         }
     }
-    clock_gettime(CLOCK_MONOTONIC, &end);
-    us = (end.tv_sec - start.tv_sec) * 1000000LL + (end.tv_nsec - start.tv_nsec) / 1000LL;
-    printf("Memory ops: %" PRId64 " us\n", us);
-    clock_gettime(CLOCK_MONOTONIC, &start);
-    for (uint32_t i = 0; i < HOT_ITERATIONS; i++) {
+}
+PHASE_RUNNER(memory_ops)
+static inline __attribute__((always_inline)) void complex_ops_loop(uint32_t iterations, const int sampled) {
+    for (uint32_t i = 0; i < iterations; i++) {
+        if (sampled) {
+            hist_sample(i);
+            chunk_sample(i);
+        }
         int32_t complex_result = compute_sum_complex((int32_t)(i % 100), (int32_t)((i + 1) % 100));
         if (i % 100000U == 0) {
             check_intercept_failure("compute_sum_complex", complex_result, i);
         }
     }
-    clock_gettime(CLOCK_MONOTONIC, &end);
-    us = (end.tv_sec - start.tv_sec) * 1000000LL + (end.tv_nsec - start.tv_nsec) / 1000LL;
-    printf("Complex ops: %" PRId64 " us\n", us);
+}
+PHASE_RUNNER(complex_ops)
+static const struct {
+    const char* label;
+    const char* phase;
+    void (*run)(uint32_t iterations);
+    uint32_t divisor;
+    // Phases that only run when --phases names them
+    int opt_in;
+} phases[] = {
+    {"Hot path", "hot_path", run_hot_path, 1, 0},
+    {"Heavy work", "heavy_work", run_heavy_work, 1, 0},
+    {"Recursive", "recursive", run_recursive, 1, 0},
+    {"Array ops", "array_ops", run_array_ops, 10, 0},
+    {"Memory ops", "memory_ops", run_memory_ops, 1, 0},
+    {"Complex ops", "complex_ops", run_complex_ops, 1, 0},
+    {"Recursive depth", "recursive_depth", run_recursive_depth, 1, 1},
+};
+#define PHASE_COUNT (sizeof(phases) / sizeof(phases[0]))
+uint32_t phase_iterations(uint32_t phase) {
+    uint32_t iterations = params.iterations / phases[phase].divisor;
+    return iterations ? iterations : 1U;
+}
+int phase_selected(uint32_t phase) {
+    if (!params.phases) {
+        return !phases[phase].opt_in;
+    }
+    size_t len = strlen(phases[phase].phase);
+    for (const char* p = params.phases; (p = strstr(p, phases[phase].phase)) != NULL; p += len) {
+        if ((p == params.phases || p[-1] == ',') && (p[len] == ',' || p[len] == '\0')) {
+            return 1;
+        }
+    }
+    return 0;
+}
+void usage(const char* argv0) {
+    fprintf(stderr,
+            "usage: %s [--iterations N] [--array-len N] [--alloc-size BYTES] [--work-factor N] [--depth N]\n"
+            "          [--phases LIST]\n",
+            argv0);
+    exit(2);
+}
+void parse_args(int argc, char** argv) {
+    static const struct option options[] = {
+        {"iterations", required_argument, NULL, 'n'},
+        {"array-len", required_argument, NULL, 'a'},
+        {"alloc-size", required_argument, NULL, 's'},
+        {"work-factor", required_argument, NULL, 'w'},
+        {"depth", required_argument, NULL, 'd'},
+        {"phases", required_argument, NULL, 'p'},
+        {NULL, 0, NULL, 0},
+    };
+    int opt;
+    while ((opt = getopt_long(argc, argv, "n:a:s:w:d:p:", options, NULL)) != -1) {
+        if (opt == '?') {
+            usage(argv[0]);
+        }
+        long value = opt == 'p' ? 1 : atol(optarg);
+        if (value <= 0) {
+            usage(argv[0]);
+        }
+        switch (opt) {
+        case 'n': params.iterations = (uint32_t)value; break;
+        case 'a': params.array_len = (size_t)value; break;
+        case 's': params.alloc_size = (size_t)value; break;
+        case 'w': params.work_factor = (int)value; break;
+        case 'd': params.depth = (int)value; break;
+        case 'p': params.phases = optarg; break;
+        default: usage(argv[0]);
+        }
+    }
+    set_heavy_work_factor(params.work_factor);
+}
+void init_threads() {
+    const char* count = getenv("BENCH_THREADS");
+    if (!count || atoi(count) <= 0) {
+        return;
+    }
+    if (hist.batch || chunks.count) {
+        fprintf(stderr, "ERROR: BENCH_HISTOGRAM and BENCH_CHUNKS cannot be combined with BENCH_THREADS\n");
+        exit(1);
+    }
+    threads.count = (uint32_t)atoi(count);
+    if (threads.count > MAX_THREADS) {
+        threads.count = MAX_THREADS;
+    }
+    // Thread i is pinned to the i-th CPU this process may run on, wrapping around
+    cpu_set_t allowed;
+    sched_getaffinity(0, sizeof(allowed), &allowed);
+    int available[CPU_SETSIZE];
+    int n = 0;
+    for (int cpu = 0; cpu < CPU_SETSIZE; cpu++) {
+        if (CPU_ISSET(cpu, &allowed)) {
+            available[n++] = cpu;
+        }
+    }
+    for (uint32_t t = 0; t < threads.count; t++) {
+        threads.cpus[t] = available[t % (uint32_t)n];
+    }
+}
+struct worker_args {
+    uint32_t index;
+    uint32_t phase;
+};
+void* phase_worker(void* arg) {
+    const struct worker_args* args = arg;
+    cpu_set_t cpus;
+    CPU_ZERO(&cpus);
+    CPU_SET(threads.cpus[args->index], &cpus);
+    pthread_setaffinity_np(pthread_self(), sizeof(cpus), &cpus);
+    pthread_barrier_wait(&threads.barrier);
+    clock_gettime(CLOCK_MONOTONIC, &threads.start[args->index]);
+    phases[args->phase].run(phase_iterations(args->phase));
+    clock_gettime(CLOCK_MONOTONIC, &threads.end[args->index]);
+    return NULL;
+}
+void run_threaded_phase(uint32_t phase, struct timespec* start, struct timespec* end) {
+    // Every thread runs the full phase after a common barrier; the wall time
+    // runs from the first thread to start to the last one to finish
+    pthread_t ids[MAX_THREADS];
+    struct worker_args args[MAX_THREADS];
+    pthread_barrier_init(&threads.barrier, NULL, threads.count + 1);
+    for (uint32_t t = 0; t < threads.count; t++) {
+        args[t].index = t;
+        args[t].phase = phase;
+        if (pthread_create(&ids[t], NULL, phase_worker, &args[t]) != 0) {
+            fprintf(stderr, "ERROR: cannot create thread %u\n", t);
+            exit(1);
+        }
+    }
+    pthread_barrier_wait(&threads.barrier);
+    for (uint32_t t = 0; t < threads.count; t++) {
+        pthread_join(ids[t], NULL);
+    }
+    pthread_barrier_destroy(&threads.barrier);
+    *start = threads.start[0];
+    *end = threads.end[0];
+    for (uint32_t t = 1; t < threads.count; t++) {
+        if (elapsed_ns(&threads.start[t], start) > 0) {
+            *start = threads.start[t];
+        }
+        if (elapsed_ns(end, &threads.end[t]) > 0) {
+            *end = threads.end[t];
+        }
+    }
+}
+int main(int argc, char** argv) {
+    struct timespec start, end;
+    parse_args(argc, argv);
+    const char* startup = getenv("BENCH_STARTUP");
+    if (startup && strcmp(startup, "1") == 0) {
+        return run_startup_probe();
+    }
+    printf("Starting benchmark...\n");
+    open_records();
+    init_histogram();
+    init_chunks();
+    init_threads();
+    init_perf_counters();
+    validate_interception();
+    init_memory_sampling();
+    for (uint32_t p = 0; p < PHASE_COUNT; p++) {
+        if (!phase_selected(p)) {
+            continue;
+        }
+        if (chunks.count) {
+            chunk_begin(phase_iterations(p));
+        }
+        perf_start();
+        if (threads.count) {
+            run_threaded_phase(p, &start, &end);
+        } else {
+            clock_gettime(CLOCK_MONOTONIC, &start);
+            phases[p].run(phase_iterations(p));
+            clock_gettime(CLOCK_MONOTONIC, &end);
+        }
+        report_phase(phases[p].label, phases[p].phase, phase_iterations(p) * (threads.count ? threads.count : 1U),
+                     &start, &end);
+        memory_sample(phases[p].phase);
+    }
+    finish_memory_sampling();
     int64_t memory_kb = get_memory_usage();
     printf("Max memory: %" PRId64 " KB\n", memory_kb);
-    (void)sum;
     return 0;
-}
\ No newline at end of file
+}
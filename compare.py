@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+import results_store
+from bench_stats import BASELINE_FOR, mann_whitney_u
+
+REGRESSION_CHART = 'results/performance_regression.png'
+GRID_COLOR = '#2a2a2a'
+ALPHA = 0.01
+THRESHOLD_PCT = 5.0
+MIN_EFFECT = 0.33
+MIN_NS = 0.5
+
+
+def load_set(spec, exclude_noisy=False):
+    # A result set is either a separate store directory or a comma-separated
+    # list of run id prefixes in the default store
+    columns = ['method', 'phase', 'run_id', 'iteration', 'time_ns', 'calls', 'noise']
+    if os.path.isdir(spec):
+        df = results_store.load(columns=columns, store_dir=spec)
+    else:
+        df = results_store.load(columns=columns)
+        prefixes = tuple(spec.split(','))
+        df = df[df['run_id'].str.startswith(prefixes)]
+    if exclude_noisy:
+        df = results_store.drop_noisy(df)
+    if df.empty:
+        raise SystemExit(f"No results found for {spec!r}")
+    df = df[df['calls'] > 0]
+    return run_costs(df.assign(ns_per_call=df['time_ns'] / df['calls']))
+
+
+def run_costs(df):
+    # Hook cost per call of every run: the overhead over the baseline run of
+    # the same campaign iteration, or the campaign's median baseline when that
+    # run is missing, so a baseline that moves between the two sets moves both
+    # sides alike. The baselines themselves keep their raw per-call time
+    costs = {}
+    for (method, phase), group in df.groupby(['method', 'phase']):
+        baseline_name = BASELINE_FOR.get(phase, 'baseline')
+        baseline = df[(df['method'] == baseline_name) & (df['phase'] == phase)]
+        if method == baseline_name or baseline.empty:
+            costs[(method, phase)] = group['ns_per_call'].to_numpy()
+            continue
+        matched = baseline.groupby(['run_id', 'iteration'])['ns_per_call'].median()
+        per_run = baseline.groupby('run_id')['ns_per_call'].median()
+        keys = pd.MultiIndex.from_frame(group[['run_id', 'iteration']])
+        reference = matched.reindex(keys).to_numpy()
+        reference = np.where(np.isnan(reference), per_run.reindex(group['run_id']).to_numpy(), reference)
+        reference = np.where(np.isnan(reference), baseline['ns_per_call'].median(), reference)
+        costs[(method, phase)] = group['ns_per_call'].to_numpy() - reference
+    return costs
+
+
+def compare(reference, candidate, alpha=ALPHA, threshold_pct=THRESHOLD_PCT, min_effect=MIN_EFFECT, min_ns=MIN_NS):
+    # The test, the effect size and the verdict all look at the same per-run
+    # hook cost, so a shift in the baseline alone cannot flag a cell
+    rows = []
+    for method, phase in sorted(set(reference) & set(candidate)):
+        ref_values = reference[(method, phase)]
+        cand_values = candidate[(method, phase)]
+        _, p_slower, delta = mann_whitney_u(cand_values, ref_values)
+        _, p_faster, _ = mann_whitney_u(ref_values, cand_values)
+        ref_cost = float(np.median(ref_values))
+        cand_cost = float(np.median(cand_values))
+        change_ns = cand_cost - ref_cost
+        change_pct = change_ns / abs(ref_cost) * 100 if ref_cost != 0 else float('inf') * np.sign(change_ns)
+        significant = abs(delta) >= min_effect and abs(change_ns) >= min_ns and abs(change_pct) >= threshold_pct
+        if significant and change_ns > 0 and p_slower < alpha:
+            verdict = 'regression'
+        elif significant and change_ns < 0 and p_faster < alpha:
+            verdict = 'improvement'
+        else:
+            verdict = 'unchanged'
+        rows.append({
+            'method': method,
+            'phase': phase,
+            'n_ref': len(ref_values),
+            'n_cand': len(cand_values),
+            'ref_ns_per_call': ref_cost,
+            'cand_ns_per_call': cand_cost,
+            'change_ns': change_ns,
+            'change_pct': change_pct,
+            'p_value': p_slower if change_ns > 0 else p_faster,
+            'cliffs_delta': delta,
+            'verdict': verdict,
+        })
+    return pd.DataFrame(rows)
+
+
+def print_report(result):
+    print("\n" + "="*80)
+    print("PERFORMANCE REGRESSION CHECK")
+    print("="*80)
+    for phase, rows in result.groupby('phase', sort=False):
+        print(f"\n{phase}:")
+        print("-" * 50)
+        for row in rows.itertuples():
+            marker = {'regression': '  << REGRESSION', 'improvement': '  (improved)'}.get(row.verdict, '')
+            print(f"  {row.method:20s}: {row.ref_ns_per_call:9.1f} -> {row.cand_ns_per_call:9.1f} ns/call "
+                  f"({row.change_pct:+7.1f}%)  p={row.p_value:.3g}  δ={row.cliffs_delta:+.2f}  "
+                  f"n={row.n_ref}/{row.n_cand}{marker}")
+
+
+def plot_regression(result, output_file=REGRESSION_CHART):
+    labels = [f"{m} / {p}" for m, p in zip(result['method'], result['phase'])]
+    change = result['change_pct'].clip(-100, 100)
+    bar_colors = result['verdict'].map({'regression': '#ff006e', 'improvement': '#00ff41'}).fillna('#666666')
+
+    fig, ax = plt.subplots(figsize=(12, max(4, 0.35 * len(result) + 1.5)))
+    ax.barh(range(len(result)), change, color=bar_colors, alpha=0.8, edgecolor='white', linewidth=0.5)
+    ax.axvline(0, color='white', linewidth=0.8)
+    ax.set_yticks(range(len(result)))
+    ax.set_yticklabels(labels, fontsize=8)
+    ax.invert_yaxis()
+    ax.set_xlabel('Change in hook cost per call (%, clipped at ±100)', fontsize=12)
+    ax.set_title('Candidate vs Reference', fontsize=14, fontweight='bold', pad=15)
+    ax.grid(True, axis='x', alpha=0.3, color=GRID_COLOR)
+    for i, row in enumerate(result.itertuples()):
+        ax.text(change.iloc[i], i, f" {row.change_ns:+.1f} ns ", va='center', fontsize=7,
+                ha='left' if change.iloc[i] >= 0 else 'right')
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=150, bbox_inches='tight', facecolor='#0a0a0a', edgecolor='none')
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare a candidate result set against a reference and '
+                                                 'fail on statistically significant hook cost regressions')
+    parser.add_argument('reference', help='store directory, or comma-separated run id prefixes in results/store')
+    parser.add_argument('candidate', help='store directory, or comma-separated run id prefixes in results/store')
+    parser.add_argument('--alpha', type=float, default=ALPHA, help='significance level of the Mann-Whitney U test')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD_PCT,
+                        help='minimum change in per-call hook cost, in percent, to count as a regression')
+    parser.add_argument('--min-effect', type=float, default=MIN_EFFECT, help="minimum |Cliff's delta|")
+    parser.add_argument('--min-ns', type=float, default=MIN_NS, help='minimum absolute change in ns/call')
+    parser.add_argument('--exclude-noisy', action='store_true',
+                        help='leave out runs the runner flagged as taken on a noisy host')
+    parser.add_argument('--chart', default=REGRESSION_CHART)
+    args = parser.parse_args()
+
+    result = compare(load_set(args.reference, args.exclude_noisy), load_set(args.candidate, args.exclude_noisy),
+                     args.alpha, args.threshold, args.min_effect, args.min_ns)
+    if result.empty:
+        print("No (method, phase) pairs in common")
+        return 2
+    print_report(result)
+    plot_regression(result, args.chart)
+    print(f"\nSaved {args.chart}")
+
+    regressions = result[result['verdict'] == 'regression']
+    if len(regressions):
+        print(f"\n{len(regressions)} regression(s) above {args.threshold}% at alpha={args.alpha}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
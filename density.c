@@ -0,0 +1,209 @@
+#define _GNU_SOURCE
+#include <getopt.h>
+#include <inttypes.h>
+#include <math.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/resource.h>
+#include <time.h>
+// Driver for the hook-density benchmark: calls the N functions of a library
+// generated by density.py through the table it exports, round-robin or with
+// Zipf-distributed ranks scattered over the library, and writes one record
+// per pattern in the benchmark.c format plus the launch-level fields
+extern const uint32_t density_count;
+extern int (*const density_table[])(int, int);
+static FILE* records_file = NULL;
+static int is_intercepted = 0;
+static struct {
+    uint32_t calls;
+    double zipf_s;
+    uint64_t seed;
+    const char* patterns;
+} params = {1000000U, 1.0, 1, "roundrobin,zipf"};
+__attribute__((noinline)) void bench_record_hook(const char* line) {
+    __asm__ volatile("" : : "r"(line) : "memory");
+}
+void emit_record(const char* line) {
+    fputs(line, records_file);
+    fflush(records_file);
+    bench_record_hook(line);
+}
+int64_t monotonic_ns() {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (int64_t)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+}
+int64_t status_kb(const char* field) {
+    FILE* status = fopen("/proc/self/status", "r");
+    int64_t kb = -1;
+    if (status) {
+        char line[256];
+        size_t len = strlen(field);
+        while (fgets(line, sizeof(line), status)) {
+            if (strncmp(line, field, len) == 0 && sscanf(line + len, " %" SCNd64, &kb) == 1) {
+                break;
+            }
+        }
+        fclose(status);
+    }
+    if (kb < 0) {
+        struct rusage usage;
+        getrusage(RUSAGE_SELF, &usage);
+        kb = (int64_t)usage.ru_maxrss;
+    }
+    return kb;
+}
+static uint64_t xorshift64(uint64_t* state) {
+    *state ^= *state << 13;
+    *state ^= *state >> 7;
+    *state ^= *state << 17;
+    return *state;
+}
+void fill_roundrobin(uint32_t* sequence) {
+    for (uint32_t i = 0; i < params.calls; i++) {
+        sequence[i] = i % density_count;
+    }
+}
+void fill_zipf(uint32_t* sequence) {
+    // Rank k is drawn with weight 1/k^s by inverse CDF; ranks map to functions
+    // through a random permutation, so the hot ones are spread over the text
+    double* cdf = malloc(density_count * sizeof(double));
+    uint32_t* function = malloc(density_count * sizeof(uint32_t));
+    if (!cdf || !function) {
+        fprintf(stderr, "ERROR: cannot allocate Zipf tables for %u functions\n", density_count);
+        exit(1);
+    }
+    uint64_t state = params.seed ? params.seed : 1;
+    double total = 0.0;
+    for (uint32_t k = 0; k < density_count; k++) {
+        total += 1.0 / pow((double)(k + 1), params.zipf_s);
+        cdf[k] = total;
+        function[k] = k;
+    }
+    for (uint32_t k = density_count - 1; k > 0; k--) {
+        uint32_t j = (uint32_t)(xorshift64(&state) % (k + 1));
+        uint32_t t = function[k];
+        function[k] = function[j];
+        function[j] = t;
+    }
+    for (uint32_t i = 0; i < params.calls; i++) {
+        double u = (double)(xorshift64(&state) >> 11) / 9007199254740992.0 * total;
+        uint32_t lo = 0, hi = density_count - 1;
+        while (lo < hi) {
+            uint32_t mid = lo + (hi - lo) / 2;
+            if (cdf[mid] < u) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        sequence[i] = function[lo];
+    }
+    free(cdf);
+    free(function);
+}
+void validate_interception() {
+    const char* skip_validation = getenv("SKIP_INTERCEPT_VALIDATION");
+    if (skip_validation && strcmp(skip_validation, "1") == 0) {
+        return;
+    }
+    uint32_t overridden = 0;
+    for (uint32_t f = 0; f < density_count; f++) {
+        overridden += density_table[f](f, 1) == 0x42;
+    }
+    if (overridden != density_count) {
+        fprintf(stderr, "ERROR: only %u of %u functions override the return value\n", overridden, density_count);
+        exit(1);
+    }
+    printf("All %u return value overrides working\n", density_count);
+    is_intercepted = 1;
+}
+void run_pattern(const char* pattern, const uint32_t* sequence, int64_t main_ns, int64_t ready_kb) {
+    struct timespec start, end;
+    volatile int32_t result = 0;
+    clock_gettime(CLOCK_MONOTONIC, &start);
+    for (uint32_t i = 0; i < params.calls; i++) {
+        result = density_table[sequence[i]]((int32_t)i, 1);
+        if (is_intercepted && i % 100000U == 0 && result != 0x42) {
+            fprintf(stderr, "INTERCEPT FAILURE: function %u returned %d (expected 0x42) at call #%u\n",
+                    sequence[i], result, i);
+            exit(1);
+        }
+    }
+    clock_gettime(CLOCK_MONOTONIC, &end);
+    int64_t ns = (int64_t)(end.tv_sec - start.tv_sec) * 1000000000LL + (end.tv_nsec - start.tv_nsec);
+    printf("%s over %u functions: %" PRId64 " us\n", pattern, density_count, ns / 1000);
+    if (records_file) {
+        char line[512];
+        snprintf(line, sizeof(line),
+                 "{\"phase\":\"%s\",\"iterations\":%u,\"elapsed_ns\":%" PRId64 ",\"max_rss_kb\":%" PRId64
+                 ",\"validation\":\"%s\",\"functions\":%u,\"main_ns\":%" PRId64 ",\"ready_kb\":%" PRId64 "}\n",
+                 pattern, params.calls, ns, status_kb("VmHWM:"), is_intercepted ? "intercepted" : "unchecked",
+                 density_count, main_ns, ready_kb);
+        emit_record(line);
+    }
+}
+void usage(const char* argv0) {
+    fprintf(stderr, "usage: %s [--calls N] [--patterns roundrobin,zipf] [--zipf-s S] [--seed N]\n", argv0);
+    exit(2);
+}
+void parse_args(int argc, char** argv) {
+    static const struct option options[] = {
+        {"calls", required_argument, NULL, 'n'},
+        {"patterns", required_argument, NULL, 'p'},
+        {"zipf-s", required_argument, NULL, 'z'},
+        {"seed", required_argument, NULL, 'r'},
+        {NULL, 0, NULL, 0},
+    };
+    int opt;
+    while ((opt = getopt_long(argc, argv, "n:p:z:r:", options, NULL)) != -1) {
+        switch (opt) {
+        case 'n': params.calls = (uint32_t)atol(optarg); break;
+        case 'p': params.patterns = optarg; break;
+        case 'z': params.zipf_s = atof(optarg); break;
+        case 'r': params.seed = strtoull(optarg, NULL, 10); break;
+        default: usage(argv[0]);
+        }
+    }
+    if (params.calls == 0 || params.zipf_s < 0) {
+        usage(argv[0]);
+    }
+}
+int main(int argc, char** argv) {
+    // Stamped first, so the host can tell how long loading and hooking took
+    int64_t main_ns = monotonic_ns();
+    parse_args(argc, argv);
+    const char* path = getenv("BENCH_RECORDS");
+    if (path && path[0] != '\0') {
+        records_file = fopen(path, "a");
+        if (!records_file) {
+            fprintf(stderr, "ERROR: cannot open BENCH_RECORDS file %s\n", path);
+            return 1;
+        }
+    }
+    validate_interception();
+    // Resident set with every hook in place, before the call sequence is allocated
+    int64_t ready_kb = status_kb("VmRSS:");
+    uint32_t* sequence = malloc(params.calls * sizeof(uint32_t));
+    if (!sequence) {
+        fprintf(stderr, "ERROR: cannot allocate a %u-call sequence\n", params.calls);
+        return 1;
+    }
+    char* patterns = strdup(params.patterns);
+    for (char* pattern = strtok(patterns, ","); pattern; pattern = strtok(NULL, ",")) {
+        if (strcmp(pattern, "roundrobin") == 0) {
+            fill_roundrobin(sequence);
+        } else if (strcmp(pattern, "zipf") == 0) {
+            fill_zipf(sequence);
+        } else {
+            fprintf(stderr, "ERROR: unknown pattern %s\n", pattern);
+            return 2;
+        }
+        run_pattern(pattern, sequence, main_ns, ready_kb);
+    }
+    free(patterns);
+    free(sequence);
+    return 0;
+}
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+import frida_session
+import results_store
+from bench_records import iter_records, read_records
+from bench_stats import density_summary
+
+DENSITY_BUILD = 'build/density'
+DRIVER_SOURCE = 'density.c'
+FUNCTION_COUNTS = [10, 100, 1000, 10000]
+PATTERNS = ['roundrobin', 'zipf']
+CALLS = 1000000
+REPEATS = 3
+PREFIX = 'dfunc_'
+CC = os.environ.get('CC', 'gcc')
+# The same flags the Makefile builds libfuncs.so and benchmark with
+CFLAGS = ['-Wall', '-O2', '-fno-inline']
+
+
+def function_name(i):
+    return f'{PREFIX}{i:05d}'
+
+
+def library_source(n):
+    # Every body differs in its constant, so no two functions fold together,
+    # and each is long enough for an inline hook to relocate its prologue.
+    # The table is filled through dynamic relocations against the exported
+    # names, so an LD_PRELOAD definition takes the slot like it would a PLT call
+    lines = ['#include <stdint.h>']
+    for i in range(n):
+        lines += ['__attribute__((noinline))',
+                  f'int {function_name(i)}(int a, int b) {{',
+                  '    volatile int temp = a;',
+                  f'    temp += b ^ {i};',
+                  '    return temp;',
+                  '}']
+    lines.append(f'const uint32_t density_count = {n};')
+    lines.append('int (*const density_table[])(int, int) = {')
+    lines += [f'    {function_name(i)},' for i in range(n)]
+    lines.append('};')
+    return '\n'.join(lines) + '\n'
+
+
+def hook_source(n):
+    # hook.c for n functions: count, call the original and return 0x42
+    names = ''.join(f'    "{function_name(i)}",\n' for i in range(n))
+    lines = ['#define _GNU_SOURCE',
+             '#include <dlfcn.h>',
+             '#include <stdio.h>',
+             '#include <stdlib.h>',
+             f'static const char* const names[{n}] = {{\n{names}}};',
+             f'static int (*original[{n}])(int, int);',
+             'static volatile int counter = 0;',
+             'static void __attribute__((constructor)) init_hooks() {',
+             f'    for (int i = 0; i < {n}; i++) {{',
+             '        original[i] = dlsym(RTLD_NEXT, names[i]);',
+             '        if (!original[i]) {',
+             '            fprintf(stderr, "ERROR: Failed to find %s: %s\\n", names[i], dlerror());',
+             '            exit(1);',
+             '        }',
+             '    }',
+             '}']
+    for i in range(n):
+        lines += [f'int {function_name(i)}(int a, int b) {{',
+                  '    counter++;',
+                  f'    original[{i}](a, b);',
+                  '    return 0x42;',
+                  '}']
+    return '\n'.join(lines) + '\n'
+
+
+def compile_c(args):
+    proc = subprocess.run([CC] + args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join([CC] + args)} failed\n{proc.stdout}")
+
+
+def build(n):
+    """Generate and compile the library, its LD_PRELOAD hook and the driver for n functions."""
+    directory = os.path.join(DENSITY_BUILD, f'n{n}')
+    driver = os.path.join(directory, 'density')
+    if os.path.exists(driver) and os.path.getmtime(driver) >= os.path.getmtime(DRIVER_SOURCE):
+        return directory
+    os.makedirs(directory, exist_ok=True)
+    for name, source in [('libdensity.c', library_source(n)), ('hook_density.c', hook_source(n))]:
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(source)
+    compile_c(['-shared', '-fPIC'] + CFLAGS + ['-o', os.path.join(directory, 'libdensity.so'),
+                                               os.path.join(directory, 'libdensity.c')])
+    compile_c(['-shared', '-O3', '-fPIC', '-o', os.path.join(directory, 'hook_density.so'),
+               os.path.join(directory, 'hook_density.c'), '-ldl'])
+    compile_c(CFLAGS + ['-o', driver, DRIVER_SOURCE, f'-L{directory}', '-ldensity', '-Wl,-rpath,$ORIGIN', '-lm',
+                        '-Wl,--export-dynamic-symbol=bench_record_hook'])
+    return directory
+
+
+def build_methods():
+    methods = [
+        {'name': 'baseline', 'env': {'SKIP_INTERCEPT_VALIDATION': '1'}},
+        {'name': 'ldpreload', 'env': {}, 'preload': 'hook_density.so'},
+    ]
+    if frida_session.frida is None:
+        print("Frida Python bindings not found. Install with: pip install frida-tools")
+        return methods
+    for runtime in ['v8', 'qjs']:
+        methods.append({'name': f'frida_density_{runtime}', 'env': {}, 'script': 'frida_density.js',
+                        'runtime': runtime})
+    methods.append({'name': 'frida_density_cmodule', 'env': {}, 'script': 'frida_density_cmodule.js',
+                    'runtime': None})
+    return methods
+
+
+def run_launch(method, directory, calls, patterns):
+    # Launch-to-main covers loading the n-function library and installing
+    # every hook; main stamps CLOCK_MONOTONIC, the clock of time.monotonic_ns()
+    argv = [os.path.join(directory, 'density'), '--calls', str(calls), '--patterns', ','.join(patterns)]
+    env = dict(method['env'])
+    if 'preload' in method:
+        env['LD_PRELOAD'] = os.path.abspath(os.path.join(directory, method['preload']))
+    if 'script' in method:
+        # Records come back as script messages, as in runner.run_cell_persistent
+        env['BENCH_RECORDS'] = os.devnull
+        start = time.monotonic_ns()
+        returncode, output, lines = frida_session.shared_device().launch(argv, env, method['script'],
+                                                                         method['runtime'])
+        records = {record['phase']: record for record in iter_records(lines)}
+    else:
+        fd, records_path = tempfile.mkstemp(prefix=f"density-{method['name']}-", suffix='.jsonl')
+        os.close(fd)
+        env = dict(os.environ, BENCH_RECORDS=records_path, **env)
+        try:
+            start = time.monotonic_ns()
+            proc = subprocess.run(argv, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            records = read_records(records_path)
+        finally:
+            os.unlink(records_path)
+        returncode, output = proc.returncode, proc.stdout
+    if returncode != 0:
+        raise RuntimeError(f"exit code {returncode}\n{output}")
+    missing = [p for p in patterns if p not in records]
+    if missing:
+        raise RuntimeError(f"missing records for {', '.join(missing)}\n{output}")
+    return [{
+        'method': method['name'],
+        'functions': records[p]['functions'],
+        'pattern': p,
+        'calls': records[p]['iterations'],
+        'time_ns': records[p]['elapsed_ns'],
+        'startup_ns': records[p]['main_ns'] - start,
+        'ready_kb': records[p]['ready_kb'],
+        'hwm_kb': records[p]['max_rss_kb'],
+        'validation': records[p]['validation'],
+    } for p in patterns]
+
+
+def print_summary(summary):
+    print("\nHook density (medians; attach and overhead over the baseline at the same N):")
+    print("-" * 80)
+    for (method, pattern), rows in summary.groupby(['method', 'pattern'], sort=False):
+        if method == 'baseline':
+            continue
+        print(f"\n{method} ({pattern}):")
+        print(f"  {'functions':>10s}{'attach ms':>12s}{'RSS KB':>10s}{'+RSS KB':>10s}{'ns/call':>10s}")
+        for row in rows.itertuples():
+            print(f"  {row.functions:10d}{row.attach_ms:12.2f}{row.ready_kb:10.0f}{row.extra_kb:10.0f}"
+                  f"{row.overhead_ns_per_call:10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hook all N functions of a generated library and measure attach '
+                                                 'time, resident memory and per-call overhead as N grows')
+    parser.add_argument('--functions', default=','.join(map(str, FUNCTION_COUNTS)),
+                        help='comma-separated function counts to generate')
+    parser.add_argument('--patterns', default=','.join(PATTERNS), help='call patterns: roundrobin, zipf')
+    parser.add_argument('--calls', type=int, default=CALLS, help='calls per pattern and launch')
+    parser.add_argument('--repeats', type=int, default=REPEATS)
+    parser.add_argument('--methods', help='comma-separated subset of methods; baseline is always included')
+    args = parser.parse_args()
+
+    counts = [int(n) for n in args.functions.split(',')]
+    patterns = args.patterns.split(',')
+    methods = build_methods()
+    if args.methods:
+        wanted = set(args.methods.split(',')) | {'baseline'}
+        methods = [m for m in methods if m['name'] in wanted]
+
+    directories = {}
+    for n in counts:
+        print(f"Building the {n}-function library...")
+        try:
+            directories[n] = build(n)
+        except RuntimeError as e:
+            print(e)
+            return 1
+
+    run = results_store.new_run()
+    total = args.repeats * len(counts) * len(methods)
+    print(f"\nRunning {total} launches as {run['run_id']}...")
+    rows = []
+    done = 0
+    for repeat in range(1, args.repeats + 1):
+        for n in counts:
+            # Interleave methods so drift in page cache or CPU state hits all of them alike
+            for method in methods:
+                try:
+                    rows.extend(dict(row, repeat=repeat)
+                                for row in run_launch(method, directories[n], args.calls, patterns))
+                except RuntimeError as e:
+                    print(f"\n{method['name']} failed with {n} functions: {e}")
+                    return 1
+                done += 1
+                print(f"\r[{done}/{total}] {method['name']} n={n}", end='', flush=True)
+    print()
+
+    print(f"Recorded hook density in {results_store.append_density(run, rows)}")
+    print_summary(density_summary(pd.DataFrame(rows)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+import argparse
+import itertools
+import sys
+
+import pandas as pd
+
+import results_store
+from bench_stats import OUTER_FRAME_ONLY, depth_summary
+from runner import build_methods
+from sweep import run_point
+
+DEPTHS = [1, 5, 20, 100, 1000]
+# Frames each point runs, split into FRAMES / depth outer calls, so every
+# depth takes about as long as the others
+FRAMES = 2000000
+REPEATS = 3
+
+
+def print_summary(summary):
+    print("\nHook cost per hooked recursion frame (median ns over baseline at the same depth):")
+    print("-" * 80)
+    depths = sorted(summary['depth'].unique())
+    print(f"  {'method':32s}" + ''.join(f"{f'depth {d}':>12s}" for d in depths))
+    costs = summary.pivot(index='method', columns='depth', values='hook_ns_per_frame')
+    for method in summary['method'].unique():
+        if method == 'baseline':
+            continue
+        label = f'{method} (outer frame only)' if method in OUTER_FRAME_ONLY else method
+        print(f"  {label:32s}" + ''.join(f"{costs.loc[method, d]:12.1f}" for d in depths))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sweep the recursion depth of the recursive_depth phase to see '
+                                                 'whether the per-frame hook cost grows with depth')
+    parser.add_argument('--depths', default=','.join(map(str, DEPTHS)), help='comma-separated recursion depths')
+    parser.add_argument('--frames', type=int, default=FRAMES,
+                        help='recursion frames per point; each depth runs frames / depth outer calls')
+    parser.add_argument('--repeats', type=int, default=REPEATS)
+    parser.add_argument('--methods', help='comma-separated subset of methods; baseline is always included')
+    args = parser.parse_args()
+
+    depths = [int(d) for d in args.depths.split(',')]
+    methods = [m for m in build_methods() if 'recursive' in m['phases']]
+    if args.methods:
+        wanted = set(args.methods.split(',')) | {'baseline'}
+        methods = [m for m in methods if m['name'] in wanted]
+
+    run = results_store.new_run()
+    points = list(itertools.product(range(1, args.repeats + 1), depths, methods))
+    print(f"\nRunning {len(points)} depth points as {run['run_id']}...")
+    rows = []
+    for done, (repeat, depth, method) in enumerate(points, 1):
+        calls = max(1, args.frames // depth)
+        try:
+            rows.extend(run_point(method, calls, {'depth': depth}, ['recursive_depth'], repeat))
+        except RuntimeError as e:
+            print(f"\n{method['name']} failed at depth {depth}: {e}")
+            return 1
+        print(f"\r[{done}/{len(points)}] {method['name']} depth={depth}", end='', flush=True)
+    print()
+
+    print(f"Recorded depth sweep in {results_store.append_depth(run, rows)}")
+    print_summary(depth_summary(pd.DataFrame(rows)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+import os
+import platform
+import sys
+import time
+
+CPU_SYSFS = '/sys/devices/system/cpu'
+# Runnable tasks allowed on top of the benchmark workers before a run counts
+# as sharing the machine, e.g. the orchestrator storing the previous result
+RUNNABLE_MARGIN = 1
+# The run queue is read this many times, this far apart, and the minimum kept,
+# so only tasks that stay runnable count
+RUNNABLE_SAMPLES = 10
+RUNNABLE_INTERVAL = 0.01
+
+
+def parse_cpu_list(spec):
+    cores = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            lo, hi = part.split('-', 1)
+            cores.update(range(int(lo), int(hi) + 1))
+        else:
+            cores.add(int(part))
+    return sorted(cores)
+
+
+def read_sysfs(path, default=''):
+    try:
+        with open(os.path.join(CPU_SYSFS, path)) as f:
+            return f.read().strip()
+    except OSError:
+        return default
+
+
+def cpu_model():
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name') or line.startswith('Model'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def turbo_state():
+    # intel_pstate reports the inverse; acpi-cpufreq and amd-pstate use boost
+    no_turbo = read_sysfs('intel_pstate/no_turbo')
+    if no_turbo:
+        return 'off' if no_turbo == '1' else 'on'
+    boost = read_sysfs('cpufreq/boost')
+    if boost:
+        return 'on' if boost == '1' else 'off'
+    return ''
+
+
+def runnable_tasks():
+    counts = []
+    for n in range(RUNNABLE_SAMPLES):
+        if n:
+            time.sleep(RUNNABLE_INTERVAL)
+        with open('/proc/loadavg') as f:
+            counts.append(int(f.read().split()[3].split('/')[0]))
+    return min(counts)
+
+
+def fingerprint(cpus):
+    """Host state that moves benchmark results, read just before a run on cpus."""
+    governors = sorted({read_sysfs(f'cpu{cpu}/cpufreq/scaling_governor') for cpu in cpus} - {''})
+    siblings = set()
+    for cpu in cpus:
+        siblings.update(parse_cpu_list(read_sysfs(f'cpu{cpu}/topology/thread_siblings_list', str(cpu))))
+    with open('/proc/loadavg') as f:
+        load1 = f.read().split()[0]
+    return {
+        'cpu_model': cpu_model(),
+        'governor': ','.join(governors),
+        'turbo': turbo_state(),
+        'smt': read_sysfs('smt/control'),
+        'isolcpus': read_sysfs('isolated'),
+        # SMT siblings of the pinned CPUs that another task could run on
+        'smt_siblings': ','.join(map(str, sorted(siblings - set(cpus)))),
+        'kernel': platform.release(),
+        'load1': float(load1),
+        'runnable': runnable_tasks(),
+    }
+
+
+def noise_reasons(fp, workers=None):
+    """Conditions in fp under which timings drift; empty for a quiet host.
+
+    The run queue is only checked when the number of busy benchmark workers
+    is given, since it describes the moment of one run rather than the host.
+    """
+    reasons = []
+    if fp['governor'] and fp['governor'] != 'performance':
+        reasons.append(f"governor {fp['governor']}")
+    if fp['turbo'] == 'on':
+        reasons.append('turbo on')
+    isolated = set(parse_cpu_list(fp['isolcpus']))
+    busy_siblings = [cpu for cpu in parse_cpu_list(fp['smt_siblings']) if cpu not in isolated]
+    if busy_siblings:
+        reasons.append(f"SMT siblings {','.join(map(str, busy_siblings))} not isolated")
+    # The count includes the reading worker and the other workers' benchmarks
+    if workers is not None and fp['runnable'] > workers + RUNNABLE_MARGIN:
+        reasons.append(f"{fp['runnable']} runnable tasks")
+    return reasons
+
+
+def main():
+    cpus = parse_cpu_list(sys.argv[1]) if len(sys.argv) > 1 else sorted(os.sched_getaffinity(0))
+    fp = fingerprint(cpus)
+    for key, value in fp.items():
+        print(f"{key:14s}{value}")
+    reasons = noise_reasons(fp, workers=0)
+    print(f"{'noise':14s}{'; '.join(reasons) or 'none'}")
+    return 1 if reasons else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+// CModule counterpart of the frida_args_*.js scripts: reads both compute_sum
+// ints, keeps the process_array arguments in per-invocation data, then sums
+// the buffer in place and writes the result out-param on leave
+const cm = new CModule(`
+#include <gum/guminterceptor.h>
+typedef struct {
+    int *arr;
+    gsize size;
+    int *result;
+} ArrayArgs;
+static volatile int sink = 0;
+void sum_on_enter(GumInvocationContext *ic) {
+    sink = GPOINTER_TO_INT(gum_invocation_context_get_nth_argument(ic, 0)) +
+           GPOINTER_TO_INT(gum_invocation_context_get_nth_argument(ic, 1));
+}
+void array_on_enter(GumInvocationContext *ic) {
+    ArrayArgs *call = GUM_IC_GET_INVOCATION_DATA(ic, ArrayArgs);
+    call->arr = gum_invocation_context_get_nth_argument(ic, 0);
+    call->size = GPOINTER_TO_SIZE(gum_invocation_context_get_nth_argument(ic, 1));
+    call->result = gum_invocation_context_get_nth_argument(ic, 2);
+}
+void array_on_leave(GumInvocationContext *ic) {
+    ArrayArgs *call = GUM_IC_GET_INVOCATION_DATA(ic, ArrayArgs);
+    int sum = 0;
+    for (gsize i = 0; i < call->size; i++) {
+        sum += call->arr[i];
+    }
+    *call->result = sum;
+}
+`);
+var libfuncs = Process.findModuleByName('libfuncs.so');
+if (libfuncs) {
+    Interceptor.attach(libfuncs.getExportByName('compute_sum'), {
+        onEnter: cm.sum_on_enter
+    });
+    Interceptor.attach(libfuncs.getExportByName('process_array'), {
+        onEnter: cm.array_on_enter,
+        onLeave: cm.array_on_leave
+    });
+}
@@ -0,0 +1,15 @@
+// Reference for the frida_args_*.js scripts: the same two hooks with empty
+// callbacks, so what remains is the cost of the transition itself
+var libfuncs = Process.findModuleByName('libfuncs.so');
+if (libfuncs) {
+    Interceptor.attach(libfuncs.getExportByName('compute_sum'), {
+        onEnter: function (args) {
+        }
+    });
+    Interceptor.attach(libfuncs.getExportByName('process_array'), {
+        onEnter: function (args) {
+        },
+        onLeave: function (retval) {
+        }
+    });
+}
@@ -0,0 +1,25 @@
+// Like frida_args_readbytearray.js, but reads the process_array buffer one
+// element at a time through NativePointer.readS32
+var libfuncs = Process.findModuleByName('libfuncs.so');
+var sink = 0;
+if (libfuncs) {
+    Interceptor.attach(libfuncs.getExportByName('compute_sum'), {
+        onEnter: function (args) {
+            sink = args[0].toInt32() + args[1].toInt32();
+        }
+    });
+    Interceptor.attach(libfuncs.getExportByName('process_array'), {
+        onEnter: function (args) {
+            this.arr = args[0];
+            this.size = args[1].toUInt32();
+            this.result = args[2];
+        },
+        onLeave: function (retval) {
+            var sum = 0;
+            for (var i = 0; i < this.size; i++) {
+                sum += this.arr.add(i * 4).readS32();
+            }
+            this.result.writeS32(sum);
+        }
+    });
+}
@@ -0,0 +1,26 @@
+// Reads both compute_sum ints, copies the process_array buffer into a fresh
+// ArrayBuffer with readByteArray and writes the sum to the result out-param
+var libfuncs = Process.findModuleByName('libfuncs.so');
+var sink = 0;
+if (libfuncs) {
+    Interceptor.attach(libfuncs.getExportByName('compute_sum'), {
+        onEnter: function (args) {
+            sink = args[0].toInt32() + args[1].toInt32();
+        }
+    });
+    Interceptor.attach(libfuncs.getExportByName('process_array'), {
+        onEnter: function (args) {
+            this.arr = args[0];
+            this.size = args[1].toUInt32();
+            this.result = args[2];
+        },
+        onLeave: function (retval) {
+            var values = new Int32Array(this.arr.readByteArray(this.size * 4));
+            var sum = 0;
+            for (var i = 0; i < values.length; i++) {
+                sum += values[i];
+            }
+            this.result.writeS32(sum);
+        }
+    });
+}
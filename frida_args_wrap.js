@@ -0,0 +1,26 @@
+// Like frida_args_readbytearray.js, but views the process_array buffer in
+// place through ArrayBuffer.wrap instead of copying it
+var libfuncs = Process.findModuleByName('libfuncs.so');
+var sink = 0;
+if (libfuncs) {
+    Interceptor.attach(libfuncs.getExportByName('compute_sum'), {
+        onEnter: function (args) {
+            sink = args[0].toInt32() + args[1].toInt32();
+        }
+    });
+    Interceptor.attach(libfuncs.getExportByName('process_array'), {
+        onEnter: function (args) {
+            this.arr = args[0];
+            this.size = args[1].toUInt32();
+            this.result = args[2];
+        },
+        onLeave: function (retval) {
+            var values = new Int32Array(ArrayBuffer.wrap(this.arr, this.size * 4));
+            var sum = 0;
+            for (var i = 0; i < values.length; i++) {
+                sum += values[i];
+            }
+            this.result.writeS32(sum);
+        }
+    });
+}
@@ -1,4 +1,4 @@
-var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'compute_sum_complex', 'factorial', 'process_array', 'allocate_and_free', 'test_intercept'];
+var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'compute_sum_complex', 'factorial', 'recursive_sum', 'process_array', 'allocate_and_free', 'test_intercept'];
 var counter = 0;
 var libfuncs = Process.findModuleByName('libfuncs.so');
 if (libfuncs) {
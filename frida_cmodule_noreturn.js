@@ -6,7 +6,7 @@ void onEnter(GumInvocationContext *ic) {
 void onLeave(GumInvocationContext *ic) {
 }
 `);
-var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'compute_sum_complex', 'factorial', 'process_array', 'allocate_and_free', 'test_intercept'];
+var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'compute_sum_complex', 'factorial', 'recursive_sum', 'process_array', 'allocate_and_free', 'test_intercept'];
 var hooked = 0;
 function hookFunctions() {
     var libfuncs = Process.findModuleByName('libfuncs.so');
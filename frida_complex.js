@@ -1,4 +1,4 @@
-var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'factorial', 'process_array', 'allocate_and_free', 'test_intercept', 'compute_sum_complex'];
+var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'factorial', 'recursive_sum', 'process_array', 'allocate_and_free', 'test_intercept', 'compute_sum_complex'];
 var TRIG_ITERATIONS = 50;
 var ARRAY_SIZE = 30;
 var MATRIX_SIZE = 10;
@@ -132,7 +132,7 @@ function complexThing(a, b) {
         var len = snapshot.length;
     }
 }
-var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'compute_sum_complex', 'factorial', 'process_array', 'allocate_and_free', 'test_intercept'];
+var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'compute_sum_complex', 'factorial', 'recursive_sum', 'process_array', 'allocate_and_free', 'test_intercept'];
 var counter = 0;
 var libfuncs = Process.findModuleByName('libfuncs.so');
 if (libfuncs) {
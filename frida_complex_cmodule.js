@@ -129,7 +129,7 @@ int stats_max = -1000000000;
     }
 }
 `);
-var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'factorial', 'process_array', 'allocate_and_free', 'test_intercept', 'compute_sum_complex'];
+var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'factorial', 'recursive_sum', 'process_array', 'allocate_and_free', 'test_intercept', 'compute_sum_complex'];
 function hookFunctions() {
     var libfuncs = Process.findModuleByName('libfuncs.so');
     if (libfuncs) {
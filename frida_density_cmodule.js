@@ -0,0 +1,21 @@
+// CModule counterpart of frida_density.js: the same onLeave override for
+// every generated function, without entering the JavaScript runtime
+const cm = new CModule(`
+#include <gum/guminterceptor.h>
+static volatile int counter = 0;
+void onLeave(GumInvocationContext *ic) {
+    counter++;
+    gum_invocation_context_replace_return_value(ic, GSIZE_TO_POINTER(0x42));
+}
+`);
+var hooked = 0;
+var library = Process.findModuleByName('libdensity.so');
+if (library) {
+    library.enumerateExports().forEach(function (e) {
+        if (e.type === 'function' && e.name.startsWith('dfunc_')) {
+            Interceptor.attach(e.address, {onLeave: cm.onLeave});
+            hooked++;
+        }
+    });
+}
+console.log(`Hooked ${hooked} generated functions`);
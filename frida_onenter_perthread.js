@@ -0,0 +1,26 @@
+var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'compute_sum_complex', 'factorial', 'recursive_sum', 'process_array', 'allocate_and_free', 'test_intercept'];
+var counters = {};
+var libfuncs = Process.findModuleByName('libfuncs.so');
+if (libfuncs) {
+    var exports = libfuncs.enumerateExports();
+    targetFunctions.forEach(function (funcName) {
+        var funcExport = exports.find(e => e.name === funcName);
+        if (funcExport) {
+            try {
+                Interceptor.attach(funcExport.address, {
+                    onEnter: function (args) {
+                        counters[this.threadId] = (counters[this.threadId] || 0) + 1;
+                    },
+                    onLeave: function (retval) {
+                        if (funcName === 'test_intercept') {
+                            retval.replace(Memory.allocUtf8String('FRIDA_ONENTER'));
+                        } else {
+                            retval.replace(0x42);
+                        }
+                    }
+                });
+            } catch (e) {
+            }
+        }
+    });
+}
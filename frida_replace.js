@@ -0,0 +1,42 @@
+// Replaces each function outright, like hook.c: count, call the original and
+// return 0x42. A NativeFunction for the target called from inside its own
+// replacement goes straight to the original implementation
+var signatures = {
+    'compute_sum': ['int', ['int', 'int']],
+    'compute_sum_heavy': ['int', ['int', 'int']],
+    'compute_sum_complex': ['int', ['int', 'int']],
+    'factorial': ['uint64', ['int']],
+    'recursive_sum': ['uint64', ['int']],
+    'process_array': ['int', ['pointer', 'size_t', 'pointer']],
+    'allocate_and_free': ['int', ['size_t']]
+};
+var counter = 0;
+var testResult = Memory.allocUtf8String('FRIDA_REPLACE');
+var replacements = [];
+var libfuncs = Process.findModuleByName('libfuncs.so');
+if (libfuncs) {
+    Object.keys(signatures).forEach(function (funcName) {
+        var address = libfuncs.findExportByName(funcName);
+        if (!address) {
+            return;
+        }
+        var retType = signatures[funcName][0];
+        var argTypes = signatures[funcName][1];
+        var original = new NativeFunction(address, retType, argTypes);
+        var replacement = new NativeCallback(function () {
+            counter++;
+            original.apply(null, arguments);
+            return 0x42;
+        }, retType, argTypes);
+        Interceptor.replace(address, replacement);
+        replacements.push(replacement);
+    });
+    var testIntercept = libfuncs.findExportByName('test_intercept');
+    if (testIntercept) {
+        var testReplacement = new NativeCallback(function () {
+            return testResult;
+        }, 'pointer', []);
+        Interceptor.replace(testIntercept, testReplacement);
+        replacements.push(testReplacement);
+    }
+}
@@ -0,0 +1,66 @@
+// Same replacements as frida_replace.js, compiled to native code: the targets
+// are passed in as symbols, and calling a target from inside its own
+// replacement reaches the original implementation
+var targetFunctions = ['compute_sum', 'compute_sum_heavy', 'compute_sum_complex', 'factorial', 'recursive_sum', 'process_array', 'allocate_and_free', 'test_intercept'];
+// Kept at top level: Interceptor.replace only holds the raw function pointers,
+// so the CModule must stay referenced for as long as the replacements are in place
+var cm = null;
+var libfuncs = Process.findModuleByName('libfuncs.so');
+if (libfuncs) {
+    var symbols = {};
+    targetFunctions.forEach(function (funcName) {
+        symbols[funcName + '_impl'] = libfuncs.getExportByName(funcName);
+    });
+    cm = new CModule(`
+#include <glib.h>
+extern int compute_sum_impl(int a, int b);
+extern int compute_sum_heavy_impl(int a, int b);
+extern int compute_sum_complex_impl(int a, int b);
+extern guint64 factorial_impl(int n);
+extern guint64 recursive_sum_impl(int n);
+extern int process_array_impl(int *arr, gsize size, int *result);
+extern int allocate_and_free_impl(gsize size);
+static volatile int counter = 0;
+int replace_compute_sum(int a, int b) {
+    counter++;
+    compute_sum_impl(a, b);
+    return 0x42;
+}
+int replace_compute_sum_heavy(int a, int b) {
+    counter++;
+    compute_sum_heavy_impl(a, b);
+    return 0x42;
+}
+int replace_compute_sum_complex(int a, int b) {
+    counter++;
+    compute_sum_complex_impl(a, b);
+    return 0x42;
+}
+guint64 replace_factorial(int n) {
+    counter++;
+    factorial_impl(n);
+    return 0x42;
+}
+guint64 replace_recursive_sum(int n) {
+    counter++;
+    recursive_sum_impl(n);
+    return 0x42;
+}
+int replace_process_array(int *arr, gsize size, int *result) {
+    counter++;
+    process_array_impl(arr, size, result);
+    return 0x42;
+}
+int replace_allocate_and_free(gsize size) {
+    counter++;
+    allocate_and_free_impl(size);
+    return 0x42;
+}
+const char *replace_test_intercept(void) {
+    return "FRIDA_REPLACE_CMODULE";
+}
+`, symbols);
+    targetFunctions.forEach(function (funcName) {
+        Interceptor.replace(symbols[funcName + '_impl'], cm['replace_' + funcName]);
+    });
+}
@@ -0,0 +1,42 @@
+// Interceptor.replaceFast patches the target to jump straight to the
+// replacement, with no invocation bookkeeping, and returns a pointer that
+// runs the original; calling the target itself would recurse
+var signatures = {
+    'compute_sum': ['int', ['int', 'int']],
+    'compute_sum_heavy': ['int', ['int', 'int']],
+    'compute_sum_complex': ['int', ['int', 'int']],
+    'factorial': ['uint64', ['int']],
+    'recursive_sum': ['uint64', ['int']],
+    'process_array': ['int', ['pointer', 'size_t', 'pointer']],
+    'allocate_and_free': ['int', ['size_t']]
+};
+var counter = 0;
+var testResult = Memory.allocUtf8String('FRIDA_REPLACEFAST');
+var replacements = [];
+var libfuncs = Process.findModuleByName('libfuncs.so');
+if (libfuncs) {
+    Object.keys(signatures).forEach(function (funcName) {
+        var address = libfuncs.findExportByName(funcName);
+        if (!address) {
+            return;
+        }
+        var retType = signatures[funcName][0];
+        var argTypes = signatures[funcName][1];
+        var original = null;
+        var replacement = new NativeCallback(function () {
+            counter++;
+            original.apply(null, arguments);
+            return 0x42;
+        }, retType, argTypes);
+        original = new NativeFunction(Interceptor.replaceFast(address, replacement), retType, argTypes);
+        replacements.push(replacement);
+    });
+    var testIntercept = libfuncs.findExportByName('test_intercept');
+    if (testIntercept) {
+        var testReplacement = new NativeCallback(function () {
+            return testResult;
+        }, 'pointer', []);
+        Interceptor.replaceFast(testIntercept, testReplacement);
+        replacements.push(testReplacement);
+    }
+}
@@ -0,0 +1,135 @@
+import threading
+
+try:
+    import frida
+except ImportError:
+    frida = None
+
+EXIT_TIMEOUT = 600
+
+# Prepended to every script: forwards each record benchmark.c finishes, so
+# results arrive as messages instead of through stdout or the records file,
+# and the status the target passes to exit(), which a detach does not carry
+RECORD_PRELUDE = """
+Interceptor.attach(Process.mainModule.findExportByName('bench_record_hook'), {
+    onEnter: function (args) {
+        send({type: 'bench_record', line: args[0].readUtf8String()});
+    }
+});
+['exit', '_exit'].forEach(function (name) {
+    Interceptor.attach(Module.getGlobalExportByName(name), {
+        onEnter: function (args) {
+            send({type: 'bench_exit', status: args[0].toInt32()});
+        }
+    });
+});
+"""
+
+
+class PersistentDevice:
+    # One device handle for all launches of a worker process. Each (script,
+    # runtime) pair is compiled once, on the first session that needs it
+
+    def __init__(self):
+        self.device = frida.get_local_device()
+        self.compiled = {}
+        self.outputs = {}
+        self.lock = threading.Lock()
+        self.device.on('output', self._on_output)
+
+    def _on_output(self, pid, fd, data):
+        with self.lock:
+            if pid in self.outputs and data:
+                self.outputs[pid].append(data.decode(errors='replace'))
+
+    def _create_script(self, session, path, runtime):
+        key = (path, runtime)
+        if key not in self.compiled:
+            with open(path) as f:
+                source = RECORD_PRELUDE + f.read()
+            try:
+                self.compiled[key] = ('bytecode', session.compile_script(source, runtime=runtime))
+            except frida.NotSupportedError:
+                # V8 has no bytecode format and compiles the source on load
+                self.compiled[key] = ('source', source)
+        kind, code = self.compiled[key]
+        options = {'runtime': runtime} if runtime else {}
+        if kind == 'bytecode':
+            return session.create_script_from_bytes(code, **options)
+        return session.create_script(code, **options)
+
+    def launch(self, argv, env, script_path, runtime=None, timeout=EXIT_TIMEOUT):
+        """Spawn argv with the script loaded and wait for it to exit.
+
+        Returns (returncode, output, lines) like a CLI run, where lines are
+        the records benchmark.c wrote: returncode is the status the target
+        passed to exit(), or 1 if it crashed, was killed or hit a script error.
+        """
+        lines = []
+        errors = []
+        status = {}
+        detached = threading.Event()
+
+        def on_message(message, data):
+            if message['type'] == 'error':
+                errors.append(message.get('stack') or message.get('description', ''))
+                return
+            payload = message.get('payload')
+            if isinstance(payload, dict) and payload.get('type') == 'bench_record':
+                lines.append(payload['line'])
+            elif isinstance(payload, dict) and payload.get('type') == 'bench_exit':
+                # exit() ends in _exit(), so only the first status counts
+                status.setdefault('exit', payload['status'])
+
+        def on_detached(reason, crash):
+            status['reason'] = reason
+            status['crash'] = crash
+            detached.set()
+
+        try:
+            pid = self.device.spawn(argv, env=env, stdio='pipe')
+        except Exception as e:
+            return 1, str(e), lines
+        with self.lock:
+            self.outputs[pid] = []
+        try:
+            session = self.device.attach(pid)
+            session.on('detached', on_detached)
+            script = self._create_script(session, script_path, runtime)
+            script.on('message', on_message)
+            script.load()
+            self.device.resume(pid)
+            if not detached.wait(timeout):
+                self.device.kill(pid)
+                errors.append(f'target did not exit within {timeout} s')
+        except Exception as e:
+            # Frida raises its own error types for attach, compile and load failures
+            errors.append(str(e))
+            try:
+                self.device.kill(pid)
+            except Exception:
+                pass
+        finally:
+            with self.lock:
+                output = ''.join(self.outputs.pop(pid))
+
+        exit_status = status.get('exit')
+        if status.get('crash') is not None:
+            errors.append(str(status['crash']))
+        elif status.get('reason') not in (None, 'process-terminated'):
+            errors.append(f"session detached: {status['reason']}")
+        elif exit_status is None and not errors:
+            errors.append('target terminated without calling exit (crashed or killed by a signal)')
+        returncode = exit_status if exit_status else int(bool(errors))
+        return returncode, output + '\n'.join(errors), lines
+
+
+_device = None
+
+
+def shared_device():
+    # Created lazily so forked pool workers each open their own handle
+    global _device
+    if _device is None:
+        _device = PersistentDevice()
+    return _device
@@ -0,0 +1,11 @@
+var received = 0;
+// The main thread of the spawned benchmark has the process id as thread id
+Stalker.follow(Process.id, {
+    events: {
+        call: true
+    },
+    onReceive: function (events) {
+        received += events.byteLength;
+    }
+});
+console.log(`Stalker following thread ${Process.id} (call events)`);
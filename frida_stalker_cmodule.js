@@ -0,0 +1,23 @@
+const cm = new CModule(`
+#include <gum/gumstalker.h>
+static volatile gint blocks = 0;
+static void on_block(GumCpuContext *cpu_context, gpointer user_data) {
+    blocks++;
+}
+void transform(GumStalkerIterator *iterator, GumStalkerOutput *output, gpointer user_data) {
+    cs_insn *insn;
+    gboolean first = TRUE;
+    while (gum_stalker_iterator_next(iterator, &insn)) {
+        if (first) {
+            gum_stalker_iterator_put_callout(iterator, on_block, NULL, NULL);
+            first = FALSE;
+        }
+        gum_stalker_iterator_keep(iterator);
+    }
+}
+`);
+// The main thread of the spawned benchmark has the process id as thread id
+Stalker.follow(Process.id, {
+    transform: cm.transform
+});
+console.log(`Stalker following thread ${Process.id} (CModule transform)`);
@@ -0,0 +1,28 @@
+var BATCH_SIZE = 1000;
+var FLUSH_INTERVAL_MS = 50;
+var seq = 0;
+var batch = [];
+function flush() {
+    if (batch.length > 0) {
+        send({type: 'batch', records: batch});
+        batch = [];
+    }
+}
+var libfuncs = Process.findModuleByName('libfuncs.so');
+if (libfuncs) {
+    Interceptor.attach(libfuncs.findExportByName('compute_sum'), {
+        onEnter: function (args) {
+            batch.push([seq++, args[0].toInt32(), args[1].toInt32(), Date.now()]);
+            if (batch.length >= BATCH_SIZE) {
+                flush();
+            }
+        }
+    });
+}
+setInterval(flush, FLUSH_INTERVAL_MS);
+rpc.exports = {
+    dispose: function () {
+        flush();
+        send({type: 'summary', produced: seq, dropped: 0});
+    }
+};
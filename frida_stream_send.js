@@ -0,0 +1,14 @@
+var seq = 0;
+var libfuncs = Process.findModuleByName('libfuncs.so');
+if (libfuncs) {
+    Interceptor.attach(libfuncs.findExportByName('compute_sum'), {
+        onEnter: function (args) {
+            send({type: 'call', seq: seq++, a: args[0].toInt32(), b: args[1].toInt32(), t: Date.now()});
+        }
+    });
+}
+rpc.exports = {
+    dispose: function () {
+        send({type: 'summary', produced: seq, dropped: 0});
+    }
+};
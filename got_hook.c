@@ -0,0 +1,100 @@
+#define _GNU_SOURCE
+#include <dlfcn.h>
+#include <elf.h>
+#include <link.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <unistd.h>
+#define HOOK_MARKER "GOT_HOOKED"
+#include "hook_targets.h"
+// Injected with LD_PRELOAD but defines none of the hooked symbols: its
+// constructor rewrites the GOT slots every loaded object uses to reach them
+#if defined(__x86_64__)
+#define R_JUMP_SLOT R_X86_64_JUMP_SLOT
+#define R_GLOB_DAT R_X86_64_GLOB_DAT
+#elif defined(__aarch64__)
+#define R_JUMP_SLOT R_AARCH64_JUMP_SLOT
+#define R_GLOB_DAT R_AARCH64_GLOB_DAT
+#else
+#error "got_hook.c supports x86_64 and aarch64"
+#endif
+static int patched = 0;
+static void patch_slot(void** slot, void* value) {
+    long page = sysconf(_SC_PAGESIZE);
+    void* start = (void*)((uintptr_t)slot & ~(uintptr_t)(page - 1));
+    // Slots behind full RELRO are read-only by now
+    if (mprotect(start, page, PROT_READ | PROT_WRITE) != 0) {
+        perror("GOT hook: mprotect");
+        exit(1);
+    }
+    *slot = value;
+    patched++;
+}
+static void patch_relocations(uintptr_t base, const ElfW(Rela)* rela, size_t size, const ElfW(Sym)* symtab,
+                              const char* strtab) {
+    for (size_t i = 0; i < size / sizeof(ElfW(Rela)); i++) {
+        uint32_t type = ELF64_R_TYPE(rela[i].r_info);
+        if (type != R_JUMP_SLOT && type != R_GLOB_DAT) {
+            continue;
+        }
+        struct hook_target* target = find_hook_target(strtab + symtab[ELF64_R_SYM(rela[i].r_info)].st_name);
+        if (target) {
+            patch_slot((void**)(base + rela[i].r_offset), target->replacement);
+        }
+    }
+}
+static int patch_object(struct dl_phdr_info* info, size_t size, void* data) {
+    if (strstr(info->dlpi_name, "got_hook.so")) {
+        return 0;
+    }
+    uintptr_t base = info->dlpi_addr;
+    for (int p = 0; p < info->dlpi_phnum; p++) {
+        if (info->dlpi_phdr[p].p_type != PT_DYNAMIC) {
+            continue;
+        }
+        const ElfW(Sym)* symtab = NULL;
+        const char* strtab = NULL;
+        const ElfW(Rela)* jmprel = NULL;
+        const ElfW(Rela)* rela = NULL;
+        size_t jmprel_size = 0, rela_size = 0;
+        for (const ElfW(Dyn)* dyn = (const ElfW(Dyn)*)(base + info->dlpi_phdr[p].p_vaddr); dyn->d_tag != DT_NULL; dyn++) {
+            // glibc relocates these entries in place; an object it has not
+            // (the vDSO) still holds offsets from its base
+            uintptr_t ptr = dyn->d_un.d_ptr < base ? base + dyn->d_un.d_ptr : dyn->d_un.d_ptr;
+            switch (dyn->d_tag) {
+            case DT_SYMTAB: symtab = (const ElfW(Sym)*)ptr; break;
+            case DT_STRTAB: strtab = (const char*)ptr; break;
+            case DT_JMPREL: jmprel = (const ElfW(Rela)*)ptr; break;
+            case DT_PLTRELSZ: jmprel_size = dyn->d_un.d_val; break;
+            case DT_RELA: rela = (const ElfW(Rela)*)ptr; break;
+            case DT_RELASZ: rela_size = dyn->d_un.d_val; break;
+            }
+        }
+        if (!symtab || !strtab) {
+            continue;
+        }
+        if (jmprel) {
+            patch_relocations(base, jmprel, jmprel_size, symtab, strtab);
+        }
+        if (rela) {
+            patch_relocations(base, rela, rela_size, symtab, strtab);
+        }
+    }
+    return 0;
+}
+static void __attribute__((constructor)) init_got_hooks() {
+    for (size_t i = 0; i < HOOK_TARGET_COUNT; i++) {
+        if (!hook_targets[i].original) {
+            continue;
+        }
+        *hook_targets[i].original = dlsym(RTLD_DEFAULT, hook_targets[i].name);
+        if (!*hook_targets[i].original) {
+            fprintf(stderr, "ERROR: Failed to find %s: %s\n", hook_targets[i].name, dlerror());
+            exit(1);
+        }
+    }
+    dl_iterate_phdr(patch_object, NULL);
+    fprintf(stderr, "GOT hook: patched %d slots\n", patched);
+}
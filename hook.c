@@ -5,15 +5,39 @@
 #include <stdlib.h>
 #include <string.h>
 #include <stdio.h>
+#include <time.h>
 static int (*original_compute_sum)(int, int) = NULL;
 static int (*original_compute_sum_heavy)(int, int) = NULL;
 static int (*original_compute_sum_complex)(int, int) = NULL;
 static uint64_t (*original_factorial)(int) = NULL;
+static uint64_t (*original_recursive_sum)(int) = NULL;
 static int (*original_process_array)(int*, size_t, int*) = NULL;
 static int (*original_allocate_and_free)(size_t) = NULL;
 static const char* (*original_test_intercept)(void) = NULL;
+// Call counter shared by all hooks: the default is the original racy shared
+// int, -DHOOK_COUNTER_ATOMIC makes it an atomic add, -DHOOK_COUNTER_TLS gives
+// every thread its own copy
+#if defined(HOOK_COUNTER_ATOMIC)
+static int counter = 0;
+#define COUNT_CALL() __atomic_fetch_add(&counter, 1, __ATOMIC_RELAXED)
+#define COUNTER_VALUE() __atomic_load_n(&counter, __ATOMIC_RELAXED)
+#elif defined(HOOK_COUNTER_TLS)
+static __thread int counter = 0;
+#define COUNT_CALL() (counter++)
+#define COUNTER_VALUE() (counter)
+#else
 static volatile int counter = 0;
+#define COUNT_CALL() (counter++)
+#define COUNTER_VALUE() (counter)
+#endif
+int64_t hook_startup_ns[2];
+static int64_t monotonic_ns() {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (int64_t)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+}
 static void __attribute__((constructor)) init_hooks() {
+    hook_startup_ns[0] = monotonic_ns();
     fprintf(stderr, "LD_PRELOAD: Initializing hooks...\n");
     original_compute_sum = dlsym(RTLD_NEXT, "compute_sum");
     if (!original_compute_sum) {
@@ -35,6 +59,11 @@ static void __attribute__((constructor)) init_hooks() {
         fprintf(stderr, "ERROR: Failed to find factorial: %s\n", dlerror());
         exit(1);
     }
+    original_recursive_sum = dlsym(RTLD_NEXT, "recursive_sum");
+    if (!original_recursive_sum) {
+        fprintf(stderr, "ERROR: Failed to find recursive_sum: %s\n", dlerror());
+        exit(1);
+    }
     original_process_array = dlsym(RTLD_NEXT, "process_array");
     if (!original_process_array) {
         fprintf(stderr, "ERROR: Failed to find process_array: %s\n", dlerror());
@@ -51,14 +80,15 @@ static void __attribute__((constructor)) init_hooks() {
         exit(1);
     }
     fprintf(stderr, "LD_PRELOAD: All hooks initialized successfully\n");
+    hook_startup_ns[1] = monotonic_ns();
 }
 int compute_sum(int a, int b) {
-    counter++;
+    COUNT_CALL();
     original_compute_sum(a, b);
     return 0x42;
 }
 int compute_sum_heavy(int a, int b) {
-    counter++;
+    COUNT_CALL();
     original_compute_sum_heavy(a, b);
     return 0x42;
 }
@@ -90,7 +120,7 @@ static struct {
 static int cache_hits = 0;
 static int cache_misses = 0;
 int compute_sum_complex(int a, int b) {
-    counter++;
+    COUNT_CALL();
     uint32_t hash = 5381;
     int values[2] = {a, b};
     for (int i = 0; i < 2; i++) {
@@ -180,7 +210,7 @@ int compute_sum_complex(int a, int b) {
         }
     }
     int median = temp_array[10];
-    if (counter % 10000 == 0) {
+    if (COUNTER_VALUE() % 10000 == 0) {
         char buffer[256];
         snprintf(buffer, sizeof(buffer), "{\"cache_hits\":%d,\"cache_misses\":%d,\"sample_count\":%d}",
                  cache_hits, cache_misses, sample_count);
@@ -191,21 +221,26 @@ int compute_sum_complex(int a, int b) {
     return 0x42;
 }
 uint64_t factorial(int n) {
-    counter++;
+    COUNT_CALL();
     original_factorial(n);
     return 0x42;
 }
+uint64_t recursive_sum(int n) {
+    COUNT_CALL();
+    original_recursive_sum(n);
+    return 0x42;
+}
 int process_array(int* arr, size_t size, int* result) {
-    counter++;
+    COUNT_CALL();
     original_process_array(arr, size, result);
     return 0x42;
 }
 int allocate_and_free(size_t size) {
-    counter++;
+    COUNT_CALL();
     original_allocate_and_free(size);
     return 0x42;
 }
 const char* test_intercept() {
-    counter++;
+    COUNT_CALL();
     return "LD_PRELOAD_HOOKED";
 }
\ No newline at end of file
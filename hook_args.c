@@ -0,0 +1,34 @@
+#define _GNU_SOURCE
+#include <dlfcn.h>
+#include <stddef.h>
+#include <stdio.h>
+#include <stdlib.h>
+// LD_PRELOAD counterpart of the frida_args_*.js scripts: instead of only
+// counting, each hook reads the integer arguments of compute_sum, sums the
+// int buffer passed to process_array through its pointer and writes the
+// out-parameter itself. Return values are passed through unchanged
+static int (*original_compute_sum)(int, int) = NULL;
+static int (*original_process_array)(int*, size_t, int*) = NULL;
+static volatile int sink = 0;
+static void __attribute__((constructor)) init_hooks() {
+    original_compute_sum = dlsym(RTLD_NEXT, "compute_sum");
+    original_process_array = dlsym(RTLD_NEXT, "process_array");
+    if (!original_compute_sum || !original_process_array) {
+        fprintf(stderr, "ERROR: Failed to find compute_sum/process_array: %s\n", dlerror());
+        exit(1);
+    }
+    fprintf(stderr, "LD_PRELOAD: argument hooks installed\n");
+}
+int compute_sum(int a, int b) {
+    sink = a ^ b;
+    return original_compute_sum(a, b);
+}
+int process_array(int* arr, size_t size, int* result) {
+    int ret = original_process_array(arr, size, result);
+    int sum = 0;
+    for (size_t i = 0; i < size; i++) {
+        sum += arr[i];
+    }
+    *result = sum;
+    return ret;
+}
@@ -0,0 +1,81 @@
+#ifndef HOOK_TARGETS_H
+#define HOOK_TARGETS_H
+// Replacement bodies shared by the hookers that do not rely on symbol
+// interposition (audit.c, got_hook.c, inline_hook.c). Like hook.c each one
+// counts the call, runs the original and returns 0x42; the including file
+// defines HOOK_MARKER and fills in the original_* pointers
+#include <stdint.h>
+#include <stddef.h>
+#include <string.h>
+static int (*original_compute_sum)(int, int) = NULL;
+static int (*original_compute_sum_heavy)(int, int) = NULL;
+static int (*original_compute_sum_complex)(int, int) = NULL;
+static uint64_t (*original_factorial)(int) = NULL;
+static uint64_t (*original_recursive_sum)(int) = NULL;
+static int (*original_process_array)(int*, size_t, int*) = NULL;
+static int (*original_allocate_and_free)(size_t) = NULL;
+static volatile int counter = 0;
+static int replacement_compute_sum(int a, int b) {
+    counter++;
+    original_compute_sum(a, b);
+    return 0x42;
+}
+static int replacement_compute_sum_heavy(int a, int b) {
+    counter++;
+    original_compute_sum_heavy(a, b);
+    return 0x42;
+}
+static int replacement_compute_sum_complex(int a, int b) {
+    counter++;
+    original_compute_sum_complex(a, b);
+    return 0x42;
+}
+static uint64_t replacement_factorial(int n) {
+    counter++;
+    original_factorial(n);
+    return 0x42;
+}
+static uint64_t replacement_recursive_sum(int n) {
+    counter++;
+    original_recursive_sum(n);
+    return 0x42;
+}
+static int replacement_process_array(int* arr, size_t size, int* result) {
+    counter++;
+    original_process_array(arr, size, result);
+    return 0x42;
+}
+static int replacement_allocate_and_free(size_t size) {
+    counter++;
+    original_allocate_and_free(size);
+    return 0x42;
+}
+static const char* replacement_test_intercept() {
+    counter++;
+    return HOOK_MARKER;
+}
+struct hook_target {
+    const char* name;
+    void* replacement;
+    void** original;
+};
+static struct hook_target hook_targets[] = {
+    {"compute_sum", (void*)replacement_compute_sum, (void**)&original_compute_sum},
+    {"compute_sum_heavy", (void*)replacement_compute_sum_heavy, (void**)&original_compute_sum_heavy},
+    {"compute_sum_complex", (void*)replacement_compute_sum_complex, (void**)&original_compute_sum_complex},
+    {"factorial", (void*)replacement_factorial, (void**)&original_factorial},
+    {"recursive_sum", (void*)replacement_recursive_sum, (void**)&original_recursive_sum},
+    {"process_array", (void*)replacement_process_array, (void**)&original_process_array},
+    {"allocate_and_free", (void*)replacement_allocate_and_free, (void**)&original_allocate_and_free},
+    {"test_intercept", (void*)replacement_test_intercept, NULL},
+};
+#define HOOK_TARGET_COUNT (sizeof(hook_targets) / sizeof(hook_targets[0]))
+static struct hook_target* find_hook_target(const char* name) {
+    for (size_t i = 0; i < HOOK_TARGET_COUNT; i++) {
+        if (strcmp(hook_targets[i].name, name) == 0) {
+            return &hook_targets[i];
+        }
+    }
+    return NULL;
+}
+#endif
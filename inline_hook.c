@@ -0,0 +1,177 @@
+#define _GNU_SOURCE
+#include <dlfcn.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <unistd.h>
+#define HOOK_MARKER "INLINE_HOOKED"
+#include "hook_targets.h"
+// Injected with LD_PRELOAD but defines none of the hooked symbols: its
+// constructor overwrites the first instructions of each target with a 5-byte
+// jmp rel32 to a relay next to the library. The relay jumps to the hook; the
+// original is reached through a trampoline holding the displaced instructions
+// followed by a jump back. Only the small x86-64 subset compilers emit in
+// prologues is decoded, and a target starting with anything else is an error
+#if !defined(__x86_64__)
+#error "inline_hook.c supports x86_64 only"
+#endif
+#define JMP_REL32_LEN 5
+#define JMP_ABS_LEN 14
+#define MAX_STOLEN 32
+#define SLOT_LEN 128
+// One slot per target in a page within +-2 GB of the library: the relay
+// (jmp [rip+0]; .quad hook) followed by the trampoline
+static uint8_t* slots = NULL;
+static void write_jmp_abs(uint8_t* at, const void* to) {
+    at[0] = 0xff;
+    at[1] = 0x25;
+    memset(at + 2, 0, 4);
+    memcpy(at + 6, &to, sizeof(to));
+}
+static int fits_rel32(intptr_t delta) {
+    return delta >= INT32_MIN && delta <= INT32_MAX;
+}
+// Length of the instruction at code, or 0 if it is not in the supported
+// subset. *rel is set to the offset of a rip-relative 32-bit field, or -1
+static size_t instruction_length(const uint8_t* code, int* rel) {
+    const uint8_t* p = code;
+    int rex_w = 0;
+    int opsize16 = 0;
+    *rel = -1;
+    while (*p == 0x66 || *p == 0xf2 || *p == 0xf3) {
+        opsize16 |= *p == 0x66;
+        p++;
+    }
+    if (p[0] == 0x0f && p[1] == 0x1e && p[2] == 0xfa) {
+        return p + 3 - code;  // endbr64
+    }
+    if ((*p & 0xf0) == 0x40) {
+        rex_w = (*p & 0x08) != 0;
+        p++;
+    }
+    uint8_t op = *p++;
+    int modrm = 0;
+    size_t imm = 0;
+    if (op >= 0x50 && op <= 0x5f) {
+        return p - code;  // push/pop reg
+    } else if (op >= 0xb8 && op <= 0xbf) {
+        return p + (rex_w ? 8 : 4) - code;  // mov reg, imm
+    } else if (op == 0xe8 || op == 0xe9) {
+        *rel = p - code;  // call/jmp rel32
+        return p + 4 - code;
+    } else if (op == 0x0f && *p == 0x1f) {
+        p++;
+        modrm = 1;  // nop r/m
+    } else if (op == 0x01 || op == 0x03 || op == 0x09 || op == 0x0b || op == 0x21 || op == 0x23 ||
+               op == 0x29 || op == 0x2b || op == 0x31 || op == 0x33 || op == 0x39 || op == 0x3b ||
+               op == 0x63 || op == 0x85 || op == 0x89 || op == 0x8b || op == 0x8d) {
+        modrm = 1;  // ALU, test, mov, movslq and lea between a register and r/m
+    } else if (op == 0x83 || op == 0xc6) {
+        modrm = 1;
+        imm = 1;
+    } else if (op == 0x81 || op == 0xc7) {
+        modrm = 1;
+        imm = opsize16 ? 2 : 4;
+    } else {
+        return 0;
+    }
+    if (modrm) {
+        uint8_t m = *p++;
+        uint8_t mod = m >> 6;
+        uint8_t rm = m & 7;
+        if (mod != 3 && rm == 4) {
+            p++;  // SIB
+        }
+        if (mod == 0 && rm == 5) {
+            *rel = p - code;
+            p += 4;
+        } else if (mod == 1) {
+            p += 1;
+        } else if (mod == 2) {
+            p += 4;
+        }
+    }
+    return p + imm - code;
+}
+static uint8_t* alloc_near(const void* target, size_t size) {
+    long page = sysconf(_SC_PAGESIZE);
+    uintptr_t origin = (uintptr_t)target & ~(uintptr_t)(page - 1);
+    for (uintptr_t distance = 1 << 20; distance < (1UL << 31) - size; distance += 1 << 20) {
+        uintptr_t candidates[2] = {origin - distance, origin + distance};
+        for (int c = 0; c < 2; c++) {
+            void* at = mmap((void*)candidates[c], size, PROT_READ | PROT_WRITE | PROT_EXEC,
+                            MAP_PRIVATE | MAP_ANONYMOUS | MAP_FIXED_NOREPLACE, -1, 0);
+            if (at != MAP_FAILED) {
+                return at;
+            }
+        }
+    }
+    return NULL;
+}
+static void install_hook(struct hook_target* target, uint8_t* code, uint8_t* slot) {
+    uint8_t* relay = slot;
+    uint8_t* trampoline = slot + JMP_ABS_LEN;
+    write_jmp_abs(relay, target->replacement);
+
+    size_t stolen = 0;
+    while (stolen < JMP_REL32_LEN) {
+        int rel;
+        size_t len = instruction_length(code + stolen, &rel);
+        if (len == 0 || stolen + len > MAX_STOLEN) {
+            fprintf(stderr, "ERROR: Inline hook cannot relocate %s+%zu (byte 0x%02x)\n",
+                    target->name, stolen, code[stolen]);
+            exit(1);
+        }
+        memcpy(trampoline + stolen, code + stolen, len);
+        if (rel >= 0) {
+            // Re-aim the rip-relative field from the copy at the same target
+            int32_t disp;
+            memcpy(&disp, code + stolen + rel, 4);
+            intptr_t to = (intptr_t)(code + stolen + len) + disp;
+            intptr_t moved = to - (intptr_t)(trampoline + stolen + len);
+            if (!fits_rel32(moved)) {
+                fprintf(stderr, "ERROR: Inline hook trampoline for %s out of rel32 range\n", target->name);
+                exit(1);
+            }
+            disp = (int32_t)moved;
+            memcpy(trampoline + stolen + rel, &disp, 4);
+        }
+        stolen += len;
+    }
+    write_jmp_abs(trampoline + stolen, code + stolen);
+    if (target->original) {
+        *target->original = trampoline;
+    }
+
+    long page = sysconf(_SC_PAGESIZE);
+    uint8_t* start = (uint8_t*)((uintptr_t)code & ~(uintptr_t)(page - 1));
+    size_t span = (code + JMP_REL32_LEN > start + page) ? 2 * page : page;
+    if (mprotect(start, span, PROT_READ | PROT_WRITE | PROT_EXEC) != 0) {
+        perror("Inline hook: mprotect");
+        exit(1);
+    }
+    int32_t jump = (int32_t)((intptr_t)relay - (intptr_t)(code + JMP_REL32_LEN));
+    code[0] = 0xe9;
+    memcpy(code + 1, &jump, 4);
+    mprotect(start, span, PROT_READ | PROT_EXEC);
+}
+static void __attribute__((constructor)) init_inline_hooks() {
+    for (size_t i = 0; i < HOOK_TARGET_COUNT; i++) {
+        uint8_t* code = dlsym(RTLD_DEFAULT, hook_targets[i].name);
+        if (!code) {
+            fprintf(stderr, "ERROR: Failed to find %s: %s\n", hook_targets[i].name, dlerror());
+            exit(1);
+        }
+        if (!slots) {
+            // Every target lives in libfuncs.so, so one page near the first serves all
+            slots = alloc_near(code, HOOK_TARGET_COUNT * SLOT_LEN);
+            if (!slots) {
+                fprintf(stderr, "ERROR: Inline hook found no free page within rel32 range\n");
+                exit(1);
+            }
+        }
+        install_hook(&hook_targets[i], code, slots + i * SLOT_LEN);
+    }
+    fprintf(stderr, "Inline hook: patched %zu functions\n", HOOK_TARGET_COUNT);
+}
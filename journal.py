@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import json
+import os
+import sys
+import time
+
+JOURNAL_JSON = 'results/journal.json'
+STATUSES = ('pending', 'running', 'done', 'failed', 'hook_failure')
+# Outcomes a resumed campaign does not run again
+FINAL_STATUSES = ('done', 'hook_failure')
+ERROR_CHARS = 2000
+
+
+class Journal:
+    # Status of every planned cell, keyed by campaign kind (which results table
+    # the cell feeds), method and iteration. The file is only ever replaced
+    # whole through os.replace, so a crash leaves either the previous or the
+    # new version and never a partial one
+
+    def __init__(self, path=JOURNAL_JSON):
+        self.path = path
+        self.cells = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.cells = json.load(f)
+        # A cell still marked running belongs to a campaign that died before
+        # storing its result
+        for cell in self.cells.values():
+            if cell['status'] == 'running':
+                cell['status'] = 'pending'
+
+    @staticmethod
+    def key(kind, method, iteration):
+        return f'{kind}/{method}/{iteration}'
+
+    def get(self, kind, method, iteration):
+        return self.cells.get(self.key(kind, method, iteration), {})
+
+    def status(self, kind, method, iteration):
+        return self.get(kind, method, iteration).get('status')
+
+    def mark(self, kind, cells, status, run_id=None, error=None):
+        """Set the status of (method name, iteration) cells and save once."""
+        if status not in STATUSES:
+            raise ValueError(f'unknown cell status {status!r}')
+        now = time.strftime('%Y-%m-%dT%H:%M:%S')
+        for method, iteration in cells:
+            cell = self.cells.setdefault(self.key(kind, method, iteration), {'status': 'pending', 'attempts': 0})
+            if status == 'running':
+                cell['attempts'] += 1
+            cell['status'] = status
+            cell['updated'] = now
+            if run_id:
+                cell['run_id'] = run_id
+            if error is not None:
+                cell['error'] = error[-ERROR_CHARS:]
+        self.save()
+
+    def save(self):
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = os.path.join(directory, f'.{os.path.basename(self.path)}.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.cells, f, indent=1, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def counts(self, kind=None):
+        counts = {}
+        for key, cell in self.cells.items():
+            if kind is None or key.startswith(f'{kind}/'):
+                counts[cell['status']] = counts.get(cell['status'], 0) + 1
+        return counts
+
+
+def main():
+    journal = Journal(sys.argv[1] if len(sys.argv) > 1 else JOURNAL_JSON)
+    for kind in sorted({key.split('/', 1)[0] for key in journal.cells}):
+        counts = journal.counts(kind)
+        print(f"{kind}: " + ', '.join(f"{counts[s]} {s}" for s in STATUSES if s in counts))
+    for key, cell in sorted(journal.cells.items()):
+        if cell['status'] in ('pending', 'failed'):
+            print(f"  {key}: {cell['status']} after {cell['attempts']} attempt(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
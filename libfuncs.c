@@ -9,10 +9,14 @@ int compute_sum(int a, int b) {
     temp += b;
     return temp;
 }
+static volatile int heavy_work_factor = 100;
+void set_heavy_work_factor(int factor) {
+    heavy_work_factor = factor;
+}
 __attribute__((noinline))
 int compute_sum_heavy(int a, int b) {
     volatile int result = 0;
-    for (int i = 0; i < 100; i++) {
+    for (int i = 0; i < heavy_work_factor; i++) {
         result += i * i;
         result ^= (result << 1);
     }
@@ -23,6 +27,18 @@ uint64_t factorial(int n) {
     if (n <= 1) return 1;
     return n * factorial(n - 1);
 }
+// Sum of 1..n with one real call per level, exact at any depth the stack
+// holds. The compiler turns factorial into a loop and would call a direct
+// self-reference without the PLT, so the recursion loads the exported
+// symbol's address from its GOT slot (a GLOB_DAT relocation). Interposition,
+// GOT patching and body patching hook every level; LD_AUDIT only binds PLT
+// calls and sees the outermost frame alone
+__attribute__((noinline))
+uint64_t recursive_sum(int n) {
+    if (n <= 1) return n;
+    uint64_t (*volatile self)(int) = recursive_sum;
+    return (uint64_t)n + self(n - 1);
+}
 __attribute__((noinline))
 int process_array(int* arr, size_t size, int* result) {
     *result = 0;
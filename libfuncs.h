@@ -6,7 +6,9 @@ int compute_sum(int a, int b);
 int compute_sum_heavy(int a, int b);
 int compute_sum_complex(int a, int b);
 uint64_t factorial(int n);
+uint64_t recursive_sum(int n);
 int process_array(int* arr, size_t size, int* result);
 int allocate_and_free(size_t size);
 const char* test_intercept();
+void set_heavy_work_factor(int factor);
 #endif
\ No newline at end of file
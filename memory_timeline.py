@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+import argparse
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+import results_store
+from plot import colors, grid_color
+
+TIMELINE_CHART = 'results/performance_memory_timeline.png'
+COMPONENTS = [
+    ('target_kb', 'Target (baseline RSS)', '#00ff41'),
+    ('agent_kb', 'Agent code and data', '#ff006e'),
+    ('jit_kb', 'Trampolines / JIT (rwx + anon exec)', '#ffd700'),
+    ('runtime_kb', 'Runtime heap (V8/QJS) and rest', '#00b4d8'),
+]
+
+
+def load_samples(methods=None):
+    df = results_store.load_table(results_store.MEMORY_DIR)
+    if df.empty:
+        raise SystemExit(f"No memory samples in {results_store.MEMORY_DIR}; run runner.py --memory MS first")
+    if methods:
+        df = df[df['method'].isin(methods)]
+    return df
+
+
+def breakdown(df, baseline='baseline'):
+    # Split the RSS at each phase boundary (median over runs) into what the
+    # uninstrumented target holds at the same point and what the hooking
+    # method adds on top: agent mappings, executable anonymous memory, and the
+    # remaining anonymous growth, which for Frida is mostly the script runtime
+    marks = df[df['label'] != 'timer']
+    medians = marks.groupby(['method', 'label'], sort=False).median(numeric_only=True).reset_index()
+    base = medians[medians['method'] == baseline].set_index('label')['rss_kb']
+    rows = []
+    for row in medians.itertuples():
+        target = min(row.rss_kb, base.get(row.label, row.rss_kb))
+        jit = row.rwx_kb + row.anon_exec_kb
+        rows.append({
+            'method': row.method,
+            'label': row.label,
+            'rss_kb': row.rss_kb,
+            'pss_kb': row.pss_kb,
+            'target_kb': target,
+            'agent_kb': row.agent_kb,
+            'jit_kb': jit,
+            'runtime_kb': max(0.0, row.rss_kb - target - row.agent_kb - jit),
+        })
+    return pd.DataFrame(rows)
+
+
+def print_report(result):
+    print("\n" + "="*80)
+    print("MEMORY BREAKDOWN AT PHASE BOUNDARIES (median KB)")
+    print("="*80)
+    for method, rows in result.groupby('method', sort=False):
+        print(f"\n{method}:")
+        print("-" * 50)
+        print(f"  {'after':14s}{'rss':>9s}{'pss':>9s}{'target':>9s}{'agent':>9s}{'jit':>9s}{'runtime':>9s}")
+        for row in rows.itertuples():
+            print(f"  {row.label:14s}{row.rss_kb:9.0f}{row.pss_kb:9.0f}{row.target_kb:9.0f}{row.agent_kb:9.0f}"
+                  f"{row.jit_kb:9.0f}{row.runtime_kb:9.0f}")
+
+
+def plot_timeline(df, result, output_file=TIMELINE_CHART):
+    methods = list(result['method'].unique())
+    fig, (ax_time, ax_split) = plt.subplots(1, 2, figsize=(18, 7), gridspec_kw={'width_ratios': [3, 2]})
+
+    for method in methods:
+        color = colors.get(method, '#cccccc')
+        for n, (_, run) in enumerate(df[df['method'] == method].groupby(['run_id', 'iteration'])):
+            run = run.sort_values('t_ns')
+            t = run['t_ns'] / 1e9
+            ax_time.plot(t, run['rss_kb'] / 1024, color=color, alpha=0.7, linewidth=1.2,
+                         label=method if n == 0 else None)
+            marks = run[run['label'] != 'timer']
+            ax_time.scatter(marks['t_ns'] / 1e9, marks['rss_kb'] / 1024, color=color, s=18, zorder=3)
+    ax_time.set_xlabel('Time since start (s)', fontsize=12)
+    ax_time.set_ylabel('RSS (MB)', fontsize=12)
+    ax_time.set_title('RSS Timeline (dots: phase boundaries)', fontsize=14, fontweight='bold', pad=15)
+    ax_time.legend(fontsize=9, facecolor='#1a1a1a')
+
+    # Stacked split after the last phase, where everything the method allocates is live
+    final = result.groupby('method', sort=False).tail(1)
+    x_pos = np.arange(len(final))
+    bottom = np.zeros(len(final))
+    for column, label, color in COMPONENTS:
+        values = final[column].to_numpy() / 1024
+        ax_split.bar(x_pos, values, bottom=bottom, color=color, alpha=0.8, label=label,
+                     edgecolor='white', linewidth=0.5)
+        bottom += values
+    ax_split.set_xticks(x_pos)
+    ax_split.set_xticklabels(final['method'], rotation=45, ha='right', fontsize=9)
+    ax_split.set_ylabel('Resident memory (MB)', fontsize=12)
+    ax_split.set_title('Resident Memory After the Last Phase', fontsize=14, fontweight='bold', pad=15)
+    ax_split.legend(fontsize=8, facecolor='#1a1a1a')
+
+    for ax in (ax_time, ax_split):
+        ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+    plt.tight_layout()
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.savefig(output_file, dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Plot the memory timelines recorded with runner.py --memory and '
+                                                 'split each method into target, agent, JIT and runtime heap')
+    parser.add_argument('--methods', help='comma-separated subset of methods')
+    parser.add_argument('--baseline', default='baseline', help='method whose RSS counts as the target itself')
+    parser.add_argument('--chart', default=TIMELINE_CHART)
+    args = parser.parse_args()
+
+    df = load_samples(args.methods.split(',') if args.methods else None)
+    result = breakdown(df, args.baseline)
+    print_report(result)
+    plot_timeline(df, result, args.chart)
+    print(f"\nSaved {args.chart}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
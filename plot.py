@@ -1,16 +1,34 @@
 #!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
-plt.style.use('dark_background')
+from bench_stats import (STARTUP_STAGES, cached, compute_counter_summary, density_summary, depth_summary,
+                         fit_hook_cost, method_stats, scaling_summary, startup_breakdown, stream_summary, summarize,
+                         warmup_summary)
+from results_store import (CHUNKS_DIR, DENSITY_DIR, DEPTH_DIR, SCALING_DIR, STARTUP_DIR, STREAM_DIR, SWEEP_DIR,
+                           load_counter_frame, load_table, load_timing_frames)
 
-df_timing = pd.read_csv('results/results.csv')
-df_memory = pd.read_csv('results/memory.csv')
+plt.style.use('dark_background')
 
 colors = {
     'baseline': '#00ff41',
     'ldpreload': '#00b4d8',
+    'ldaudit': '#4361ee',
+    'got_hook': '#3a86ff',
+    'inline_hook': '#8ecae6',
+    'uprobe': '#fb8500',
+    'uprobe_ret': '#ffb703',
     'frida_onenter_v8': '#ff4081',
     'frida_onenter_qjs': '#ff69b4',
     'frida_onleave_v8': '#ff6b35',
@@ -22,44 +40,81 @@ colors = {
     'baseline_complex': '#32cd32',
     'ldpreload_complex': '#1e90ff',
     'frida_complex_v8': '#ff4500',
-    'frida_complex_qjs': '#9932cc'
+    'frida_complex_qjs': '#9932cc',
+    'ldpreload_atomic': '#48cae4',
+    'ldpreload_tls': '#0077b6',
+    'frida_onenter_perthread_v8': '#c71585',
+    'frida_cmodule_atomic': '#ffea00',
+    'frida_cmodule_perthread': '#b8860b',
+    'frida_stalker_block': '#7fffd4',
+    'frida_stalker_call': '#40e0d0',
+    'frida_stalker_cmodule': '#20b2aa',
+    'frida_replace_v8': '#9d4edd',
+    'frida_replace_qjs': '#c77dff',
+    'frida_replace_cmodule_v8': '#f4a261',
+    'frida_replace_cmodule_qjs': '#e9c46a',
+    'frida_replacefast_v8': '#7209b7',
+    'frida_replacefast_qjs': '#b5179e',
+    'ldpreload_args': '#0096c7',
+    'frida_args_none_v8': '#ff8fab',
+    'frida_args_readbytearray_v8': '#f15bb5',
+    'frida_args_wrap_v8': '#fee440',
+    'frida_args_pointer_v8': '#ef476f',
+    'frida_args_none_qjs': '#ffc2d1',
+    'frida_args_readbytearray_qjs': '#d81159',
+    'frida_args_wrap_qjs': '#ffbe0b',
+    'frida_args_pointer_qjs': '#8f2d56',
+    'frida_args_cmodule': '#e6b800',
+    'frida_density_v8': '#ff5d8f',
+    'frida_density_qjs': '#ff9e00',
+    'frida_density_cmodule': '#ffdd00'
 }
 
 grid_color = '#2a2a2a'
 
+RENDER_MANIFEST = 'results/.cache/render-manifest.json'
+HISTOGRAMS_JSONL = 'results/histograms.jsonl'
+
+timing_summary = None
+memory_summary = None
+counter_summary = None
+startup_data = None
+scaling_data = None
+sweep_data = None
+stream_data = None
+chunk_data = None
+depth_data = None
+density_data = None
+
+def load_data(exclude_noisy=False):
+    global timing_summary, memory_summary, counter_summary, startup_data, scaling_data, sweep_data, stream_data
+    global chunk_data, depth_data, density_data
+    df_timing, df_memory = load_timing_frames(methods=list(colors), exclude_noisy=exclude_noisy)
+    timing_summary, memory_summary = summarize(df_timing, df_memory)
+    if os.path.isdir('results/store'):
+        counter_summary = cached('counters', load_counter_frame(methods=list(colors)), compute_counter_summary)
+    else:
+        counter_summary = pd.DataFrame(columns=['Method', 'Function'])
+    startup_data = load_table(STARTUP_DIR)
+    scaling_data = load_table(SCALING_DIR)
+    sweep_data = load_table(SWEEP_DIR)
+    stream_data = load_table(STREAM_DIR)
+    chunk_data = load_table(CHUNKS_DIR)
+    depth_data = load_table(DEPTH_DIR)
+    density_data = load_table(DENSITY_DIR)
+
 def plot_function_performance(func_name, title, output_file):
-    ERROR_MARGIN_THRESHOLD = 5.0
     fig, ax = plt.subplots(figsize=(10, 8))
     
-    func_data = df_timing[df_timing['Function'] == func_name]
-    
-    stats = []
-    methods = []
     method_order = ['baseline', 'ldpreload', 'frida_onenter_v8', 'frida_onleave_v8', 'frida_both_v8', 'frida_cmodule', 'frida_complex']
-    
-    for method in method_order:
-        method_data = func_data[func_data['Method'] == method]['Time_us']
-        if len(method_data) > 0:
-            q1, median, q3 = method_data.quantile([0.25, 0.5, 0.75])
-            iqr = q3 - q1
-            min_val = method_data.min()
-            max_val = method_data.max()
-            stats.append({
-                'median': median,
-                'q1': q1,
-                'q3': q3,
-                'iqr': iqr,
-                'min': min_val,
-                'max': max_val,
-                'method': method
-            })
-            methods.append(method)
+    stats = method_stats(timing_summary, method_order, func_name)
+    methods = [s['method'] for s in stats]
     
     if stats:
         x_pos = np.arange(len(stats))
         medians = [s['median'] for s in stats]
-        yerr_lower = [s['median'] - s['q1'] for s in stats]
-        yerr_upper = [s['q3'] - s['median'] for s in stats]
+        yerr_lower = [s['median'] - s['ci_low'] for s in stats]
+        yerr_upper = [s['ci_high'] - s['median'] for s in stats]
         yerr = [yerr_lower, yerr_upper]
         bar_colors = [colors[s['method']] for s in stats]
         
@@ -97,24 +152,16 @@ def plot_function_performance(func_name, title, output_file):
         
         baseline_median = next(s['median'] for s in stats if s['method'] == 'baseline')
         
-        num_calls = {
-            'hot_path': 1000000,
-            'heavy_work': 1000000,
-            'recursive': 1000000,
-            'array_ops': 100000,
-            'memory_ops': 1000000
-        }.get(func_name, 1000000)
-        
         for bar, stat in zip(bars, stats):
             height = bar.get_height()
             
             if stat['method'] == 'baseline':
-                label = f"{stat['median']:.1f}μs\n[{stat['q1']:.0f}-{stat['q3']:.0f}]"
+                label = f"{stat['median']:.1f}μs\n[{stat['ci_low']:.0f}-{stat['ci_high']:.0f}]"
                 overhead_label = "(baseline)"
             else:
-                overhead_pct = ((stat['median'] - baseline_median) / baseline_median * 100) if baseline_median > 0 else 0
-                overhead_per_call_us = (stat['median'] - baseline_median) / num_calls
-                label = f"{stat['median']:.1f}μs\n[{stat['q1']:.0f}-{stat['q3']:.0f}]"
+                overhead_pct = stat['overhead_pct']
+                overhead_per_call_us = stat['overhead_ns_per_call'] / 1000
+                label = f"{stat['median']:.1f}μs\n[{stat['ci_low']:.0f}-{stat['ci_high']:.0f}]"
                 if overhead_per_call_us < 1:
                     overhead_per_call_ns = overhead_per_call_us * 1000
                     overhead_label = f"+{overhead_pct:.1f}%\n({overhead_per_call_ns:.1f}ns/call)"
@@ -122,7 +169,7 @@ def plot_function_performance(func_name, title, output_file):
                     overhead_label = f"+{overhead_pct:.1f}%\n({overhead_per_call_us:.3f}μs/call)"
             
             va = 'bottom'
-            y_offset = (stat['q3'] if stat['q3'] > 0 else stat['median']) * 1.15
+            y_offset = (stat['ci_high'] if stat['ci_high'] > 0 else stat['median']) * 1.15
             
             ax.text(bar.get_x() + bar.get_width()/2, y_offset,
                    label, ha='center', va=va, 
@@ -133,17 +180,16 @@ def plot_function_performance(func_name, title, output_file):
                        overhead_label, ha='center', va=va,
                        fontsize=7, color='#ffccaa')
         
-        y_min = max(1, min([s['q1'] for s in stats]) * 0.8)
-        y_max = max([s['q3'] for s in stats]) * 5
+        y_min = max(1, min([s['ci_low'] for s in stats]) * 0.8)
+        y_max = max([s['ci_high'] for s in stats]) * 5
         
         ax.set_ylim(y_min, y_max)
         
-        baseline_median = next(s['median'] for s in stats if s['method'] == 'baseline')
-        ax.axhline(y=baseline_median, color='#00ff41', linestyle='--', linewidth=1, alpha=0.3, label='Baseline median')
+        baseline_stat = next(s for s in stats if s['method'] == 'baseline')
+        ax.axhline(y=baseline_stat['median'], color='#00ff41', linestyle='--', linewidth=1, alpha=0.3, label='Baseline median')
         
-        error_margin = baseline_median * (ERROR_MARGIN_THRESHOLD / 100)
-        ax.axhspan(baseline_median - error_margin, baseline_median + error_margin, 
-                  color='yellow', alpha=0.1, label=f'±{ERROR_MARGIN_THRESHOLD}% noise zone')
+        ax.axhspan(baseline_stat['ci_low'], baseline_stat['ci_high'],
+                  color='yellow', alpha=0.1, label='Baseline 95% CI')
     
     fig.patch.set_facecolor('#0d0d0d')
     plt.tight_layout()
@@ -151,7 +197,7 @@ def plot_function_performance(func_name, title, output_file):
     plt.close()
     print(f"Saved: {output_file}")
 
-functions = [
+FUNCTION_CHARTS = [
     ('hot_path', 'Hot Path Performance (1M calls)', 'results/performance_hot_path.png'),
     ('heavy_work', 'Heavy Work Performance (1M calls)', 'results/performance_heavy_work.png'),
     ('recursive', 'Recursive Performance (1M calls)', 'results/performance_recursive.png'),
@@ -159,53 +205,31 @@ functions = [
     ('memory_ops', 'Memory Operations Performance (1M calls)', 'results/performance_memory_ops.png')
 ]
 
-for func_name, title, output_file in functions:
-    plot_function_performance(func_name, title, output_file)
+def runtime_stats():
+    method_order_runtime = ['baseline', 'ldpreload', 'onenter_v8', 'onenter_qjs', 'onleave_v8', 'onleave_qjs', 'both_v8', 'both_qjs']
+    stats_runtime = []
+    for method in method_order_runtime:
+        key = method if method in ['baseline', 'ldpreload'] else f'frida_{method}'
+        for stat in method_stats(timing_summary, [key], 'hot_path'):
+            stats_runtime.append({
+                'median': 0 if method == 'baseline' else stat['overhead_us'],
+                'ci_lower': 0 if method == 'baseline' else stat['overhead_us'] - stat['overhead_ci_low'],
+                'ci_upper': 0 if method == 'baseline' else stat['overhead_ci_high'] - stat['overhead_us'],
+                'method': method,
+                'original_median': stat['median'],
+                'original_ci': (stat['ci_low'], stat['ci_high'])
+            })
+    return stats_runtime, [s['method'] for s in stats_runtime]
 
 def plot_runtime_comparison():
-    ERROR_MARGIN_THRESHOLD = 5.0
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    func_data = df_timing[df_timing['Function'] == 'hot_path']
-    
-    baseline_data = func_data[func_data['Method'] == 'baseline']['Time_us']
-    baseline_median = baseline_data.median() if len(baseline_data) > 0 else 0
-    
-    stats_runtime = []
-    methods_runtime = []
-    method_order_runtime = ['baseline', 'ldpreload', 'onenter_v8', 'onenter_qjs', 'onleave_v8', 'onleave_qjs', 'both_v8', 'both_qjs']
-    
-    for method in method_order_runtime:
-        if method in ['baseline', 'ldpreload']:
-            method_data = func_data[func_data['Method'] == method]['Time_us']
-        else:
-            frida_method = f'frida_{method}'
-            method_data = func_data[func_data['Method'] == frida_method]['Time_us']
-        
-        if len(method_data) > 0:
-            if method == 'baseline':
-                stats_runtime.append({
-                    'median': 0,
-                    'iqr': 0,
-                    'method': method,
-                    'original_median': method_data.median()
-                })
-            else:
-                q1, q3 = method_data.quantile([0.25, 0.75])
-                iqr = q3 - q1
-                stats_runtime.append({
-                    'median': method_data.median() - baseline_median,
-                    'iqr': iqr,
-                    'method': method,
-                    'original_median': method_data.median()
-                })
-            methods_runtime.append(method)
+    stats_runtime, methods_runtime = runtime_stats()
     
     if stats_runtime:
         x_pos = np.arange(len(stats_runtime))
         medians = [s['median'] for s in stats_runtime]
-        iqrs = [s['iqr'] for s in stats_runtime]
-        yerr = iqrs
+        yerr = [[s['ci_lower'] for s in stats_runtime], [s['ci_upper'] for s in stats_runtime]]
         
         runtime_colors = []
         for s in stats_runtime:
@@ -273,10 +297,10 @@ def plot_runtime_comparison():
         
         ax.axhline(y=0, color='#00ff41', linestyle='-', linewidth=1, alpha=0.3)
         
-        baseline_median = next(s['original_median'] for s in stats_runtime if s['method'] == 'baseline')
-        error_margin = baseline_median * (ERROR_MARGIN_THRESHOLD / 100)
-        ax.axhspan(-error_margin, error_margin, 
-                  color='yellow', alpha=0.1, label=f'±{ERROR_MARGIN_THRESHOLD}% noise zone')
+        baseline_stat = next(s for s in stats_runtime if s['method'] == 'baseline')
+        ci_low, ci_high = baseline_stat['original_ci']
+        ax.axhspan(ci_low - baseline_stat['original_median'], ci_high - baseline_stat['original_median'],
+                  color='yellow', alpha=0.1, label='Baseline 95% CI')
     
     fig.patch.set_facecolor('#0d0d0d')
     plt.tight_layout()
@@ -284,26 +308,13 @@ def plot_runtime_comparison():
     plt.close()
     print("Saved: results/performance_runtime_comparison.png")
 
-plot_runtime_comparison()
 
 def plot_memory_usage():
     fig, ax = plt.subplots(figsize=(10, 8))
     
-    memory_stats = []
-    memory_methods = []
     method_order_memory = ['baseline', 'ldpreload', 'frida_onenter_v8', 'frida_onleave_v8', 'frida_both_v8', 'frida_cmodule', 'frida_complex']
-    
-    for method in method_order_memory:
-        method_data = df_memory[df_memory['Method'] == method]['Memory_KB']
-        if len(method_data) > 0:
-            q1, q3 = method_data.quantile([0.25, 0.75])
-            iqr = q3 - q1
-            memory_stats.append({
-                'median': method_data.median(),
-                'iqr': iqr,
-                'method': method
-            })
-            memory_methods.append(method)
+    memory_stats = method_stats(memory_summary, method_order_memory)
+    memory_methods = [s['method'] for s in memory_stats]
     
     if memory_stats:
         x_pos = np.arange(len(memory_stats))
@@ -362,32 +373,15 @@ def plot_memory_usage():
     plt.close()
     print("Saved: results/performance_memory.png")
 
-plot_memory_usage()
 
 def plot_complex_path():
-    complex_data = df_timing[df_timing['Function'] == 'complex_ops']
-    
-    if len(complex_data) == 0:
+    if not (timing_summary['Function'] == 'complex_ops').any():
         print("No complex_ops data found, skipping complex path chart")
         return
     
-    stats = []
-    methods = []
     method_order = ['baseline_complex', 'ldpreload_complex', 'frida_complex_v8', 'frida_complex_qjs']
-    
-    for method in method_order:
-        method_data = complex_data[complex_data['Method'] == method]['Time_us']
-        if len(method_data) > 0:
-            q1, median, q3 = method_data.quantile([0.25, 0.5, 0.75])
-            iqr = q3 - q1
-            stats.append({
-                'median': median,
-                'q1': q1,
-                'q3': q3,
-                'iqr': iqr,
-                'method': method
-            })
-            methods.append(method)
+    stats = method_stats(timing_summary, method_order, 'complex_ops')
+    methods = [s['method'] for s in stats]
     
     if not stats:
         print("No valid complex path data found for plotting")
@@ -398,8 +392,8 @@ def plot_complex_path():
     if stats:
         x_pos = np.arange(len(stats))
         medians = [s['median'] for s in stats]
-        yerr_lower = [s['median'] - s['q1'] for s in stats]
-        yerr_upper = [s['q3'] - s['median'] for s in stats]
+        yerr_lower = [s['median'] - s['ci_low'] for s in stats]
+        yerr_upper = [s['ci_high'] - s['median'] for s in stats]
         yerr = [yerr_lower, yerr_upper]
         bar_colors = [colors[s['method']] for s in stats]
         
@@ -447,11 +441,11 @@ def plot_complex_path():
             if stat['method'] == 'baseline_complex':
                 label = f"{stat['median']:.0f}μs\n(baseline)"
             elif stat['method'] == 'ldpreload_complex':
-                pct_overhead = ((stat['median'] - baseline_median) / baseline_median * 100)
+                pct_overhead = stat['overhead_pct']
                 label = f"{stat['median']:.0f}μs\n(+{pct_overhead:.1f}%)"
             else:
-                overhead_pct = ((stat['median'] - baseline_median) / baseline_median * 100) if baseline_median > 0 else 0
-                overhead_per_call_us = (stat['median'] - baseline_median) / 1000000
+                overhead_pct = stat['overhead_pct']
+                overhead_per_call_us = stat['overhead_ns_per_call'] / 1000
                 
                 if overhead_per_call_us < 1:
                     overhead_per_call_ns = overhead_per_call_us * 1000
@@ -461,14 +455,14 @@ def plot_complex_path():
                 
                 label = f"{stat['median']:.0f}μs\n{overhead_label}"
             
-            y_offset = stat['q3'] + (max([s['q3'] for s in stats]) - min(medians)) * 0.02
+            y_offset = stat['ci_high'] + (max([s['ci_high'] for s in stats]) - min(medians)) * 0.02
             
             ax.text(bar.get_x() + bar.get_width()/2, y_offset,
                    label, ha='center', va='bottom', 
                    fontsize=10, fontweight='bold', color='#ffffff')
         
         y_min = min(medians) * 0.98
-        y_max = max([s['q3'] for s in stats]) * 1.08
+        y_max = max([s['ci_high'] for s in stats]) * 1.08
         ax.set_ylim(y_min, y_max)
         
         if baseline_median > 0:
@@ -480,7 +474,567 @@ def plot_complex_path():
     plt.close()
     print("Saved: results/performance_complex_path.png")
 
-plot_complex_path()
+
+LATENCY_PERCENTILES = [('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('p99.9', 0.999)]
+percentile_colors = ['#00b4d8', '#ffd700', '#ff6b35', '#ff006e', '#9932cc']
+
+def load_histograms(path=HISTOGRAMS_JSONL):
+    merged = {}
+    if not os.path.exists(path):
+        return merged
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            entry = merged.setdefault((record['method'], record['phase']), {'values': [], 'counts': [], 'max': 0.0})
+            for floor_ns, count in record['hist_ns']:
+                entry['values'].append(floor_ns)
+                entry['counts'].append(count)
+            entry['max'] = max(entry['max'], record['hist_max_ns'])
+    return merged
+
+def histogram_percentiles(entry):
+    values = np.asarray(entry['values'], dtype=float)
+    counts = np.asarray(entry['counts'], dtype=float)
+    order = np.argsort(values)
+    values, cumulative = values[order], np.cumsum(counts[order])
+    quantiles = np.array([q for _, q in LATENCY_PERCENTILES])
+    idx = np.minimum(np.searchsorted(cumulative, quantiles * cumulative[-1], side='right'), len(values) - 1)
+    result = dict(zip([name for name, _ in LATENCY_PERCENTILES], values[idx]))
+    result['max'] = entry['max']
+    return result
+
+def plot_latency_percentiles():
+    histograms = load_histograms()
+    if not histograms:
+        print("No histogram data found, skipping latency percentile chart")
+        return
+
+    percentiles = {key: histogram_percentiles(entry) for key, entry in histograms.items()}
+    phases = [p for p in ['hot_path', 'heavy_work', 'recursive', 'array_ops', 'memory_ops', 'complex_ops']
+              if (('baseline_complex' if p == 'complex_ops' else 'baseline'), p) in percentiles]
+    if not phases:
+        print("No baseline histograms found, skipping latency percentile chart")
+        return
+
+    stat_names = [name for name, _ in LATENCY_PERCENTILES] + ['max']
+    fig, axes = plt.subplots(len(phases), 1, figsize=(14, 5 * len(phases)), squeeze=False)
+
+    print(f"\nPer-call latency overhead vs baseline (ns):")
+    print("-" * 80)
+    for ax, phase in zip(axes[:, 0], phases):
+        baseline = percentiles[('baseline_complex' if phase == 'complex_ops' else 'baseline', phase)]
+        methods = [m for m in colors if (m, phase) in percentiles and not m.startswith('baseline')]
+        if not methods:
+            ax.set_visible(False)
+            continue
+
+        x_pos = np.arange(len(methods))
+        width = 0.8 / len(stat_names)
+        for j, stat in enumerate(stat_names):
+            overhead = [max(percentiles[(m, phase)][stat] - baseline[stat], 0.1) for m in methods]
+            ax.bar(x_pos + (j - (len(stat_names) - 1) / 2) * width, overhead, width=width,
+                   color=percentile_colors[j], alpha=0.85, label=stat)
+
+        for m in methods:
+            row = ', '.join(f"{stat} {percentiles[(m, phase)][stat] - baseline[stat]:+9.1f}" for stat in stat_names)
+            print(f"  {phase:11s} {m:20s}: {row}")
+
+        ax.set_title(f'Per-call Latency Overhead Percentiles ({phase})', fontsize=14, fontweight='bold', color='#ffffff')
+        ax.set_ylabel('Overhead vs baseline (ns/call) - Log Scale', fontsize=11, color='#ffffff')
+        ax.set_yscale('log')
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(methods, rotation=30, fontsize=9, ha='right')
+        ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+        ax.legend(fontsize=9, facecolor='#1a1a1a')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_latency_percentiles.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_latency_percentiles.png")
+
+
+COUNTER_METRICS = [
+    ('ipc', 'Instructions per Cycle', False),
+    ('branch_misses_per_call', 'Branch Misses / Call', True),
+    ('l1i_misses_per_call', 'L1i Misses / Call', True),
+    ('l1d_misses_per_call', 'L1d Misses / Call', True),
+    ('llc_misses_per_call', 'LLC Misses / Call', True),
+    ('itlb_misses_per_call', 'iTLB Misses / Call', True),
+    ('context_switches_per_call', 'Context Switches / Call', True),
+]
+
+def plot_hw_counters():
+    metrics = [m for m in COUNTER_METRICS if m[0] in counter_summary and counter_summary[m[0]].notna().any()]
+    if not metrics:
+        print("No performance counter data found, skipping counter chart")
+        return
+
+    phases = [p for p in ['hot_path', 'heavy_work', 'recursive', 'array_ops', 'memory_ops', 'complex_ops']
+              if p in set(counter_summary['Function'])]
+    rows = counter_summary.set_index(['Method', 'Function'])
+    methods = [m for m in colors if m in set(counter_summary['Method'])]
+
+    fig, axes = plt.subplots(len(metrics), 1, figsize=(14, 4.5 * len(metrics)), squeeze=False)
+    for ax, (column, title, log_scale) in zip(axes[:, 0], metrics):
+        x_pos = np.arange(len(phases))
+        width = 0.8 / len(methods)
+        for j, method in enumerate(methods):
+            values = [rows[column].get((method, phase), np.nan) for phase in phases]
+            ax.bar(x_pos + (j - (len(methods) - 1) / 2) * width, values, width=width,
+                   color=colors[method], alpha=0.85, label=method)
+        ax.set_title(title, fontsize=14, fontweight='bold', color='#ffffff')
+        if log_scale:
+            ax.set_yscale('log')
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(phases, fontsize=10)
+        ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+    axes[0, 0].legend(fontsize=8, facecolor='#1a1a1a', ncol=4)
+
+    print(f"\nHardware counters per call (median over runs):")
+    print("-" * 80)
+    for (method, phase), row in rows.iterrows():
+        values = ', '.join(f"{column.replace('_per_call', '')} {row[column]:.3g}" for column, _, _ in metrics)
+        print(f"  {phase:11s} {method:20s}: {values}")
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_counters.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_counters.png")
+
+
+stage_colors = ['#00b4d8', '#ff4081', '#ffd700', '#ff6b35', '#9932cc', '#00ff41', '#dc143c']
+
+def plot_startup():
+    if startup_data.empty:
+        print("No start-up data found, skipping start-up chart")
+        return
+
+    breakdown = startup_breakdown(startup_data)
+    methods = [m for m in colors if m in breakdown.index]
+    breakdown = breakdown.loc[methods]
+    stages = [s for s in STARTUP_STAGES if s in breakdown.columns]
+
+    fig, (ax_time, ax_mem) = plt.subplots(1, 2, figsize=(18, max(5, 0.7 * len(methods) + 2)),
+                                          gridspec_kw={'width_ratios': [3, 1]})
+    y_pos = np.arange(len(methods))
+    left = np.zeros(len(methods))
+    for stage in stages:
+        color = stage_colors[STARTUP_STAGES.index(stage)]
+        widths = breakdown[stage].fillna(0).to_numpy()
+        ax_time.barh(y_pos, widths, left=left, color=color, alpha=0.85, label=stage, height=0.6)
+        left += widths
+    for i, total in enumerate(breakdown['total_ms']):
+        ax_time.text(left[i], i, f' {total:.1f} ms', va='center', fontsize=9, color='#ffffff')
+    ax_time.set_yticks(y_pos)
+    ax_time.set_yticklabels(methods, fontsize=10)
+    ax_time.invert_yaxis()
+    ax_time.set_xlabel('Time from launch (ms, median per stage)', fontsize=11, color='#ffffff')
+    ax_time.set_title('Start-up Latency to First Hooked Call', fontsize=14, fontweight='bold', color='#ffffff')
+    ax_time.legend(fontsize=9, facecolor='#1a1a1a', loc='upper center', bbox_to_anchor=(0.5, -0.12), ncol=len(stages))
+
+    ax_mem.barh(y_pos, breakdown['peak_kb'] / 1024, color=[colors[m] for m in methods], alpha=0.85, height=0.6)
+    ax_mem.set_yticks(y_pos)
+    ax_mem.set_yticklabels([])
+    ax_mem.invert_yaxis()
+    ax_mem.set_xlabel('Peak RSS during start-up (MB)', fontsize=11, color='#ffffff')
+    ax_mem.set_title('Start-up Memory', fontsize=14, fontweight='bold', color='#ffffff')
+    for ax in (ax_time, ax_mem):
+        ax.grid(True, axis='x', alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_startup.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_startup.png")
+
+
+def plot_scaling():
+    if scaling_data.empty:
+        print("No scaling data found, skipping scaling chart")
+        return
+
+    summary = scaling_summary(scaling_data)
+    phases = [p for p in ['hot_path', 'heavy_work', 'recursive', 'array_ops', 'memory_ops'] if p in set(summary['phase'])]
+    methods = [m for m in colors if m in set(summary['method'])]
+    fig, axes = plt.subplots(2, len(phases), figsize=(5 * len(phases), 10), squeeze=False)
+    for col, phase in enumerate(phases):
+        ax_tput, ax_lat = axes[0, col], axes[1, col]
+        for method in methods:
+            rows = summary[(summary['phase'] == phase) & (summary['method'] == method)].sort_values('threads')
+            if rows.empty:
+                continue
+            ax_tput.plot(rows['threads'], rows['calls_per_sec'] / 1e6, marker='o', color=colors[method],
+                         linewidth=2, label=method)
+            ax_lat.plot(rows['threads'], rows['thread_ns_per_call'], marker='o', color=colors[method], linewidth=2)
+        ax_tput.set_title(f'{phase}', fontsize=13, fontweight='bold', color='#ffffff')
+        ax_tput.set_ylabel('Aggregate Mcalls/sec' if col == 0 else '', fontsize=11, color='#ffffff')
+        ax_lat.set_ylabel('Per-thread ns/call - Log Scale' if col == 0 else '', fontsize=11, color='#ffffff')
+        ax_lat.set_yscale('log')
+        ax_lat.set_xlabel('Threads', fontsize=11, color='#ffffff')
+        for ax in (ax_tput, ax_lat):
+            ax.set_xscale('log', base=2)
+            ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+            ax.set_axisbelow(True)
+            ax.set_facecolor('#1a1a1a')
+    axes[0, 0].legend(fontsize=8, facecolor='#1a1a1a')
+    fig.suptitle('Thread Scaling of Hooked Calls', fontsize=16, fontweight='bold', color='#ffffff')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_scaling.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_scaling.png")
+
+
+def plot_hook_cost():
+    if sweep_data.empty:
+        print("No sweep data found, skipping hook cost chart")
+        return
+
+    fit = fit_hook_cost(sweep_data)
+    phases = [p for p in ['hot_path', 'heavy_work', 'recursive', 'array_ops', 'memory_ops', 'complex_ops']
+              if p in set(fit['phase'])]
+    methods = [m for m in colors if m in set(fit['method'])]
+    rows = fit.set_index(['method', 'phase'])
+
+    fig, ax = plt.subplots(figsize=(14, 7))
+    x_pos = np.arange(len(phases))
+    width = 0.8 / len(methods)
+    for j, method in enumerate(methods):
+        keys = [(method, p) for p in phases]
+        cost = np.array([rows['hook_ns'].get(k, np.nan) for k in keys])
+        low = np.array([rows['ci_low_ns'].get(k, np.nan) for k in keys])
+        high = np.array([rows['ci_high_ns'].get(k, np.nan) for k in keys])
+        ax.bar(x_pos + (j - (len(methods) - 1) / 2) * width, cost, width=width, yerr=[cost - low, high - cost],
+               capsize=3, color=colors[method], alpha=0.85, label=method, error_kw={'ecolor': 'white'})
+    ax.axhline(0, color='white', linewidth=0.8)
+    ax.set_title('Fitted Per-call Hook Cost (95% CI)', fontsize=16, fontweight='bold', color='#ffffff')
+    ax.set_ylabel('Hook cost (ns/call)', fontsize=12, color='#ffffff')
+    ax.set_yscale('symlog', linthresh=10)
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(phases, fontsize=11)
+    ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+    ax.set_axisbelow(True)
+    ax.set_facecolor('#1a1a1a')
+    ax.legend(fontsize=9, facecolor='#1a1a1a')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_hook_cost.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_hook_cost.png")
+
+
+def plot_depth():
+    if depth_data.empty:
+        print("No recursion depth data found, skipping depth chart")
+        return
+
+    summary = depth_summary(depth_data)
+    methods = [m for m in colors if m in set(summary['method'])]
+    fig, axes = plt.subplots(1, 2, figsize=(18, 7), squeeze=False)
+    ax_call, ax_frame = axes[0]
+    for method in methods:
+        rows = summary[summary['method'] == method].sort_values('depth')
+        ax_call.plot(rows['depth'], rows['ns_per_call'], marker='o', color=colors[method], label=method,
+                     linewidth=2 if method == 'baseline' else 1.5)
+        if method != 'baseline':
+            outer_only = rows['outer_frame_only'].any()
+            ax_frame.plot(rows['depth'], rows['hook_ns_per_frame'], marker='o', color=colors[method],
+                          label=f'{method} (outer frame only)' if outer_only else method,
+                          linestyle=':' if outer_only else '-', linewidth=1.5)
+
+    ax_call.set_title('Time per Outer Call', fontsize=14, fontweight='bold', pad=15)
+    ax_call.set_ylabel('ns per call', fontsize=12)
+    ax_call.set_yscale('log')
+    # Flat lines: constant invocation-stack cost; rising: cost grows with depth
+    ax_frame.set_title('Hook Cost per Hooked Recursion Frame', fontsize=14, fontweight='bold', pad=15)
+    ax_frame.set_ylabel('ns per frame over baseline', fontsize=12)
+    ax_frame.set_yscale('symlog', linthresh=10)
+    ax_frame.axhline(0, color='white', linewidth=0.8)
+    for ax in (ax_call, ax_frame):
+        ax.set_xscale('log')
+        ax.set_xlabel('Recursion depth (frames per call)', fontsize=12)
+        ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+        ax.legend(fontsize=8, facecolor='#1a1a1a')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_depth.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_depth.png")
+
+
+DENSITY_PATTERNS = {'roundrobin': '-', 'zipf': '--'}
+
+def plot_density():
+    if density_data.empty:
+        print("No hook density data found, skipping density chart")
+        return
+
+    summary = density_summary(density_data)
+    methods = [m for m in colors if m in set(summary['method']) and m != 'baseline']
+    patterns = [p for p in DENSITY_PATTERNS if p in set(summary['pattern'])]
+    fig, axes = plt.subplots(1, 3, figsize=(21, 7), squeeze=False)
+    ax_attach, ax_memory, ax_call = axes[0]
+    for method in methods:
+        rows = summary[summary['method'] == method]
+        # Attach time and memory belong to the launch, which ran every pattern
+        launch = rows[rows['pattern'] == patterns[0]]
+        ax_attach.plot(launch['functions'], launch['attach_ms'], marker='o', color=colors[method], label=method)
+        ax_memory.plot(launch['functions'], launch['extra_kb'] / 1024, marker='o', color=colors[method],
+                       label=method)
+        for pattern in patterns:
+            by_pattern = rows[rows['pattern'] == pattern]
+            ax_call.plot(by_pattern['functions'], by_pattern['overhead_ns_per_call'], marker='o',
+                         linestyle=DENSITY_PATTERNS[pattern], color=colors[method], label=f'{method} ({pattern})')
+
+    panels = [(ax_attach, 'Launch to main over Baseline', 'ms', 'symlog'),
+              (ax_memory, 'Resident Memory over Baseline (hooks in place)', 'MB', 'symlog'),
+              (ax_call, 'Per-call Overhead (solid: round-robin, dashed: Zipf)', 'ns per call', 'symlog')]
+    for ax, title, ylabel, yscale in panels:
+        ax.set_title(title, fontsize=13, fontweight='bold', pad=15)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.set_xlabel('Hooked functions (N)', fontsize=12)
+        ax.set_xscale('log')
+        ax.set_yscale(yscale, linthresh=1)
+        ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+        ax.legend(fontsize=8, facecolor='#1a1a1a')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_density.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_density.png")
+
+
+STREAM_MODES = ['send', 'batch', 'ring']
+stream_colors = {'v8': '#ff4081', 'qjs': '#ff69b4'}
+
+def plot_stream():
+    if stream_data.empty:
+        print("No streaming data found, skipping streaming chart")
+        return
+
+    summary = stream_summary(stream_data).set_index(['mode', 'runtime'])
+    modes = [m for m in STREAM_MODES if m in set(summary.index.get_level_values('mode'))]
+    runtimes = [r for r in stream_colors if r in set(summary.index.get_level_values('runtime'))]
+    panels = [('events_per_sec', 'Events delivered per second', 'log'),
+              ('drop_pct', 'Dropped events (%)', 'linear'),
+              ('slowdown', 'Target slowdown vs baseline (x)', 'log')]
+    fig, axes = plt.subplots(1, len(panels), figsize=(18, 6))
+    x_pos = np.arange(len(modes))
+    width = 0.8 / len(runtimes)
+    for ax, (column, title, scale) in zip(axes, panels):
+        for j, runtime in enumerate(runtimes):
+            values = [summary[column].get((m, runtime), np.nan) for m in modes]
+            ax.bar(x_pos + (j - (len(runtimes) - 1) / 2) * width, values, width=width,
+                   color=stream_colors[runtime], alpha=0.85, label=runtime)
+        ax.set_title(title, fontsize=13, fontweight='bold', color='#ffffff')
+        ax.set_yscale(scale)
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(modes, fontsize=11)
+        ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+    axes[0].legend(fontsize=9, facecolor='#1a1a1a')
+    fig.suptitle('Streaming compute_sum Records to the Host', fontsize=16, fontweight='bold', color='#ffffff')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_stream.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_stream.png")
+
+
+def plot_warmup():
+    if chunk_data.empty:
+        print("No chunked runs found, skipping warm-up chart")
+        return
+
+    summary = warmup_summary(chunk_data).set_index(['method', 'phase'])
+    phases = [p for p in ['hot_path', 'heavy_work', 'recursive', 'array_ops', 'memory_ops', 'complex_ops']
+              if p in set(chunk_data['phase'])]
+    methods = [m for m in colors if m in set(chunk_data['method'])]
+    per_call = chunk_data.assign(ns_per_call=chunk_data['time_ns'] / chunk_data['calls'])
+    series = per_call.groupby(['method', 'phase', 'chunk'])['ns_per_call'].median()
+    fig, axes = plt.subplots(1, len(phases), figsize=(6 * len(phases), 6), squeeze=False)
+    for ax, phase in zip(axes[0], phases):
+        for method in methods:
+            if (method, phase) not in summary.index:
+                continue
+            values = series.loc[(method, phase)]
+            ax.plot(values.index, values.to_numpy(), color=colors[method], linewidth=1.5, alpha=0.9, label=method)
+            # Median end of the warm-up MSER found in the individual runs
+            cut = int(summary.loc[(method, phase), 'warmup_chunks'])
+            if cut > 0:
+                ax.axvline(cut, color=colors[method], linestyle='--', linewidth=1, alpha=0.6)
+        ax.set_title(f'{phase}', fontsize=13, fontweight='bold', color='#ffffff')
+        ax.set_yscale('log')
+        ax.set_xlabel('Chunk', fontsize=11, color='#ffffff')
+        ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+    axes[0, 0].set_ylabel('Median time per call (ns) - Log Scale', fontsize=11, color='#ffffff')
+    axes[0, 0].legend(fontsize=8, facecolor='#1a1a1a')
+    fig.suptitle('Per-call Time Through Each Phase (dashed: detected end of warm-up)', fontsize=16,
+                 fontweight='bold', color='#ffffff')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_warmup.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_warmup.png")
+
+
+STALKER_PHASES = ['hot_path', 'recursive', 'array_ops']
+STALKER_METHODS = ['baseline', 'ldpreload', 'frida_onenter_v8', 'frida_cmodule',
+                   'frida_stalker_block', 'frida_stalker_call', 'frida_stalker_cmodule']
+
+def plot_stalker():
+    rows = timing_rows(STALKER_PHASES, STALKER_METHODS)
+    if not rows['Method'].str.startswith('frida_stalker').any():
+        print("No Stalker data found, skipping Stalker chart")
+        return
+
+    fig, axes = plt.subplots(1, len(STALKER_PHASES), figsize=(7 * len(STALKER_PHASES), 8), squeeze=False)
+    for ax, phase in zip(axes[0], STALKER_PHASES):
+        stats = method_stats(timing_summary, STALKER_METHODS, phase)
+        if not stats:
+            ax.set_visible(False)
+            continue
+        x_pos = np.arange(len(stats))
+        per_call = [s['median'] * 1000 / s['calls'] for s in stats]
+        bars = ax.bar(x_pos, per_call, color=[colors[s['method']] for s in stats], alpha=0.85, width=0.7)
+        for bar, s in zip(bars, stats):
+            slowdown = s['median'] / s['baseline_median'] if s['baseline_median'] > 0 else float('nan')
+            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() * 1.1, f'{slowdown:.1f}x',
+                    ha='center', va='bottom', fontsize=9, color='#ffffff')
+        ax.set_title(f'{phase}', fontsize=14, fontweight='bold', color='#ffffff')
+        ax.set_ylabel('Time per call (ns) - Log Scale', fontsize=11, color='#ffffff')
+        ax.set_yscale('log')
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels([s['method'] for s in stats], rotation=30, fontsize=9, ha='right')
+        ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+    fig.suptitle('Stalker Full-thread Tracing vs Interceptor Hooks (slowdown vs baseline)',
+                 fontsize=16, fontweight='bold', color='#ffffff')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_stalker.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_stalker.png")
+
+
+PER_CALL_PHASES = ['hot_path', 'heavy_work', 'recursive', 'array_ops', 'memory_ops']
+REPLACE_METHODS = ['baseline', 'ldpreload', 'frida_both_v8', 'frida_replace_v8', 'frida_replace_cmodule_v8',
+                   'frida_replacefast_v8', 'frida_both_qjs', 'frida_replace_qjs', 'frida_replace_cmodule_qjs',
+                   'frida_replacefast_qjs']
+NATIVE_METHODS = ['baseline', 'ldpreload', 'ldaudit', 'got_hook', 'inline_hook', 'frida_cmodule',
+                  'frida_replace_cmodule_v8', 'frida_replacefast_v8', 'frida_onenter_v8', 'uprobe', 'uprobe_ret']
+
+def plot_per_call(methods, required, title, output_file):
+    # Grouped per-call time for a set of methods, drawn only once one of the
+    # methods named in `required` has results
+    rows = timing_rows(PER_CALL_PHASES, methods)
+    if not rows['Method'].isin(required).any():
+        print(f"No data for {', '.join(required)}, skipping {output_file}")
+        return
+
+    fig, ax = plt.subplots(figsize=(16, 8))
+    x_pos = np.arange(len(PER_CALL_PHASES))
+    methods = [m for m in methods if m in set(rows['Method'])]
+    width = 0.85 / len(methods)
+    for j, method in enumerate(methods):
+        per_call = []
+        for phase in PER_CALL_PHASES:
+            stats = method_stats(timing_summary, [method], phase)
+            per_call.append(stats[0]['median'] * 1000 / stats[0]['calls'] if stats else np.nan)
+        ax.bar(x_pos + (j - (len(methods) - 1) / 2) * width, per_call, width=width, color=colors[method],
+               alpha=0.85, label=method)
+    ax.set_title(title, fontsize=16, fontweight='bold', color='#ffffff')
+    ax.set_ylabel('Time per call (ns) - Log Scale', fontsize=12, color='#ffffff')
+    ax.set_yscale('log')
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(PER_CALL_PHASES, fontsize=11)
+    ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+    ax.set_axisbelow(True)
+    ax.set_facecolor('#1a1a1a')
+    ax.legend(fontsize=9, facecolor='#1a1a1a', ncol=5, loc='upper center', bbox_to_anchor=(0.5, -0.08))
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print(f"Saved: {output_file}")
+
+
+ARGS_PHASES = ['hot_path', 'array_ops']
+# Each argument-reading hook and the same mechanism without the reads
+ARGS_METHODS = {
+    'ldpreload_args': 'ldpreload',
+    'frida_args_cmodule': 'frida_cmodule',
+    **{f'frida_args_{access}_{runtime}': f'frida_args_none_{runtime}'
+       for runtime in ['v8', 'qjs'] for access in ['readbytearray', 'wrap', 'pointer']},
+}
+
+def plot_args():
+    methods = [m for m in ARGS_METHODS if not timing_rows(ARGS_PHASES, [m]).empty]
+    if not methods:
+        print("No argument access data found, skipping argument access chart")
+        return
+
+    def overhead_ns(method, phase):
+        stats = method_stats(timing_summary, [method], phase)
+        return stats[0]['overhead_ns_per_call'] if stats else np.nan
+
+    fig, axes = plt.subplots(1, len(ARGS_PHASES), figsize=(9 * len(ARGS_PHASES), 8), squeeze=False)
+    x_pos = np.arange(len(methods))
+    for ax, phase in zip(axes[0], ARGS_PHASES):
+        # Overhead over the baseline, split into what the hook mechanism costs
+        # without touching arguments and what reading/writing them adds;
+        # negative differences, which are noise, are drawn as zero
+        transition = np.clip([overhead_ns(ARGS_METHODS[m], phase) for m in methods], 0, None)
+        marshalling = np.clip(np.array([overhead_ns(m, phase) for m in methods]) - transition, 0, None)
+        total = transition + marshalling
+        ax.bar(x_pos, transition, color=[colors[ARGS_METHODS[m]] for m in methods], alpha=0.5,
+               edgecolor='white', linewidth=0.5, label='hook transition (reference method)')
+        ax.bar(x_pos, marshalling, bottom=transition, color=[colors[m] for m in methods], alpha=0.9,
+               edgecolor='white', linewidth=0.5, label='argument / buffer access')
+        for x, t, m in zip(x_pos, total, marshalling):
+            if np.isfinite(t) and t > 0:
+                ax.text(x, t * 1.02, f'{m / t * 100:.0f}%', ha='center', va='bottom', fontsize=9, color='#ffffff')
+        ax.set_title(f'{phase}', fontsize=14, fontweight='bold', color='#ffffff')
+        ax.set_ylabel('Overhead per call over baseline (ns)', fontsize=11, color='#ffffff')
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(methods, rotation=45, ha='right', fontsize=9)
+        ax.grid(True, alpha=0.2, color=grid_color, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#1a1a1a')
+    axes[0, 0].legend(fontsize=9, facecolor='#1a1a1a')
+    fig.suptitle('Argument Marshalling vs Hook Transition (labels: share spent on access)', fontsize=16,
+                 fontweight='bold', color='#ffffff')
+
+    fig.patch.set_facecolor('#0d0d0d')
+    plt.tight_layout()
+    plt.savefig('results/performance_args.png', dpi=150, facecolor='#0d0d0d', edgecolor='none')
+    plt.close()
+    print("Saved: results/performance_args.png")
+
 
 def plot_combined_overview():
     fig = plt.figure(figsize=(24, 16))
@@ -490,33 +1044,14 @@ def plot_combined_overview():
     
     for idx, (func, title) in enumerate(zip(functions, titles)):
         ax = plt.subplot(3, 3, idx + 1)
-        func_data = df_timing[df_timing['Function'] == func]
-        
-        stats = []
-        methods = []
         method_order = ['baseline', 'ldpreload', 'frida_onenter_v8', 'frida_onleave_v8', 'frida_both_v8', 'frida_cmodule', 'frida_complex']
-        
-        baseline_data = func_data[func_data['Method'] == 'baseline']['Time_us']
-        baseline_median = baseline_data.median() if len(baseline_data) > 0 else 0
-        
-        for method in method_order:
-            method_data = func_data[func_data['Method'] == method]['Time_us']
-            if len(method_data) > 0:
-                q1, q3 = method_data.quantile([0.25, 0.75])
-                iqr = q3 - q1
-                stats.append({
-                    'median': method_data.median(),
-                    'iqr': iqr,
-                    'method': method,
-                    'original_median': method_data.median()
-                })
-                methods.append(method)
+        stats = method_stats(timing_summary, method_order, func)
+        methods = [s['method'] for s in stats]
         
         if stats:
             x_pos = np.arange(len(stats))
             medians = [s['median'] for s in stats]
-            iqrs = [s['iqr'] for s in stats]
-            yerr = iqrs
+            yerr = [[s['median'] - s['ci_low'] for s in stats], [s['ci_high'] - s['median'] for s in stats]]
             bar_colors = [colors[s['method']] for s in stats]
             
             labels = []
@@ -556,7 +1091,7 @@ def plot_combined_overview():
                 if stat['method'] == 'baseline':
                     label = f"{stat['median']:.1f}μs\n(baseline)"
                 else:
-                    label = f"{stat['median']:.1f}±{stat['iqr']:.1f}"
+                    label = f"{stat['median']:.1f}±{(stat['ci_high'] - stat['ci_low']) / 2:.1f}"
                 
                 if height >= 0:
                     va = 'bottom'
@@ -570,45 +1105,12 @@ def plot_combined_overview():
                        fontsize=7, fontweight='bold', color='#ffffff')
     
     ax_runtime = plt.subplot(3, 3, 7)
-    func_data = df_timing[df_timing['Function'] == 'hot_path']
-    baseline_data = func_data[func_data['Method'] == 'baseline']['Time_us']
-    baseline_median = baseline_data.median() if len(baseline_data) > 0 else 0
-    
-    stats_runtime = []
-    methods_runtime = []
-    method_order_runtime = ['baseline', 'ldpreload', 'onenter_v8', 'onenter_qjs', 'onleave_v8', 'onleave_qjs', 'both_v8', 'both_qjs']
-    
-    for method in method_order_runtime:
-        if method in ['baseline', 'ldpreload']:
-            method_data = func_data[func_data['Method'] == method]['Time_us']
-        else:
-            frida_method = f'frida_{method}'
-            method_data = func_data[func_data['Method'] == frida_method]['Time_us']
-        
-        if len(method_data) > 0:
-            if method == 'baseline':
-                stats_runtime.append({
-                    'median': 0,
-                    'iqr': 0,
-                    'method': method,
-                    'original_median': method_data.median()
-                })
-            else:
-                q1, q3 = method_data.quantile([0.25, 0.75])
-                iqr = q3 - q1
-                stats_runtime.append({
-                    'median': method_data.median() - baseline_median,
-                    'iqr': iqr,
-                    'method': method,
-                    'original_median': method_data.median()
-                })
-            methods_runtime.append(method)
+    stats_runtime, methods_runtime = runtime_stats()
     
     if stats_runtime:
         x_pos = np.arange(len(stats_runtime))
         medians = [s['median'] for s in stats_runtime]
-        iqrs = [s['iqr'] for s in stats_runtime]
-        yerr = iqrs
+        yerr = [[s['ci_lower'] for s in stats_runtime], [s['ci_upper'] for s in stats_runtime]]
         
         runtime_colors = []
         for s in stats_runtime:
@@ -677,21 +1179,9 @@ def plot_combined_overview():
     
     ax_memory = plt.subplot(3, 3, (8, 9))
     
-    memory_stats = []
-    memory_methods = []
     method_order_memory = ['baseline', 'ldpreload', 'frida_onenter_v8', 'frida_onleave_v8', 'frida_both_v8', 'frida_cmodule', 'frida_complex']
-    
-    for method in method_order_memory:
-        method_data = df_memory[df_memory['Method'] == method]['Memory_KB']
-        if len(method_data) > 0:
-            q1, q3 = method_data.quantile([0.25, 0.75])
-            iqr = q3 - q1
-            memory_stats.append({
-                'median': method_data.median(),
-                'iqr': iqr,
-                'method': method
-            })
-            memory_methods.append(method)
+    memory_stats = method_stats(memory_summary, method_order_memory)
+    memory_methods = [s['method'] for s in memory_stats]
     
     if memory_stats:
         x_pos = np.arange(len(memory_stats))
@@ -752,110 +1242,261 @@ def plot_combined_overview():
     plt.close()
     print("Saved: results/performance.png (combined overview)")
 
-plot_combined_overview()
-
-print("\nAll charts have been generated successfully!")
-print("Individual charts:")
-print("  - results/performance_hot_path.png")
-print("  - results/performance_heavy_work.png")
-print("  - results/performance_recursive.png")
-print("  - results/performance_array_ops.png")
-print("  - results/performance_memory_ops.png")
-print("  - results/performance_runtime_comparison.png")
-print("  - results/performance_memory.png")
-print("Combined overview:")
-print("  - results/performance.png")
-
-print("\n" + "="*80)
-print("PERFORMANCE ANALYSIS SUMMARY")
-print("="*80)
-
-hot_path_data = df_timing[df_timing['Function'] == 'hot_path']
-baseline_hot = hot_path_data[hot_path_data['Method'] == 'baseline']['Time_us'].median()
-
-print(f"\nHot Path Analysis (1M calls, baseline: {baseline_hot:.0f} μs):")
-print("-" * 50)
-
-methods_to_analyze = ['ldpreload', 'frida_onenter_v8', 'frida_onleave_v8', 'frida_both_v8', 'frida_cmodule', 'frida_complex']
-complex_methods_to_analyze = ['baseline_complex', 'frida_complex_v8', 'frida_complex_qjs']
-for method in methods_to_analyze:
-    method_data = hot_path_data[hot_path_data['Method'] == method]['Time_us']
-    if len(method_data) > 0:
-        median = method_data.median()
-        overhead_us = median - baseline_hot
-        overhead_pct = (overhead_us / baseline_hot * 100) if baseline_hot > 0 else 0
-        overhead_per_call_us = overhead_us / 1000000
-        
-        method_display = {
-            'ldpreload': 'LD_PRELOAD',
-            'frida_onenter_v8': 'Frida onEnter (V8)',
-            'frida_onleave_v8': 'Frida onLeave (V8)',
-            'frida_both_v8': 'Frida Both (V8)',
-            'frida_cmodule': 'Frida CModule',
-            'frida_complex': 'Frida Complex (V8)'
-        }.get(method, method)
-        
-        if overhead_per_call_us < 0.001:
-            overhead_per_call_ns = overhead_per_call_us * 1000
-            print(f"  {method_display:20s}: +{overhead_us:7.0f} μs (+{overhead_pct:7.1f}%) = {overhead_per_call_ns:7.1f} ns/call")
-        else:
-            print(f"  {method_display:20s}: +{overhead_us:7.0f} μs (+{overhead_pct:7.1f}%) = {overhead_per_call_us:7.3f} μs/call")
-
-print(f"\nMemory Usage Analysis:")
-print("-" * 50)
-baseline_mem = df_memory[df_memory['Method'] == 'baseline']['Memory_KB'].median()
-print(f"  Baseline: {baseline_mem:.0f} KB")
-
-for method in methods_to_analyze:
-    method_data = df_memory[df_memory['Method'] == method]['Memory_KB']
-    if len(method_data) > 0:
-        median = method_data.median()
-        overhead_kb = median - baseline_mem
-        overhead_pct = (overhead_kb / baseline_mem * 100) if baseline_mem > 0 else 0
-        
-        method_display = {
-            'ldpreload': 'LD_PRELOAD',
-            'frida_onenter_v8': 'Frida onEnter (V8)',
-            'frida_onleave_v8': 'Frida onLeave (V8)',
-            'frida_both_v8': 'Frida Both (V8)',
-            'frida_cmodule': 'Frida CModule',
-            'frida_complex': 'Frida Complex (V8)'
-        }.get(method, method)
-        
-        print(f"  {method_display:20s}: {median:6.0f} KB (+{overhead_kb:6.0f} KB, +{overhead_pct:5.1f}%)")
-
-complex_data = df_timing[df_timing['Function'] == 'complex_ops']
-if len(complex_data) > 0:
-    baseline_complex = complex_data[complex_data['Method'] == 'baseline_complex']['Time_us'].median()
-    
-    print(f"\nComplex Operations Analysis (1M calls, C baseline: {baseline_complex:.0f} μs):")
-    print("-" * 60)
-    
-    for method in complex_methods_to_analyze:
-        method_data = complex_data[complex_data['Method'] == method]['Time_us']
-        if len(method_data) > 0:
-            median = method_data.median()
-            if method == 'baseline_complex':
-                overhead_us = 0
-                overhead_pct = 0
-                overhead_per_call_us = 0
-            else:
-                overhead_us = median - baseline_complex
-                overhead_pct = (overhead_us / baseline_complex * 100) if baseline_complex > 0 else 0
-                overhead_per_call_us = overhead_us / 1000000
-            
+def print_summary():
+    print("\n" + "="*80)
+    print("PERFORMANCE ANALYSIS SUMMARY")
+    print("="*80)
+
+    hot_path_stats = {s['method']: s for s in method_stats(timing_summary, list(colors), 'hot_path')}
+    baseline_hot = hot_path_stats['baseline']['median'] if 'baseline' in hot_path_stats else float('nan')
+
+    print(f"\nHot Path Analysis (1M calls, baseline: {baseline_hot:.0f} μs):")
+    print("-" * 50)
+
+    methods_to_analyze = ['ldpreload', 'frida_onenter_v8', 'frida_onleave_v8', 'frida_both_v8', 'frida_cmodule', 'frida_complex']
+    complex_methods_to_analyze = ['baseline_complex', 'frida_complex_v8', 'frida_complex_qjs']
+    for method in methods_to_analyze:
+        if method in hot_path_stats:
+            stat = hot_path_stats[method]
+            overhead_us = stat['overhead_us']
+            overhead_pct = stat['overhead_pct']
+            overhead_per_call_us = stat['overhead_ns_per_call'] / 1000
+
             method_display = {
-                'baseline_complex': 'C Native (Complex)',
-                'frida_complex_v8': 'Frida Complex V8', 
-                'frida_complex_qjs': 'Frida Complex QuickJS'
+                'ldpreload': 'LD_PRELOAD',
+                'frida_onenter_v8': 'Frida onEnter (V8)',
+                'frida_onleave_v8': 'Frida onLeave (V8)',
+                'frida_both_v8': 'Frida Both (V8)',
+                'frida_cmodule': 'Frida CModule',
+                'frida_complex': 'Frida Complex (V8)'
             }.get(method, method)
-            
-            if method == 'baseline_complex':
-                print(f"  {method_display:25s}: {median:10.0f} μs (baseline)")
-            elif overhead_per_call_us < 1:
+
+            if overhead_per_call_us < 0.001:
                 overhead_per_call_ns = overhead_per_call_us * 1000
-                print(f"  {method_display:25s}: {median:10.0f} μs (+{overhead_pct:7.1f}%) = {overhead_per_call_ns:7.1f} ns/call")
+                print(f"  {method_display:20s}: +{overhead_us:7.0f} μs (+{overhead_pct:7.1f}%) = {overhead_per_call_ns:7.1f} ns/call")
             else:
-                print(f"  {method_display:25s}: {median:10.0f} μs (+{overhead_pct:7.1f}%) = {overhead_per_call_us:7.3f} μs/call")
+                print(f"  {method_display:20s}: +{overhead_us:7.0f} μs (+{overhead_pct:7.1f}%) = {overhead_per_call_us:7.3f} μs/call")
+
+    print(f"\nMemory Usage Analysis:")
+    print("-" * 50)
+    memory_stats_by_method = {s['method']: s for s in method_stats(memory_summary, list(colors))}
+    baseline_mem = memory_stats_by_method['baseline']['median'] if 'baseline' in memory_stats_by_method else float('nan')
+    print(f"  Baseline: {baseline_mem:.0f} KB")
+
+    for method in methods_to_analyze:
+        if method in memory_stats_by_method:
+            median = memory_stats_by_method[method]['median']
+            overhead_kb = median - baseline_mem
+            overhead_pct = (overhead_kb / baseline_mem * 100) if baseline_mem > 0 else 0
+
+            method_display = {
+                'ldpreload': 'LD_PRELOAD',
+                'frida_onenter_v8': 'Frida onEnter (V8)',
+                'frida_onleave_v8': 'Frida onLeave (V8)',
+                'frida_both_v8': 'Frida Both (V8)',
+                'frida_cmodule': 'Frida CModule',
+                'frida_complex': 'Frida Complex (V8)'
+            }.get(method, method)
+
+            print(f"  {method_display:20s}: {median:6.0f} KB (+{overhead_kb:6.0f} KB, +{overhead_pct:5.1f}%)")
+
+    complex_stats = {s['method']: s for s in method_stats(timing_summary, list(colors), 'complex_ops')}
+    if complex_stats:
+        baseline_complex = complex_stats['baseline_complex']['median'] if 'baseline_complex' in complex_stats else float('nan')
+
+        print(f"\nComplex Operations Analysis (1M calls, C baseline: {baseline_complex:.0f} μs):")
+        print("-" * 60)
+
+        for method in complex_methods_to_analyze:
+            if method in complex_stats:
+                stat = complex_stats[method]
+                median = stat['median']
+                overhead_pct = stat['overhead_pct']
+                overhead_per_call_us = stat['overhead_ns_per_call'] / 1000
+
+                method_display = {
+                    'baseline_complex': 'C Native (Complex)',
+                    'frida_complex_v8': 'Frida Complex V8', 
+                    'frida_complex_qjs': 'Frida Complex QuickJS'
+                }.get(method, method)
+
+                if method == 'baseline_complex':
+                    print(f"  {method_display:25s}: {median:10.0f} μs (baseline)")
+                elif overhead_per_call_us < 1:
+                    overhead_per_call_ns = overhead_per_call_us * 1000
+                    print(f"  {method_display:25s}: {median:10.0f} μs (+{overhead_pct:7.1f}%) = {overhead_per_call_ns:7.1f} ns/call")
+                else:
+                    print(f"  {method_display:25s}: {median:10.0f} μs (+{overhead_pct:7.1f}%) = {overhead_per_call_us:7.3f} μs/call")
+
+    if not chunk_data.empty:
+        print(f"\nWarm-up vs Steady State (medians over chunked runs):")
+        print("-" * 80)
+        print(f"  {'method':28s}{'phase':13s}{'warm-up calls':>14s}{'warm-up cost':>14s}{'steady ns/call':>16s}"
+              f"{'overhead':>10s}")
+        for row in warmup_summary(chunk_data).itertuples():
+            print(f"  {row.method:28s}{row.phase:13s}{row.warmup_calls:14.0f}{row.warmup_ns / 1000:11.1f} μs"
+                  f"{row.steady_ns_per_call:16.2f}{row.steady_overhead_ns:10.2f}")
+
+    print("="*80)
+
+MAIN_METHODS = ['baseline', 'ldpreload', 'frida_onenter_v8', 'frida_onleave_v8', 'frida_both_v8', 'frida_cmodule', 'frida_complex']
+RUNTIME_METHODS = ['baseline', 'ldpreload'] + [f'frida_{m}' for m in ['onenter_v8', 'onenter_qjs', 'onleave_v8', 'onleave_qjs', 'both_v8', 'both_qjs']]
+COMPLEX_METHODS = ['baseline_complex', 'ldpreload_complex', 'frida_complex_v8', 'frida_complex_qjs']
+
+def timing_rows(functions, methods):
+    return timing_summary[timing_summary['Function'].isin(functions) & timing_summary['Method'].isin(methods)]
+
+def memory_rows(methods):
+    return memory_summary[memory_summary['Method'].isin(methods)]
+
+def histogram_bytes():
+    if not os.path.exists(HISTOGRAMS_JSONL):
+        return b''
+    with open(HISTOGRAMS_JSONL, 'rb') as f:
+        return f.read()
+
+def chart_specs():
+    specs = []
+    for func_name, title, output_file in FUNCTION_CHARTS:
+        specs.append((output_file, plot_function_performance, (func_name, title, output_file),
+                      lambda f=func_name: [timing_rows([f], MAIN_METHODS)]))
+    specs.append(('results/performance_runtime_comparison.png', plot_runtime_comparison, (),
+                  lambda: [timing_rows(['hot_path'], RUNTIME_METHODS)]))
+    specs.append(('results/performance_memory.png', plot_memory_usage, (),
+                  lambda: [memory_rows(MAIN_METHODS)]))
+    specs.append(('results/performance_complex_path.png', plot_complex_path, (),
+                  lambda: [timing_rows(['complex_ops'], COMPLEX_METHODS)]))
+    specs.append(('results/performance_latency_percentiles.png', plot_latency_percentiles, (),
+                  lambda: [histogram_bytes()]))
+    specs.append(('results/performance_counters.png', plot_hw_counters, (),
+                  lambda: [counter_summary]))
+    specs.append(('results/performance_startup.png', plot_startup, (),
+                  lambda: [startup_data]))
+    specs.append(('results/performance_scaling.png', plot_scaling, (),
+                  lambda: [scaling_data]))
+    specs.append(('results/performance_hook_cost.png', plot_hook_cost, (),
+                  lambda: [sweep_data]))
+    specs.append(('results/performance_depth.png', plot_depth, (),
+                  lambda: [depth_data]))
+    specs.append(('results/performance_density.png', plot_density, (),
+                  lambda: [density_data]))
+    specs.append(('results/performance_stream.png', plot_stream, (),
+                  lambda: [stream_data]))
+    specs.append(('results/performance_warmup.png', plot_warmup, (),
+                  lambda: [chunk_data]))
+    specs.append(('results/performance_stalker.png', plot_stalker, (),
+                  lambda: [timing_rows(STALKER_PHASES, STALKER_METHODS)]))
+    specs.append(('results/performance_replace.png', plot_per_call,
+                  (REPLACE_METHODS, [m for m in REPLACE_METHODS if m.startswith('frida_replace')],
+                   'Return Value Override: attach vs replace vs replaceFast', 'results/performance_replace.png'),
+                  lambda: [timing_rows(PER_CALL_PHASES, REPLACE_METHODS)]))
+    specs.append(('results/performance_native.png', plot_per_call,
+                  (NATIVE_METHODS, ['ldaudit', 'got_hook', 'inline_hook', 'uprobe', 'uprobe_ret'],
+                   'Native Hooking Techniques vs Frida', 'results/performance_native.png'),
+                  lambda: [timing_rows(PER_CALL_PHASES, NATIVE_METHODS)]))
+    specs.append(('results/performance_args.png', plot_args, (),
+                  lambda: [timing_rows(ARGS_PHASES, list(ARGS_METHODS) + sorted(set(ARGS_METHODS.values())))]))
+    specs.append(('results/performance.png', plot_combined_overview, (),
+                  lambda: [timing_rows([f for f, _, _ in FUNCTION_CHARTS], MAIN_METHODS),
+                           timing_rows(['hot_path'], RUNTIME_METHODS), memory_rows(MAIN_METHODS)]))
+    return specs
+
+def chart_hash(func, args, inputs, source_hash):
+    h = hashlib.sha1()
+    h.update(source_hash.encode())
+    h.update(f'{func.__name__}{args!r}'.encode())
+    for item in inputs:
+        if isinstance(item, bytes):
+            h.update(item)
+        else:
+            h.update(','.join(item.columns).encode())
+            h.update(pd.util.hash_pandas_object(item, index=False).values.tobytes())
+    return h.hexdigest()
+
+def output_mtime(output_file):
+    return os.stat(output_file).st_mtime_ns if os.path.exists(output_file) else None
+
+def render_chart(func, args, output_file):
+    # Chart functions return without saving when their data is missing, so
+    # whether the file was written is what tells a render from a skip
+    before = output_mtime(output_file)
+    func(*args)
+    after = output_mtime(output_file)
+    return after is not None and after != before
+
+def load_manifest():
+    if not os.path.exists(RENDER_MANIFEST):
+        return {}
+    with open(RENDER_MANIFEST) as f:
+        return json.load(f)
+
+def save_manifest(manifest):
+    os.makedirs(os.path.dirname(RENDER_MANIFEST), exist_ok=True)
+    tmp_path = RENDER_MANIFEST + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, RENDER_MANIFEST)
+
+def main():
+    parser = argparse.ArgumentParser(description='Render benchmark charts')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='number of rendering processes')
+    parser.add_argument('--force', action='store_true', help='re-render charts even if their inputs are unchanged')
+    parser.add_argument('--no-summary', action='store_true', help='skip the text summary')
+    parser.add_argument('--exclude-noisy', action='store_true',
+                        help='leave out runs the runner flagged as taken on a noisy host')
+    args = parser.parse_args()
+
+    start = time.monotonic()
+    load_data(args.exclude_noisy)
+    with open(__file__, 'rb') as f:
+        source_hash = hashlib.sha1(f.read()).hexdigest()
+
+    manifest = load_manifest()
+    # Digests of charts whose last render found no data, kept apart so they
+    # are not retried until their inputs change
+    no_data = manifest.setdefault('skipped', {})
+    pending = []
+    skipped = []
+    for output_file, func, func_args, inputs in chart_specs():
+        digest = chart_hash(func, func_args, inputs(), source_hash)
+        if not args.force and manifest.get(output_file) == digest and os.path.exists(output_file):
+            print(f"Unchanged: {output_file}")
+            continue
+        if not args.force and no_data.get(output_file) == digest:
+            skipped.append(output_file)
+            continue
+        pending.append((output_file, func, func_args, digest))
+
+    rendered = []
+    if pending:
+        ctx = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(pending))), mp_context=ctx) as pool:
+            futures = {pool.submit(render_chart, func, func_args, output_file): (output_file, digest)
+                       for output_file, func, func_args, digest in pending}
+            for future in as_completed(futures):
+                output_file, digest = futures[future]
+                if future.result():
+                    manifest[output_file] = digest
+                    no_data.pop(output_file, None)
+                    rendered.append(output_file)
+                else:
+                    manifest.pop(output_file, None)
+                    no_data[output_file] = digest
+                    skipped.append(output_file)
+        save_manifest(manifest)
+
+    print(f"\nRendered {len(rendered)} chart(s) in {time.monotonic() - start:.1f} s")
+    if skipped:
+        print(f"Skipped {len(skipped)} chart(s) without data: {', '.join(sorted(skipped))}")
+    print("Individual charts:")
+    for output_file, _, _, _ in chart_specs():
+        if output_file != 'results/performance.png' and os.path.exists(output_file):
+            print(f"  - {output_file}")
+    print("Combined overview:")
+    print("  - results/performance.png")
+
+    if not args.no_summary:
+        print_summary()
 
-print("="*80)
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+import argparse
+import csv
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import time
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+STORE_DIR = 'results/store'
+CI_DIR = 'results/ci'
+STARTUP_DIR = 'results/startup'
+SCALING_DIR = 'results/scaling'
+SWEEP_DIR = 'results/sweep'
+STREAM_DIR = 'results/stream'
+MEMORY_DIR = 'results/memory'
+CHUNKS_DIR = 'results/chunks'
+DEPTH_DIR = 'results/depth'
+DENSITY_DIR = 'results/density'
+LEGACY_RESULTS_CSV = 'results/results.csv'
+LEGACY_MEMORY_CSV = 'results/memory.csv'
+
+ENVIRONMENT_FIELDS = [('cpu_model', pa.string()), ('governor', pa.string()), ('turbo', pa.string()),
+                      ('smt', pa.string()), ('isolcpus', pa.string()), ('load1', pa.float64()),
+                      ('runnable', pa.int32())]
+PERF_COUNTERS = ['cycles', 'instructions', 'branch_misses', 'l1i_misses', 'l1d_misses', 'llc_misses',
+                 'itlb_misses', 'context_switches']
+
+SCHEMA = pa.schema([
+    ('run_id', pa.string()),
+    ('iteration', pa.int32()),
+    ('phase', pa.string()),
+    ('calls', pa.int64()),
+    ('time_ns', pa.int64()),
+    ('max_rss_kb', pa.int64()),
+    ('validation', pa.string()),
+    ('timestamp', pa.timestamp('s')),
+    ('host', pa.string()),
+    ('kernel', pa.string()),
+    ('frida_version', pa.string()),
+] + [(name, pa.int64()) for name in PERF_COUNTERS] + ENVIRONMENT_FIELDS + [('noise', pa.string())])
+PARTITIONING = ds.partitioning(pa.schema([('method', pa.string())]), flavor='hive')
+
+
+def frida_version():
+    if not shutil.which('frida'):
+        return ''
+    proc = subprocess.run(['frida', '--version'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    return proc.stdout.strip()
+
+
+def new_run(host=None):
+    host = host or socket.gethostname()
+    return {
+        'run_id': f"{time.strftime('%Y%m%dT%H%M%S')}-{host}-{uuid.uuid4().hex[:6]}",
+        'host': host,
+        'kernel': platform.release(),
+        'frida_version': frida_version(),
+    }
+
+
+def write_partition(method, name, table):
+    directory = os.path.join(STORE_DIR, f'method={method}')
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'{name}.parquet')
+    tmp_path = os.path.join(directory, f'.{name}.parquet.tmp')
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def append_run(run, method, iteration, records, phases, timestamp=None, environment=None, noise=None):
+    timestamp = int(timestamp if timestamp is not None else time.time())
+    columns = {
+        'run_id': [run['run_id']] * len(phases),
+        'iteration': [iteration] * len(phases),
+        'phase': list(phases),
+        'calls': [records[p]['iterations'] for p in phases],
+        'time_ns': [records[p]['elapsed_ns'] for p in phases],
+        'max_rss_kb': [records[p]['max_rss_kb'] for p in phases],
+        'validation': [records[p]['validation'] for p in phases],
+        'timestamp': [timestamp] * len(phases),
+        'host': [run['host']] * len(phases),
+        'kernel': [run['kernel']] * len(phases),
+        'frida_version': [run['frida_version']] * len(phases),
+    }
+    for name in PERF_COUNTERS:
+        # Null when BENCH_PERF was off or the counter could not be opened
+        columns[name] = [records[p].get(name) for p in phases]
+    for name, _ in ENVIRONMENT_FIELDS:
+        # Fingerprint taken just before the run (environment.py), null if none was
+        columns[name] = [(environment or {}).get(name)] * len(phases)
+    # Reasons the run was flagged as noisy, '' for a quiet host
+    columns['noise'] = [noise] * len(phases)
+    return write_partition(method, f"{run['run_id']}-{iteration:04d}", pa.table(columns, schema=SCHEMA))
+
+
+def dataset(store_dir=STORE_DIR):
+    # Files written before a column was added read back with nulls in it
+    return ds.dataset(store_dir, schema=SCHEMA.append(pa.field('method', pa.string())), format='parquet',
+                      partitioning=PARTITIONING, ignore_prefixes=['.', '_'])
+
+
+def load(columns=None, methods=None, phases=None, run_ids=None, store_dir=STORE_DIR):
+    if not os.path.isdir(store_dir):
+        return pd.DataFrame(columns=columns or ['method'] + SCHEMA.names)
+    expr = None
+    for field, values in [('method', methods), ('phase', phases), ('run_id', run_ids)]:
+        if values is not None:
+            field_expr = ds.field(field).isin(list(values))
+            expr = field_expr if expr is None else expr & field_expr
+    return dataset(store_dir).to_table(columns=columns, filter=expr).to_pandas()
+
+
+def append_table(directory, run, rows, name=None):
+    name = name or run['run_id']
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{name}.parquet")
+    tmp_path = os.path.join(directory, f".{name}.parquet.tmp")
+    pd.DataFrame(rows).assign(run_id=run['run_id'], host=run['host']).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def append_ci(run, rows):
+    return append_table(CI_DIR, run, rows)
+
+
+def append_startup(run, rows):
+    return append_table(STARTUP_DIR, run, rows)
+
+
+def append_scaling(run, rows):
+    return append_table(SCALING_DIR, run, rows)
+
+
+def append_sweep(run, rows):
+    return append_table(SWEEP_DIR, run, rows)
+
+
+def append_stream(run, rows):
+    return append_table(STREAM_DIR, run, rows)
+
+
+def append_depth(run, rows):
+    return append_table(DEPTH_DIR, run, rows)
+
+
+def append_density(run, rows):
+    return append_table(DENSITY_DIR, run, rows)
+
+
+def append_memory(run, method, iteration, samples):
+    # One file per benchmark run, since the runner records runs one at a time
+    rows = [dict(sample, method=method, iteration=iteration) for sample in samples]
+    for row in rows:
+        del row['phase']
+    return append_table(MEMORY_DIR, run, rows, name=f"{run['run_id']}-{method}-{iteration:04d}")
+
+
+def append_chunks(run, method, iteration, records, phases):
+    rows = []
+    for phase in phases:
+        record = records[phase]
+        for chunk, (calls, ns) in enumerate(zip(record['chunk_calls'], record['chunk_ns'])):
+            rows.append({'method': method, 'iteration': iteration, 'phase': phase, 'chunk': chunk,
+                         'calls': calls, 'time_ns': ns})
+    return append_table(CHUNKS_DIR, run, rows, name=f"{run['run_id']}-{method}-{iteration:04d}")
+
+
+def completed_table_runs(directory, methods):
+    # Runs per method in a side table written one file per benchmark run
+    df = load_table(directory)
+    counts = {m: 0 for m in methods}
+    if not df.empty:
+        runs = df.drop_duplicates(['method', 'run_id', 'iteration'])
+        counts.update(runs[runs['method'].isin(methods)].groupby('method').size().to_dict())
+    return counts
+
+
+def load_table(directory):
+    if not os.path.isdir(directory):
+        return pd.DataFrame()
+    files = sorted(f for f in os.listdir(directory) if f.endswith('.parquet') and not f.startswith('.'))
+    if not files:
+        return pd.DataFrame()
+    return pd.concat([pd.read_parquet(os.path.join(directory, f)) for f in files], ignore_index=True)
+
+
+def completed_iterations(methods):
+    df = load(columns=['method', 'run_id', 'iteration'], methods=methods)
+    if df.empty:
+        return {m: 0 for m in methods}
+    counts = df.drop_duplicates().groupby('method').size()
+    return {m: int(counts.get(m, 0)) for m in methods}
+
+
+def drop_noisy(df):
+    # Runs from before fingerprinting have a null noise flag and are kept
+    return df[df['noise'].fillna('') == '']
+
+
+def load_timing_frames(methods=None, exclude_noisy=False):
+    if not os.path.isdir(STORE_DIR):
+        return pd.read_csv(LEGACY_RESULTS_CSV), pd.read_csv(LEGACY_MEMORY_CSV)
+
+    df = load(columns=['method', 'run_id', 'iteration', 'phase', 'time_ns', 'calls', 'max_rss_kb', 'noise'],
+              methods=methods)
+    if exclude_noisy:
+        df = drop_noisy(df)
+    df_timing = df[['method', 'phase', 'time_ns', 'calls']].rename(columns={'method': 'Method', 'phase': 'Function', 'calls': 'Calls'})
+    df_timing['Time_us'] = df_timing.pop('time_ns') / 1000.0
+
+    df_memory = df.groupby(['method', 'run_id', 'iteration'], as_index=False)['max_rss_kb'].max()
+    df_memory = df_memory.rename(columns={'method': 'Method', 'max_rss_kb': 'Memory_KB'})[['Method', 'Memory_KB']]
+    return df_timing, df_memory
+
+
+def load_counter_frame(methods=None):
+    df = load(columns=['method', 'phase', 'calls'] + PERF_COUNTERS, methods=methods)
+    return df.dropna(subset=PERF_COUNTERS, how='all').rename(
+        columns={'method': 'Method', 'phase': 'Function', 'calls': 'Calls'})
+
+
+def import_csv(results_csv=LEGACY_RESULTS_CSV, memory_csv=LEGACY_MEMORY_CSV):
+    # The old CSVs have no iteration index: the n-th row of a (method, phase)
+    # belongs to the n-th run of that method, and so does its n-th memory row
+    timings = {}
+    with open(results_csv, newline='') as f:
+        for row in csv.DictReader(f):
+            timings.setdefault(row['Method'], {}).setdefault(row['Function'], []).append(float(row['Time_us']))
+    memory = {}
+    with open(memory_csv, newline='') as f:
+        for row in csv.DictReader(f):
+            memory.setdefault(row['Method'], []).append(int(row['Memory_KB']))
+
+    run = {'run_id': 'legacy-csv', 'host': '', 'kernel': '', 'frida_version': ''}
+    imported = 0
+    for method, by_phase in timings.items():
+        phases = list(by_phase)
+        for i in range(min(len(v) for v in by_phase.values())):
+            rss = memory.get(method, [])
+            records = {p: {'iterations': 0, 'elapsed_ns': int(round(by_phase[p][i] * 1000)),
+                           'max_rss_kb': rss[i] if i < len(rss) else 0, 'validation': 'unknown'} for p in phases}
+            append_run(run, method, i + 1, records, phases, timestamp=0)
+            imported += 1
+    return imported
+
+
+def conform(table):
+    columns = [table[f.name] if f.name in table.column_names else pa.nulls(table.num_rows, f.type) for f in SCHEMA]
+    return pa.table(columns, schema=SCHEMA)
+
+
+def compact():
+    for entry in sorted(os.listdir(STORE_DIR)):
+        directory = os.path.join(STORE_DIR, entry)
+        files = sorted(f for f in os.listdir(directory) if f.endswith('.parquet'))
+        if len(files) < 2:
+            continue
+        table = pa.concat_tables([conform(pq.read_table(os.path.join(directory, f), partitioning=None))
+                                  for f in files])
+        write_partition(entry.split('=', 1)[1], f'compacted-{uuid.uuid4().hex[:8]}', table)
+        for f in files:
+            os.unlink(os.path.join(directory, f))
+        print(f"{entry}: {len(files)} files -> 1 ({table.num_rows} rows)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the columnar results store')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('show', help='print run counts per method')
+    sub.add_parser('import-csv', help='import legacy results.csv/memory.csv')
+    sub.add_parser('compact', help='merge each method partition into a single file')
+    args = parser.parse_args()
+
+    if args.command == 'show':
+        df = load(columns=['method', 'run_id', 'iteration', 'host', 'frida_version', 'noise'])
+        runs = df.drop_duplicates(['method', 'run_id', 'iteration'])
+        runs = runs.assign(noisy=runs['noise'].fillna('') != '')
+        print(runs.groupby(['method', 'host', 'frida_version', 'noisy'], dropna=False).size().to_string())
+    elif args.command == 'import-csv':
+        print(f"Imported {import_csv()} runs into {STORE_DIR}")
+    elif args.command == 'compact':
+        compact()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+import environment
+import frida_session
+import results_store
+from journal import FINAL_STATUSES, Journal
+from bench_records import iter_memory_samples, iter_records
+from bench_stats import BASELINE_FOR, median_ci, overhead_ci
+from environment import parse_cpu_list
+
+BENCHMARK = './build/benchmark'
+HOOK_LIB = './build/hook.so'
+HISTOGRAMS_JSONL = 'results/histograms.jsonl'
+ITERATIONS = 10
+RETRIES = 2
+RETRY_BACKOFF_S = 5
+# What benchmark.c prints before exiting when a hook does not override the
+# return value, at validation or during a phase
+HOOK_FAILURE_MARKERS = ('not overriding return value', 'INTERCEPT FAILURE')
+# Adaptive rounds in a row a method may end without a new stored run (hook
+# failures, refused noisy runs) before it is dropped
+STALLED_ROUNDS = 3
+
+PHASES = ['hot_path', 'heavy_work', 'recursive', 'array_ops', 'memory_ops']
+COMPLEX_PHASES = ['complex_ops']
+# Stalker recompiles every block the thread runs, so only these phases are traced
+STALKER_PHASES = ['hot_path', 'recursive', 'array_ops']
+# The phases whose functions take arguments worth reading: compute_sum's ints
+# and process_array's buffer and out-param
+ARGS_PHASES = ['hot_path', 'array_ops']
+ARGS_ACCESS = ['none', 'readbytearray', 'wrap', 'pointer']
+
+
+def frida_command(script, runtime=None, args=()):
+    cmd = ['frida', '-l', script, '-f', BENCHMARK]
+    if runtime:
+        cmd.append(f'--runtime={runtime}')
+    if args:
+        # Everything after -- is passed on to the spawned benchmark
+        cmd += ['--'] + list(args)
+    return cmd
+
+
+def frida_method(name, script, runtime=None, args=(), env=None, phases=PHASES, persistent=False):
+    # Runs through the frida CLI ('cmd'), or with persistent=True through one
+    # long-lived device handle per worker in frida_session.py
+    return {'name': name, 'cmd': frida_command(script, runtime, args), 'script': script, 'runtime': runtime,
+            'args': list(args), 'env': env or {}, 'phases': phases, 'frida': True, 'persistent': persistent}
+
+
+def build_methods(persistent=False):
+    methods = [
+        {'name': 'baseline', 'cmd': [BENCHMARK], 'env': {'SKIP_INTERCEPT_VALIDATION': '1'}, 'phases': PHASES},
+        {'name': 'ldpreload', 'cmd': [BENCHMARK], 'env': {'LD_PRELOAD': HOOK_LIB}, 'phases': PHASES},
+        # Native hooks that do not rely on symbol interposition
+        {'name': 'ldaudit', 'cmd': [BENCHMARK], 'env': {'LD_AUDIT': './build/audit.so'}, 'phases': PHASES},
+        {'name': 'got_hook', 'cmd': [BENCHMARK], 'env': {'LD_PRELOAD': './build/got_hook.so'}, 'phases': PHASES},
+        {'name': 'inline_hook', 'cmd': [BENCHMARK], 'env': {'LD_PRELOAD': './build/inline_hook.so'},
+         'phases': PHASES},
+        # Hooks that read arguments and buffers instead of only counting
+        {'name': 'ldpreload_args', 'cmd': [BENCHMARK, '--phases', ','.join(ARGS_PHASES)],
+         'env': {'LD_PRELOAD': './build/hook_args.so', 'SKIP_INTERCEPT_VALIDATION': '1'}, 'phases': ARGS_PHASES},
+    ]
+    if persistent and frida_session.frida is None:
+        print("Frida Python bindings not found. Install with: pip install frida-tools")
+        return methods
+    if not persistent and not shutil.which('frida'):
+        print("Frida not found. Install with: pip install frida-tools")
+        return methods
+
+    for runtime in ['v8', 'qjs']:
+        for mode in ['onenter', 'onleave', 'both']:
+            methods.append(frida_method(f'frida_{mode}_{runtime}', f'frida_{mode}.js', runtime,
+                                        persistent=persistent))
+        # Return value overrides that replace the function instead of attaching
+        for variant in ['replace', 'replace_cmodule', 'replacefast']:
+            methods.append(frida_method(f'frida_{variant}_{runtime}', f'frida_{variant}.js', runtime,
+                                        persistent=persistent))
+    methods.append(frida_method('frida_cmodule', 'frida_cmodule_noreturn.js',
+                                env={'SKIP_INTERCEPT_VALIDATION': '1'}, persistent=persistent))
+
+    for runtime in ['v8', 'qjs']:
+        for access in ARGS_ACCESS:
+            methods.append(frida_method(f'frida_args_{access}_{runtime}', f'frida_args_{access}.js', runtime,
+                                        args=['--phases', ','.join(ARGS_PHASES)],
+                                        env={'SKIP_INTERCEPT_VALIDATION': '1'}, phases=ARGS_PHASES,
+                                        persistent=persistent))
+    methods.append(frida_method('frida_args_cmodule', 'frida_args_cmodule.js', args=['--phases', ','.join(ARGS_PHASES)],
+                                env={'SKIP_INTERCEPT_VALIDATION': '1'}, phases=ARGS_PHASES, persistent=persistent))
+
+    for events in ['block', 'call', 'cmodule']:
+        methods.append(frida_method(f'frida_stalker_{events}', f'frida_stalker_{events}.js',
+                                    args=['--phases', ','.join(STALKER_PHASES)], env={'SKIP_INTERCEPT_VALIDATION': '1'},
+                                    phases=STALKER_PHASES, persistent=persistent))
+
+    methods.append({'name': 'baseline_complex', 'cmd': [BENCHMARK], 'env': {'SKIP_INTERCEPT_VALIDATION': '1'},
+                    'phases': COMPLEX_PHASES})
+    methods.append({'name': 'ldpreload_complex', 'cmd': [BENCHMARK], 'env': {'LD_PRELOAD': HOOK_LIB},
+                    'phases': COMPLEX_PHASES})
+    for runtime in ['v8', 'qjs']:
+        methods.append(frida_method(f'frida_complex_{runtime}', 'frida_complex.js', runtime,
+                                    phases=COMPLEX_PHASES, persistent=persistent))
+    return methods
+
+
+def default_cores(mode):
+    available = sorted(os.sched_getaffinity(0))
+    if mode == 'serial':
+        return available[-1:]
+    # Leave the first core to the orchestrator and the rest of the system
+    return available[1:] if len(available) > 1 else available
+
+
+_worker_core = None
+
+
+def pin_worker(core_queue):
+    global _worker_core
+    _worker_core = core_queue.get()
+    os.sched_setaffinity(0, {_worker_core})
+
+
+def run_cell_persistent(method, iteration):
+    # Records come back as script messages, so the benchmark writes its own
+    # copy to /dev/null
+    env = dict(method['env'], BENCH_RECORDS=os.devnull)
+    returncode, output, lines = frida_session.shared_device().launch(
+        [BENCHMARK] + method['args'], env, method['script'], method['runtime'])
+    return {
+        'method': method['name'],
+        'iteration': iteration,
+        'core': _worker_core,
+        'returncode': returncode,
+        'output': output,
+        'records': {record['phase']: record for record in iter_records(lines)},
+        'memory': list(iter_memory_samples(lines)),
+    }
+
+
+def run_cell_cli(method, iteration):
+    # The benchmark (and, for Frida, the spawned target with its agent threads)
+    # inherits the affinity of this pinned worker process
+    fd, records_path = tempfile.mkstemp(prefix=f"{method['name']}-{iteration}-", suffix='.jsonl')
+    os.close(fd)
+    env = dict(os.environ)
+    env.update(method['env'])
+    env['BENCH_RECORDS'] = records_path
+    try:
+        proc = subprocess.run(method['cmd'], env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        with open(records_path) as f:
+            lines = f.readlines()
+    finally:
+        os.unlink(records_path)
+    return {
+        'method': method['name'],
+        'iteration': iteration,
+        'core': _worker_core,
+        'returncode': proc.returncode,
+        'output': proc.stdout,
+        'records': {record['phase']: record for record in iter_records(lines)},
+        'memory': list(iter_memory_samples(lines)),
+    }
+
+
+def run_cell(method, iteration, delay=0):
+    if delay:
+        time.sleep(delay)
+    # Fingerprinted just before the launch, so the runnable count shows what
+    # the run is about to compete with
+    fp = environment.fingerprint([_worker_core] if _worker_core is not None else sorted(os.sched_getaffinity(0)))
+    launch = run_cell_persistent if method.get('persistent') else run_cell_cli
+    return dict(launch(method, iteration), environment=fp)
+
+
+def interleave(cells, seed=None):
+    # Randomized complete blocks: round i holds the i-th pending run of every
+    # method in a fresh random order, so drift over the campaign (thermals,
+    # turbo budget, background load) hits all methods alike
+    rng = random.Random(seed)
+    rounds = {}
+    for method, i in cells:
+        rounds.setdefault(i, []).append((method, i))
+    order = []
+    for i in sorted(rounds):
+        block = rounds[i]
+        rng.shuffle(block)
+        order.extend(block)
+    return order
+
+
+def completed_iterations(methods, histogram, table=None):
+    counts = {m['name']: 0 for m in methods}
+    if table:
+        return results_store.completed_table_runs(table, [m['name'] for m in methods])
+    if histogram:
+        if os.path.exists(HISTOGRAMS_JSONL):
+            with open(HISTOGRAMS_JSONL) as f:
+                for line in f:
+                    method = json.loads(line)['method']
+                    if method in counts:
+                        counts[method] += 1
+        return {m['name']: counts[m['name']] // len(m['phases']) for m in methods}
+    return results_store.completed_iterations([m['name'] for m in methods])
+
+
+def plan_cells(methods, iterations, histogram=False, table=None, journal=None, kind='store'):
+    # The journal decides for every cell it knows; stored runs from before it
+    # existed count as the first iterations of their method
+    done = completed_iterations(methods, histogram, table)
+    cells = []
+    for method in methods:
+        pending = []
+        for i in range(1, iterations + 1):
+            status = journal.status(kind, method['name'], i) if journal else None
+            if status in FINAL_STATUSES or (status is None and i <= done[method['name']]):
+                continue
+            pending.append((method, i))
+        if not pending:
+            print(f"{method['name']} benchmark already complete, skipping...")
+        cells.extend(pending)
+    return cells
+
+
+def record_cell(run, method, result, workers=1, noise='flag'):
+    # Returns the journal status of the cell: done, failed, hook_failure, or
+    # pending for a run discarded on a noisy host
+    name = method['name']
+    if result['returncode'] != 0:
+        print(f"\n{name} failed with exit code {result['returncode']} (iteration {result['iteration']})")
+        print(result['output'])
+        if any(marker in result['output'] for marker in HOOK_FAILURE_MARKERS):
+            return 'hook_failure'
+        return 'failed'
+
+    records = result['records']
+    missing = [phase for phase in method['phases'] if phase not in records]
+    if missing:
+        print(f"  Warning: Incomplete data for {name} run {result['iteration']} (missing {', '.join(missing)})")
+        return 'failed'
+
+    validated = method['env'].get('SKIP_INTERCEPT_VALIDATION') != '1'
+    if validated and any(records[phase]['validation'] != 'intercepted' for phase in method['phases']):
+        print(f"  Hook failure detected for {name} run {result['iteration']}, skipping")
+        return 'hook_failure'
+
+    reasons = environment.noise_reasons(result['environment'], workers)
+    if reasons and noise == 'refuse':
+        # Left unrecorded, so a later resume runs the cell again
+        print(f"\n  Noisy host for {name} run {result['iteration']} ({'; '.join(reasons)}), discarding")
+        return 'pending'
+
+    if result['memory']:
+        # Sampling smaps between phases (and, with a period, from a thread
+        # competing for the pinned core) moves the timings, and the memory
+        # campaign resumes from its own table, so these runs only keep their
+        # timeline and never count as timing iterations
+        results_store.append_memory(run, name, result['iteration'], result['memory'])
+        return 'done'
+
+    if 'chunk_ns' in records[method['phases'][0]]:
+        # Stamping the chunk boundaries moves the phase totals as well, and the
+        # chunks campaign resumes from its own table
+        results_store.append_chunks(run, name, result['iteration'], records, method['phases'])
+        return 'done'
+
+    if 'hist_ns' in records[method['phases'][0]]:
+        # Per-call timing perturbs the phase totals, so histogram runs are kept apart
+        with open(HISTOGRAMS_JSONL, 'a') as f:
+            for phase in method['phases']:
+                record = dict(records[phase], method=name, iteration=result['iteration'])
+                f.write(json.dumps(record) + '\n')
+        return 'done'
+
+    results_store.append_run(run, name, result['iteration'], records, method['phases'],
+                             environment=result['environment'], noise='; '.join(reasons))
+    return 'done'
+
+
+def run_campaign(run, methods, cells, cores, noise='flag', journal=None, kind='store', retries=RETRIES):
+    # Failed Frida runs (attach races, agent crashes) are retried with
+    # exponential backoff; a cell that keeps failing is left failed in the
+    # journal and the campaign carries on with the others
+    ctx = multiprocessing.get_context('fork')
+    core_queue = ctx.Queue()
+    for core in cores:
+        core_queue.put(core)
+
+    journal = journal or Journal()
+    total = len(cells)
+    finished = 0
+    failed = 0
+    tries = {}
+    journal.mark(kind, [(method['name'], i) for method, i in cells], 'running', run['run_id'])
+    with ProcessPoolExecutor(max_workers=len(cores), mp_context=ctx,
+                             initializer=pin_worker, initargs=(core_queue,)) as pool:
+        futures = {pool.submit(run_cell, method, i): (method, i) for method, i in cells}
+        while futures:
+            completed, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in completed:
+                method, iteration = futures.pop(future)
+                cell = [(method['name'], iteration)]
+                try:
+                    result = future.result()
+                    status = record_cell(run, method, result, len(cores), noise)
+                except Exception as e:
+                    # A worker or store error (Frida spawn, Parquet write) fails
+                    # only this cell, and the campaign carries on
+                    print(f"\n{method['name']} #{iteration} raised {type(e).__name__}: {e}")
+                    journal.mark(kind, cell, 'failed', error=f"{type(e).__name__}: {e}")
+                    finished += 1
+                    failed += 1
+                    continue
+                # The journal counts attempts over all campaigns; the retry
+                # budget is per campaign, so a resume gets a fresh one
+                attempts = tries[cell[0]] = tries.get(cell[0], 0) + 1
+                if status == 'failed' and method.get('frida') and attempts <= retries:
+                    delay = RETRY_BACKOFF_S * 2 ** (attempts - 1)
+                    print(f"  Retrying {method['name']} #{result['iteration']} in {delay} s "
+                          f"(attempt {attempts + 1} of {retries + 1})")
+                    journal.mark(kind, cell, 'running', error=result['output'])
+                    futures[pool.submit(run_cell, method, result['iteration'], delay)] = (method, result['iteration'])
+                    continue
+                journal.mark(kind, cell, status, error=result['output'] if status in ('failed', 'hook_failure') else None)
+                finished += 1
+                failed += status == 'failed'
+                print(f"\r[{finished}/{total}] {result['method']} #{result['iteration']} (cpu {result['core']})",
+                      end='', flush=True)
+    print()
+    if failed:
+        print(f"{failed} run(s) failed; they stay in {journal.path} and run again on resume")
+    return failed == 0
+
+
+def cell_intervals(samples, method, baseline_samples):
+    rows = []
+    for phase in method['phases']:
+        values = samples.get((method['name'], phase))
+        if values is None:
+            continue
+        baseline = baseline_samples.get(phase)
+        base_median = float(np.median(baseline)) if baseline is not None else float(np.median(values))
+        if baseline is None or method['name'] == BASELINE_FOR.get(phase, 'baseline'):
+            low, high = median_ci(values)
+            estimate = float(np.median(values))
+        else:
+            low, high = overhead_ci(values, baseline)
+            estimate = float(np.median(values)) - base_median
+        rows.append({
+            'method': method['name'],
+            'phase': phase,
+            'n': len(values),
+            'estimate_us': estimate,
+            'ci_low_us': low,
+            'ci_high_us': high,
+            'ci_width_pct': (high - low) / base_median * 100 if base_median > 0 else float('inf'),
+        })
+    return rows
+
+
+def run_adaptive(run, methods, cores, args, journal):
+    # Each round runs one more iteration of every method whose bootstrap CI on the
+    # median overhead of any phase is still wider than --ci-target percent of the
+    # baseline median, until --max-iterations is reached. Attempts are capped at
+    # --max-iterations as well, since a run that is not stored does not count
+    # towards the CI
+    names = [m['name'] for m in methods]
+    next_iteration = {name: done + 1 for name, done in results_store.completed_iterations(names).items()}
+    attempts = dict.fromkeys(names, 0)
+    stored = dict.fromkeys(names, 0)
+    stalled = dict.fromkeys(names, 0)
+    active = list(methods)
+    intervals = {}
+    rng = random.Random(args.seed)
+    while active:
+        cells = []
+        for method in active:
+            cells.append((method, next_iteration[method['name']]))
+            next_iteration[method['name']] += 1
+            attempts[method['name']] += 1
+        rng.shuffle(cells)
+        if not run_campaign(run, methods, cells, cores, args.noise, journal, retries=args.retries):
+            return False
+
+        df = results_store.load(columns=['method', 'phase', 'time_ns'], methods=names, run_ids=[run['run_id']])
+        samples = {key: group.to_numpy() / 1000.0 for key, group in df.groupby(['method', 'phase'])['time_ns']}
+        still_active = []
+        for method in active:
+            baseline_samples = {phase: samples.get((BASELINE_FOR.get(phase, 'baseline'), phase))
+                                for phase in method['phases']}
+            baseline_samples = {k: v for k, v in baseline_samples.items() if v is not None}
+            rows = cell_intervals(samples, method, baseline_samples)
+            for row in rows:
+                intervals[(row['method'], row['phase'])] = row
+            n = min((row['n'] for row in rows), default=0)
+            name = method['name']
+            stalled[name] = stalled[name] + 1 if n <= stored[name] else 0
+            stored[name] = n
+            converged = bool(rows) and all(row['ci_width_pct'] <= args.ci_target for row in rows)
+            if n >= args.min_iterations and (converged or n >= args.max_iterations):
+                widest = max(row['ci_width_pct'] for row in rows)
+                status = 'converged' if converged else 'budget exhausted'
+                print(f"  {name}: {status} after {n} runs (widest CI {widest:.2f}% of baseline)")
+            elif attempts[name] >= args.max_iterations:
+                print(f"  {name}: dropped after {attempts[name]} attempts with only {n} runs stored")
+            elif stalled[name] >= STALLED_ROUNDS:
+                print(f"  {name}: dropped, no run stored in the last {STALLED_ROUNDS} rounds "
+                      f"(hook failures or refused noisy runs)")
+            else:
+                still_active.append(method)
+        active = still_active
+
+    rows = list(intervals.values())
+    for row in rows:
+        row['converged'] = row['ci_width_pct'] <= args.ci_target
+    print(f"Recorded confidence intervals in {results_store.append_ci(run, rows)}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the interception benchmark matrix')
+    parser.add_argument('--mode', choices=['serial', 'parallel'], default='serial',
+                        help='serial runs one cell at a time for comparability; parallel spreads cells over --cores')
+    parser.add_argument('--cores', help='CPU list to pin benchmark processes to, e.g. "2-7,10"')
+    parser.add_argument('--iterations', type=int, default=ITERATIONS)
+    parser.add_argument('--methods', help='comma-separated subset of methods to run')
+    parser.add_argument('--order', choices=['interleaved', 'grouped'], default='interleaved',
+                        help='interleaved runs every method once per round in random order; grouped runs all '
+                             'iterations of one method before the next')
+    parser.add_argument('--seed', type=int, help='seed for the interleaved order')
+    parser.add_argument('--noise', choices=['flag', 'refuse'], default='flag',
+                        help='flag runs on a noisy host in the store, or refuse to record them (see environment.py)')
+    parser.add_argument('--retries', type=int, default=RETRIES,
+                        help='times a failed Frida run is retried, with exponential backoff')
+    parser.add_argument('--histogram', type=int, metavar='BATCH',
+                        help='record per-call latency histograms, timing batches of BATCH calls')
+    parser.add_argument('--perf', action='store_true',
+                        help='collect hardware performance counters per phase (BENCH_PERF=1)')
+    parser.add_argument('--memory', type=int, metavar='MS',
+                        help='sample smaps between phases and every MS milliseconds (0: between phases only) '
+                             'into results/memory (BENCH_MEMORY=MS)')
+    parser.add_argument('--chunks', type=int, metavar='K',
+                        help='time each phase in K equal chunks into results/chunks for warm-up '
+                             'detection (BENCH_CHUNKS=K)')
+    parser.add_argument('--persistent', action='store_true',
+                        help='run Frida methods through the Python bindings with one device handle and '
+                             'precompiled scripts per worker, instead of one frida CLI per run')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='keep running methods until the bootstrap CI of every phase is below --ci-target')
+    parser.add_argument('--ci-target', type=float, default=2.0,
+                        help='maximum 95%% CI width of the median overhead, in percent of the baseline median')
+    parser.add_argument('--min-iterations', type=int, default=5)
+    parser.add_argument('--max-iterations', type=int, default=50)
+    args = parser.parse_args()
+
+    if args.histogram:
+        os.environ['BENCH_HISTOGRAM'] = str(args.histogram)
+    if args.perf:
+        os.environ['BENCH_PERF'] = '1'
+    if args.memory is not None:
+        os.environ['BENCH_MEMORY'] = str(args.memory)
+    if args.chunks:
+        os.environ['BENCH_CHUNKS'] = str(args.chunks)
+
+    cores = parse_cpu_list(args.cores) if args.cores else default_cores(args.mode)
+    if args.mode == 'serial':
+        cores = cores[:1]
+
+    methods = build_methods(persistent=args.persistent)
+    if args.methods:
+        wanted = set(args.methods.split(','))
+        methods = [m for m in methods if m['name'] in wanted]
+
+    if args.noise == 'refuse':
+        # Everything but the run queue is fixed for the campaign, so fail early
+        static = environment.noise_reasons(environment.fingerprint(cores))
+        if static:
+            print(f"Refusing to run on a noisy host: {'; '.join(static)}")
+            return 1
+
+    os.makedirs('results', exist_ok=True)
+    journal = Journal()
+    if args.adaptive:
+        if args.histogram or args.memory is not None or args.chunks:
+            parser.error('--adaptive cannot be combined with --histogram, --memory or --chunks')
+        run = results_store.new_run()
+        print(f"\nRunning adaptive campaign {run['run_id']} ({args.mode}, cpus {','.join(map(str, cores))}, "
+              f"target CI {args.ci_target}% of baseline)...")
+        start = time.monotonic()
+        ok = run_adaptive(run, methods, cores, args, journal)
+        print(f"Wall time: {time.monotonic() - start:.1f} s")
+        return 0 if ok else 1
+
+    if args.memory is not None and args.chunks:
+        parser.error('--memory and --chunks each resume from their own table; run them separately')
+    table = results_store.MEMORY_DIR if args.memory is not None else results_store.CHUNKS_DIR if args.chunks else None
+    # Each results table resumes independently, so the journal keeps them apart
+    kind = ('histogram' if args.histogram else 'memory' if args.memory is not None
+            else 'chunks' if args.chunks else 'store')
+    cells = plan_cells(methods, args.iterations, bool(args.histogram), table, journal, kind)
+    if not cells:
+        print("All benchmarks already complete")
+        return 0
+    if args.order == 'interleaved':
+        cells = interleave(cells, args.seed)
+
+    run = results_store.new_run()
+    print(f"\nRunning {len(cells)} benchmark runs as {run['run_id']} ({args.mode}, cpus {','.join(map(str, cores))})...")
+    start = time.monotonic()
+    ok = run_campaign(run, methods, cells, cores, args.noise, journal, kind, args.retries)
+    print(f"Wall time: {time.monotonic() - start:.1f} s")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import results_store
+from bench_records import read_records
+from bench_stats import scaling_summary
+from runner import BENCHMARK, HOOK_LIB, PHASES, frida_command, parse_cpu_list
+
+ITERATIONS = 3
+
+
+def build_methods():
+    methods = [
+        {'name': 'baseline', 'cmd': [BENCHMARK], 'env': {'SKIP_INTERCEPT_VALIDATION': '1'}},
+        {'name': 'ldpreload', 'cmd': [BENCHMARK], 'env': {'LD_PRELOAD': HOOK_LIB}},
+        {'name': 'ldpreload_atomic', 'cmd': [BENCHMARK], 'env': {'LD_PRELOAD': './build/hook_atomic.so'}},
+        {'name': 'ldpreload_tls', 'cmd': [BENCHMARK], 'env': {'LD_PRELOAD': './build/hook_tls.so'}},
+    ]
+    if not shutil.which('frida'):
+        print("Frida not found. Install with: pip install frida-tools")
+        return methods
+
+    methods.append({'name': 'frida_onenter_v8', 'cmd': frida_command('frida_onenter.js', 'v8'), 'env': {}})
+    methods.append({'name': 'frida_onenter_perthread_v8', 'cmd': frida_command('frida_onenter_perthread.js', 'v8'),
+                    'env': {}})
+    for variant, script in [('', 'frida_cmodule_noreturn.js'), ('_atomic', 'frida_cmodule_atomic.js'),
+                            ('_perthread', 'frida_cmodule_perthread.js')]:
+        methods.append({'name': f'frida_cmodule{variant}', 'cmd': frida_command(script),
+                        'env': {'SKIP_INTERCEPT_VALIDATION': '1'}})
+    return methods
+
+
+def default_thread_counts():
+    cpus = len(os.sched_getaffinity(0))
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def run_threaded(method, threads, iteration):
+    fd, records_path = tempfile.mkstemp(prefix=f"scaling-{method['name']}-{threads}-", suffix='.jsonl')
+    os.close(fd)
+    env = dict(os.environ)
+    env.update(method['env'])
+    env['BENCH_RECORDS'] = records_path
+    env['BENCH_THREADS'] = str(threads)
+    try:
+        proc = subprocess.run(method['cmd'], env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        records = read_records(records_path)
+    finally:
+        os.unlink(records_path)
+    if proc.returncode != 0:
+        raise RuntimeError(f"exit code {proc.returncode}\n{proc.stdout}")
+
+    validated = method['env'].get('SKIP_INTERCEPT_VALIDATION') != '1'
+    rows = []
+    for phase in PHASES:
+        record = records.get(phase)
+        if record is None or (validated and record['validation'] != 'intercepted'):
+            continue
+        thread_ns = np.asarray(record['thread_ns'], dtype=float)
+        rows.append({
+            'method': method['name'],
+            'threads': threads,
+            'iteration': iteration,
+            'phase': phase,
+            'calls': record['iterations'],
+            'time_ns': record['elapsed_ns'],
+            'thread_ns_median': float(np.median(thread_ns)),
+            'thread_ns_max': float(thread_ns.max()),
+        })
+    return rows
+
+
+def print_summary(summary):
+    print("\nAggregate throughput (Mcalls/s) and per-thread latency (ns/call):")
+    print("-" * 80)
+    for (phase, method), rows in summary.groupby(['phase', 'method'], sort=False):
+        cells = '  '.join(f"{r.threads:3d}T {r.calls_per_sec / 1e6:8.2f} @ {r.thread_ns_per_call:8.1f}"
+                          for r in rows.itertuples())
+        print(f"  {phase:11s} {method:26s}: {cells}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure how hooked calls scale across pinned threads')
+    parser.add_argument('--threads', help='comma-separated thread counts, default powers of two up to the CPU count')
+    parser.add_argument('--cores', help='CPU list the phase threads are pinned to, e.g. "2-9"')
+    parser.add_argument('--iterations', type=int, default=ITERATIONS)
+    parser.add_argument('--methods', help='comma-separated subset of methods to run')
+    args = parser.parse_args()
+
+    if args.cores:
+        # benchmark.c pins thread i to the i-th CPU of its inherited affinity
+        os.sched_setaffinity(0, parse_cpu_list(args.cores))
+    thread_counts = [int(t) for t in args.threads.split(',')] if args.threads else default_thread_counts()
+
+    methods = build_methods()
+    if args.methods:
+        wanted = set(args.methods.split(','))
+        methods = [m for m in methods if m['name'] in wanted]
+
+    run = results_store.new_run()
+    total = len(methods) * len(thread_counts) * args.iterations
+    print(f"\nRunning {total} threaded runs as {run['run_id']} (threads {','.join(map(str, thread_counts))})...")
+    rows = []
+    done = 0
+    for i in range(1, args.iterations + 1):
+        for threads in thread_counts:
+            for method in methods:
+                try:
+                    rows.extend(run_threaded(method, threads, i))
+                except RuntimeError as e:
+                    print(f"\n{method['name']} failed with {threads} threads: {e}")
+                    return 1
+                done += 1
+                print(f"\r[{done}/{total}] {method['name']} x{threads}", end='', flush=True)
+    print()
+
+    print(f"Recorded scaling runs in {results_store.append_scaling(run, rows)}")
+    print_summary(scaling_summary(pd.DataFrame(rows)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
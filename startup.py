@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import results_store
+from bench_stats import STARTUP_STAGES, startup_breakdown
+from runner import BENCHMARK, HOOK_LIB
+
+try:
+    import frida
+except ImportError:
+    frida = None
+
+ITERATIONS = 10
+EXIT_TIMEOUT = 60
+
+# Prepended to each Frida script: stamps CLOCK_MONOTONIC, the same clock as
+# time.monotonic_ns() and the benchmark, once the runtime has compiled the
+# script and again after its top level (and so every Interceptor.attach) ran
+STAMP_PRELUDE = """
+var __startupClock = new NativeFunction(Module.getGlobalExportByName('clock_gettime'), 'int', ['int', 'pointer']);
+var __startupTs = Memory.alloc(16);
+function __startupStamp(stage) {
+    __startupClock(1, __startupTs);
+    send({type: 'startup', stage: stage, sec: __startupTs.readS64().toNumber(),
+          nsec: __startupTs.add(8).readS64().toNumber()});
+}
+__startupStamp('script_loaded');
+"""
+STAMP_EPILOGUE = "\n__startupStamp('hooks_installed');\n"
+
+
+def build_methods():
+    methods = [
+        {'name': 'baseline', 'env': {}},
+        {'name': 'ldpreload', 'env': {'LD_PRELOAD': HOOK_LIB}},
+    ]
+    if frida is None:
+        print("Frida Python bindings not found. Install with: pip install frida-tools")
+        return methods
+    for runtime in ['v8', 'qjs']:
+        for mode in ['onenter', 'both']:
+            methods.append({'name': f'frida_{mode}_{runtime}', 'script': f'frida_{mode}.js', 'runtime': runtime})
+    methods.append({'name': 'frida_cmodule', 'script': 'frida_cmodule_noreturn.js', 'runtime': None})
+    return methods
+
+
+def peak_rss_kb(pid):
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def probe_record(path):
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get('phase') == 'startup':
+                return record
+    return None
+
+
+def launch_native(method, env):
+    start = time.monotonic_ns()
+    proc = subprocess.run([BENCHMARK], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip())
+    return start, {}
+
+
+def launch_frida(method, env):
+    device = frida.get_local_device()
+    stamps = {}
+    exited = threading.Event()
+    with open(method['script']) as f:
+        source = STAMP_PRELUDE + f.read() + STAMP_EPILOGUE
+
+    def on_message(message, data):
+        payload = message.get('payload') if message['type'] == 'send' else None
+        if isinstance(payload, dict) and payload.get('type') == 'startup':
+            stamps[payload['stage']] = (payload['sec'] * 1000000000 + payload['nsec'], None)
+
+    start = time.monotonic_ns()
+    pid = device.spawn([BENCHMARK], env=env)
+    stamps['spawned'] = (time.monotonic_ns(), peak_rss_kb(pid))
+    session = device.attach(pid)
+    stamps['agent_loaded'] = (time.monotonic_ns(), peak_rss_kb(pid))
+    session.on('detached', lambda *args: exited.set())
+    options = {'runtime': method['runtime']} if method['runtime'] else {}
+    script = session.create_script(source, **options)
+    script.on('message', on_message)
+    script.load()
+    hooks_kb = peak_rss_kb(pid)
+    device.resume(pid)
+    stamps['resumed'] = (time.monotonic_ns(), None)
+    if not exited.wait(EXIT_TIMEOUT):
+        device.kill(pid)
+        raise RuntimeError(f'target did not exit within {EXIT_TIMEOUT} s')
+    # Script messages are delivered asynchronously, possibly after load() returned
+    if 'hooks_installed' in stamps:
+        stamps['hooks_installed'] = (stamps['hooks_installed'][0], hooks_kb)
+    return start, stamps
+
+
+def run_launch(method, iteration):
+    fd, records_path = tempfile.mkstemp(prefix=f"startup-{method['name']}-{iteration}-", suffix='.jsonl')
+    os.close(fd)
+    env = {'BENCH_STARTUP': '1', 'BENCH_RECORDS': records_path}
+    env.update(method.get('env', {}))
+    try:
+        if 'script' in method:
+            start, stamps = launch_frida(method, env)
+        else:
+            start, stamps = launch_native(method, dict(os.environ, **env))
+        record = probe_record(records_path)
+    finally:
+        os.unlink(records_path)
+    if record is None:
+        raise RuntimeError('no startup record written')
+
+    stamps['main'] = (record['main_ns'], None)
+    stamps['first_call'] = (record['first_call_ns'], record['first_call_kb'])
+    if 'hook_init_start_ns' in record:
+        stamps['agent_loaded'] = (record['hook_init_start_ns'], None)
+        stamps['hooks_installed'] = (record['hook_init_end_ns'], None)
+    rows = [{'method': method['name'], 'iteration': iteration, 'stage': stage, 't_ns': t - start, 'hwm_kb': kb,
+             'intercepted': record['intercepted']}
+            for stage, (t, kb) in stamps.items()]
+    return sorted(rows, key=lambda row: STARTUP_STAGES.index(row['stage']))
+
+
+def print_breakdown(breakdown):
+    stages = [s for s in STARTUP_STAGES if s in breakdown.columns]
+    print("\nStart-up breakdown (median ms spent reaching each stage):")
+    print("-" * 80)
+    print(f"  {'method':20s}" + ''.join(f"{s:>16s}" for s in stages) + f"{'total':>10s}{'peak KB':>10s}")
+    for method, row in breakdown.iterrows():
+        cells = ''.join(f"{row[s]:16.2f}" if row[s] == row[s] else f"{'-':>16s}" for s in stages)
+        print(f"  {method:20s}{cells}{row['total_ms']:10.2f}{row['peak_kb']:10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure hook installation and agent start-up latency')
+    parser.add_argument('--iterations', type=int, default=ITERATIONS)
+    parser.add_argument('--methods', help='comma-separated subset of methods to run')
+    args = parser.parse_args()
+
+    methods = build_methods()
+    if args.methods:
+        wanted = set(args.methods.split(','))
+        methods = [m for m in methods if m['name'] in wanted]
+
+    run = results_store.new_run()
+    print(f"\nMeasuring start-up of {len(methods)} methods x {args.iterations} launches as {run['run_id']}...")
+    rows = []
+    for i in range(1, args.iterations + 1):
+        # Interleave methods so drift in page cache or CPU state hits all of them alike
+        for method in methods:
+            try:
+                rows.extend(run_launch(method, i))
+            except Exception as e:
+                # Frida raises its own error types for spawn, attach and script failures
+                print(f"  {method['name']} launch {i} failed: {e}")
+        print(f"\r[{i}/{args.iterations}]", end='', flush=True)
+    print()
+    if not rows:
+        return 1
+
+    print(f"Recorded start-up stages in {results_store.append_startup(run, rows)}")
+    df = results_store.load_table(results_store.STARTUP_DIR)
+    print_breakdown(startup_breakdown(df[df['run_id'] == run['run_id']]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
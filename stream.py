@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import results_store
+from bench_records import read_records
+from bench_stats import stream_summary
+from runner import BENCHMARK
+
+try:
+    import frida
+except ImportError:
+    frida = None
+
+CALLS = 100000
+ITERATIONS = 5
+EXIT_TIMEOUT = 300
+MODES = {
+    'send': 'frida_stream_send.js',
+    'batch': 'frida_stream_batch.js',
+    'ring': 'frida_stream_ring.js',
+}
+# Layout of one frida_stream_ring.js record
+RING_RECORD = np.dtype([('seq', '<u8'), ('a', '<i4'), ('b', '<i4'), ('ts_ns', '<u8')])
+
+
+def bench_argv(calls):
+    return [BENCHMARK, '--iterations', str(calls), '--phases', 'hot_path']
+
+
+def run_baseline(calls):
+    fd, records_path = tempfile.mkstemp(prefix='stream-baseline-', suffix='.jsonl')
+    os.close(fd)
+    env = dict(os.environ, BENCH_RECORDS=records_path, SKIP_INTERCEPT_VALIDATION='1')
+    try:
+        proc = subprocess.run(bench_argv(calls), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        records = read_records(records_path)
+    finally:
+        os.unlink(records_path)
+    if proc.returncode != 0 or 'hot_path' not in records:
+        raise RuntimeError(proc.stderr.strip() or 'no hot_path record written')
+    return records['hot_path']['elapsed_ns']
+
+
+def event_count(payload, data):
+    if payload['type'] == 'call':
+        return 1
+    if payload['type'] == 'batch':
+        return len(payload['records'])
+    # Ring chunks arrive as raw bytes next to the JSON header
+    records = np.frombuffer(data, dtype=RING_RECORD)
+    if len(records) != payload['count']:
+        raise RuntimeError(f"ring chunk holds {len(records)} records, header says {payload['count']}")
+    return len(records)
+
+
+async def consume(queue):
+    # Runs on the event loop; the Frida callbacks only enqueue, so decoding
+    # never blocks the bindings' message thread
+    received = 0
+    last_ns = None
+    summary = None
+    while True:
+        item = await queue.get()
+        if item is None:
+            break
+        t_ns, message, data = item
+        if message['type'] != 'send':
+            raise RuntimeError(message.get('description', message))
+        payload = message['payload']
+        if payload['type'] == 'summary':
+            summary = payload
+            continue
+        received += event_count(payload, data)
+        last_ns = t_ns
+    if summary is None:
+        raise RuntimeError('script sent no summary before the target exited')
+    return received, last_ns, summary
+
+
+async def stream_launch(device, mode, runtime, calls):
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    fd, records_path = tempfile.mkstemp(prefix=f'stream-{mode}-', suffix='.jsonl')
+    os.close(fd)
+    env = {'BENCH_RECORDS': records_path, 'SKIP_INTERCEPT_VALIDATION': '1'}
+    with open(MODES[mode]) as f:
+        source = f.read()
+
+    def on_message(message, data):
+        loop.call_soon_threadsafe(queue.put_nowait, (time.monotonic_ns(), message, data))
+
+    def on_detached(*args):
+        loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    try:
+        pid = await loop.run_in_executor(None, lambda: device.spawn(bench_argv(calls), env=env))
+        session = await loop.run_in_executor(None, device.attach, pid)
+        session.on('detached', on_detached)
+        script = session.create_script(source, runtime=runtime)
+        script.on('message', on_message)
+        await loop.run_in_executor(None, script.load)
+        start_ns = time.monotonic_ns()
+        await loop.run_in_executor(None, device.resume, pid)
+        try:
+            received, last_ns, summary = await asyncio.wait_for(consume(queue), EXIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            device.kill(pid)
+            raise RuntimeError(f'target did not exit within {EXIT_TIMEOUT} s')
+        records = read_records(records_path)
+    finally:
+        os.unlink(records_path)
+    if 'hot_path' not in records:
+        raise RuntimeError('no hot_path record written')
+
+    elapsed_s = ((last_ns or start_ns) - start_ns) / 1e9
+    return {
+        'calls': records['hot_path']['iterations'],
+        'time_ns': records['hot_path']['elapsed_ns'],
+        'produced': summary['produced'],
+        'received': received,
+        # Ring overflow plus anything produced but never delivered
+        'dropped': summary['produced'] - received,
+        'ring_dropped': summary['dropped'],
+        'events_per_sec': received / elapsed_s if elapsed_s > 0 else float('nan'),
+    }
+
+
+async def run_all(modes, runtimes, calls, iterations):
+    device = frida.get_local_device()
+    rows = []
+    for i in range(1, iterations + 1):
+        baseline_ns = await asyncio.get_running_loop().run_in_executor(None, run_baseline, calls)
+        for runtime in runtimes:
+            for mode in modes:
+                try:
+                    result = await stream_launch(device, mode, runtime, calls)
+                except Exception as e:
+                    # Frida raises its own error types for spawn, attach and script failures
+                    print(f"\n  {mode}/{runtime} launch {i} failed: {e}")
+                    continue
+                rows.append({'mode': mode, 'runtime': runtime, 'iteration': i, 'baseline_ns': baseline_ns, **result})
+        print(f"\r[{i}/{iterations}]", end='', flush=True)
+    print()
+    return rows
+
+
+def print_summary(summary):
+    print("\nHost-side streaming (medians):")
+    print("-" * 80)
+    print(f"  {'mode':8s}{'runtime':>8s}{'events/s':>14s}{'dropped %':>12s}{'slowdown':>10s}")
+    for row in summary.itertuples():
+        print(f"  {row.mode:8s}{row.runtime:>8s}{row.events_per_sec:14.0f}{row.drop_pct:12.2f}{row.slowdown:9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the cost of streaming per-call records from a hook '
+                                                 'to a Python host')
+    parser.add_argument('--calls', type=int, default=CALLS, help='compute_sum calls per launch')
+    parser.add_argument('--iterations', type=int, default=ITERATIONS)
+    parser.add_argument('--modes', default=','.join(MODES), help='comma-separated subset of send,batch,ring')
+    parser.add_argument('--runtimes', default='v8', help='comma-separated Frida runtimes, e.g. "v8,qjs"')
+    args = parser.parse_args()
+
+    if frida is None:
+        print("Frida Python bindings not found. Install with: pip install frida-tools")
+        return 1
+    modes = args.modes.split(',')
+    runtimes = args.runtimes.split(',')
+
+    run = results_store.new_run()
+    print(f"\nStreaming {len(modes)} modes x {len(runtimes)} runtimes x {args.iterations} launches "
+          f"of {args.calls} calls as {run['run_id']}...")
+    rows = asyncio.run(run_all(modes, runtimes, args.calls, args.iterations))
+    if not rows:
+        return 1
+
+    print(f"Recorded streaming runs in {results_store.append_stream(run, rows)}")
+    print_summary(stream_summary(pd.DataFrame(rows)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
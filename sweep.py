@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+import argparse
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+
+import pandas as pd
+
+import results_store
+from bench_records import read_records
+from bench_stats import fit_hook_cost
+from runner import PHASES, build_methods
+
+HOOK_COST_CSV = 'results/hook_cost.csv'
+CALL_COUNTS = [100000, 300000, 1000000]
+SCALES = [0.25, 1, 4]
+REPEATS = 3
+DEFAULTS = {'work_factor': 100, 'array_len': 1000, 'alloc_size': 1024}
+
+
+def bench_args(calls, setting, phases):
+    # Each setting key is a benchmark option: work_factor -> --work-factor
+    args = ['--iterations', str(calls)]
+    for key, value in setting.items():
+        args += [f"--{key.replace('_', '-')}", str(value)]
+    return args + ['--phases', ','.join(phases)]
+
+
+def with_args(method, args):
+    # The Frida CLI forwards everything after -- to the spawned program; later
+    # options override the ones a method already passes
+    separator = ['--'] if method.get('frida') and '--' not in method['cmd'] else []
+    return method['cmd'] + separator + args
+
+
+def run_point(method, calls, setting, phases, repeat):
+    fd, records_path = tempfile.mkstemp(prefix=f"sweep-{method['name']}-", suffix='.jsonl')
+    os.close(fd)
+    env = dict(os.environ)
+    env.update(method['env'])
+    env['BENCH_RECORDS'] = records_path
+    try:
+        proc = subprocess.run(with_args(method, bench_args(calls, setting, phases)), env=env,
+                              stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        records = read_records(records_path)
+    finally:
+        os.unlink(records_path)
+    if proc.returncode != 0:
+        raise RuntimeError(f"exit code {proc.returncode}\n{proc.stdout}")
+
+    validated = method['env'].get('SKIP_INTERCEPT_VALIDATION') != '1'
+    label = ','.join(f'{k}={v}' for k, v in setting.items())
+    return [{
+        'method': method['name'],
+        'repeat': repeat,
+        'phase': phase,
+        'calls': records[phase]['iterations'],
+        'time_ns': records[phase]['elapsed_ns'],
+        'setting': label,
+        **setting,
+    } for phase in phases if phase in records and (not validated or records[phase]['validation'] == 'intercepted')]
+
+
+def print_fit(fit):
+    print("\nFitted hook cost (time = fixed + n x (callee + hook), 95% CI):")
+    print("-" * 80)
+    for phase, rows in fit.groupby('phase', sort=False):
+        print(f"\n{phase}:")
+        for row in rows.itertuples():
+            print(f"  {row.method:26s}: {row.hook_ns:9.1f} ns/call  [{row.ci_low_ns:9.1f}, {row.ci_high_ns:9.1f}]"
+                  f"  fixed {row.fixed_us - row.baseline_fixed_us:+10.1f} us  ({row.runs} runs)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sweep call counts and callee cost to fit per-call hook cost')
+    parser.add_argument('--calls', default=','.join(map(str, CALL_COUNTS)),
+                        help='comma-separated iteration counts (array_ops runs a tenth of them)')
+    parser.add_argument('--scales', default=','.join(map(str, SCALES)),
+                        help='factors applied to the default work factor, array length and allocation size')
+    parser.add_argument('--repeats', type=int, default=REPEATS)
+    parser.add_argument('--methods', help='comma-separated subset of methods; baseline is always included')
+    parser.add_argument('--phases', default=','.join(PHASES))
+    args = parser.parse_args()
+
+    phases = args.phases.split(',')
+    calls = [int(c) for c in args.calls.split(',')]
+    settings = [{k: max(1, int(v * float(scale))) for k, v in DEFAULTS.items()} for scale in args.scales.split(',')]
+    methods = [m for m in build_methods() if m['name'] == 'baseline' or set(m['phases']) & set(phases)]
+    if args.methods:
+        wanted = set(args.methods.split(',')) | {'baseline'}
+        methods = [m for m in methods if m['name'] in wanted]
+
+    run = results_store.new_run()
+    points = list(itertools.product(range(1, args.repeats + 1), calls, settings, methods))
+    print(f"\nRunning {len(points)} sweep points as {run['run_id']}...")
+    rows = []
+    for done, (repeat, n, setting, method) in enumerate(points, 1):
+        try:
+            rows.extend(run_point(method, n, setting, [p for p in phases if p in method['phases']], repeat))
+        except RuntimeError as e:
+            print(f"\n{method['name']} failed at {n} calls, {setting}: {e}")
+            return 1
+        print(f"\r[{done}/{len(points)}] {method['name']} n={n}", end='', flush=True)
+    print()
+
+    print(f"Recorded sweep in {results_store.append_sweep(run, rows)}")
+    fit = fit_hook_cost(pd.DataFrame(rows))
+    print_fit(fit)
+    fit.assign(run_id=run['run_id']).to_csv(HOOK_COST_CSV, index=False)
+    print(f"\nSaved {HOOK_COST_CSV}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+
+import results_store
+from bench_records import read_records
+from runner import BENCHMARK, ITERATIONS, PHASES
+
+LIBFUNCS = os.path.abspath('./build/libfuncs.so')
+TRACEFS_PATHS = ['/sys/kernel/tracing', '/sys/kernel/debug/tracing']
+GROUP = 'bench_uprobes'
+# The function each phase calls once per iteration, checked against the hit
+# counts in uprobe_profile
+PHASE_FUNCTIONS = {
+    'hot_path': 'compute_sum',
+    'heavy_work': 'compute_sum_heavy',
+    'recursive': 'factorial',
+    'array_ops': 'process_array',
+    'memory_ops': 'allocate_and_free',
+}
+METHODS = {
+    'uprobe': False,
+    'uprobe_ret': True,
+}
+
+
+def symbol_offsets(path, names):
+    # Uprobes are placed by file offset: st_value minus the vaddr-to-offset
+    # delta of the PT_LOAD segment holding it (64-bit little-endian ELF only)
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != b'\x7fELF' or data[4] != 2 or data[5] != 1:
+        raise RuntimeError(f'{path} is not a 64-bit little-endian ELF file')
+    e_phoff, e_shoff = struct.unpack_from('<QQ', data, 0x20)
+    e_phentsize, e_phnum, e_shentsize, e_shnum = struct.unpack_from('<HHHH', data, 0x36)
+    loads = []
+    for i in range(e_phnum):
+        p_type, _, p_offset, p_vaddr, _, p_filesz = struct.unpack_from('<IIQQQQ', data, e_phoff + i * e_phentsize)
+        if p_type == 1:
+            loads.append((p_vaddr, p_vaddr + p_filesz, p_vaddr - p_offset))
+    sections = [struct.unpack_from('<IIQQQQIIQQ', data, e_shoff + i * e_shentsize) for i in range(e_shnum)]
+    dynsym = next(s for s in sections if s[1] == 11)  # SHT_DYNSYM
+    strtab = sections[dynsym[6]]
+    offsets = {}
+    for i in range(dynsym[5] // 24):
+        st_name, _, _, _, st_value, _ = struct.unpack_from('<IBBHQQ', data, dynsym[4] + i * 24)
+        end = data.index(b'\0', strtab[4] + st_name)
+        name = data[strtab[4] + st_name:end].decode()
+        if name in names and st_value:
+            delta = next(d for start, stop, d in loads if start <= st_value < stop)
+            offsets[name] = st_value - delta
+    missing = set(names) - set(offsets)
+    if missing:
+        raise RuntimeError(f"{path} does not export {', '.join(sorted(missing))}")
+    return offsets
+
+
+def find_tracefs():
+    for path in TRACEFS_PATHS:
+        if os.path.exists(os.path.join(path, 'uprobe_events')):
+            return path
+    # Not mounted yet; needs root
+    subprocess.run(['mount', '-t', 'tracefs', 'nodev', TRACEFS_PATHS[0]], check=False,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if os.path.exists(os.path.join(TRACEFS_PATHS[0], 'uprobe_events')):
+        return TRACEFS_PATHS[0]
+    raise RuntimeError('tracefs with uprobe_events not found; run as root on a kernel with CONFIG_UPROBE_EVENTS')
+
+
+class Uprobes:
+    # Entry probes (and, with returns=True, return probes) on each libfuncs
+    # export. Uprobes are global: every process mapping the library hits them
+    # while they are enabled, so nothing else should run against build/ meanwhile
+
+    def __init__(self, tracefs, offsets, returns):
+        self.tracefs = tracefs
+        self.names = set()
+        self.events = []
+        for name, offset in offsets.items():
+            self.events.append(f'p:{GROUP}/{name} {LIBFUNCS}:{offset:#x}')
+            self.names.add(name)
+            if returns:
+                self.events.append(f'r:{GROUP}/{name}_ret {LIBFUNCS}:{offset:#x}')
+                self.names.add(f'{name}_ret')
+
+    def write(self, name, text):
+        # O_APPEND without the seek of open(..., 'a'), which tracefs rejects;
+        # truncating uprobe_events would drop every other probe on the system
+        fd = os.open(os.path.join(self.tracefs, name), os.O_WRONLY | os.O_APPEND)
+        try:
+            os.write(fd, (text + '\n').encode())
+        finally:
+            os.close(fd)
+
+    def __enter__(self):
+        for event in self.events:
+            self.write('uprobe_events', event)
+        self.write(f'events/{GROUP}/enable', '1')
+        return self
+
+    def __exit__(self, *exc):
+        self.write(f'events/{GROUP}/enable', '0')
+        for event in self.events:
+            self.write('uprobe_events', f"-:{event.split()[0].split(':', 1)[1]}")
+        # Truncate the trace buffer the probes filled
+        open(os.path.join(self.tracefs, 'trace'), 'w').close()
+        return False
+
+    def hits(self):
+        # uprobe_profile: "<file> <event> <hits>", without the group; the
+        # counts reset only when the probe is removed
+        counts = {}
+        with open(os.path.join(self.tracefs, 'uprobe_profile')) as f:
+            for line in f:
+                path, event, count = line.split()
+                if path == LIBFUNCS and event in self.names:
+                    counts[event] = int(count)
+        return counts
+
+
+def run_probed(tracefs, offsets, returns):
+    fd, records_path = tempfile.mkstemp(prefix='uprobe-', suffix='.jsonl')
+    os.close(fd)
+    env = dict(os.environ, BENCH_RECORDS=records_path, SKIP_INTERCEPT_VALIDATION='1')
+    try:
+        with Uprobes(tracefs, offsets, returns) as probes:
+            proc = subprocess.run([BENCHMARK, '--phases', ','.join(PHASES)], env=env,
+                                  stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            hits = probes.hits()
+        records = read_records(records_path)
+    finally:
+        os.unlink(records_path)
+    if proc.returncode != 0:
+        raise RuntimeError(f"exit code {proc.returncode}\n{proc.stdout}")
+    missing = [phase for phase in PHASES if phase not in records]
+    if missing:
+        raise RuntimeError(f"missing records for {', '.join(missing)}")
+    for phase in PHASES:
+        # Validation skipped the 0x42 check; a probe that fired on every call
+        # is what counts as intercepted here
+        fired = hits.get(PHASE_FUNCTIONS[phase], 0) >= records[phase]['iterations']
+        records[phase]['validation'] = 'intercepted' if fired else 'unchecked'
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure kernel uprobes on the libfuncs.so exports (needs root)')
+    parser.add_argument('--iterations', type=int, default=ITERATIONS)
+    parser.add_argument('--methods', default=','.join(METHODS), help='comma-separated subset of uprobe,uprobe_ret')
+    args = parser.parse_args()
+
+    methods = args.methods.split(',')
+    offsets = symbol_offsets(LIBFUNCS, list(PHASE_FUNCTIONS.values()))
+    tracefs = find_tracefs()
+    done = results_store.completed_iterations(methods)
+
+    run = results_store.new_run()
+    cells = [(i, m) for i in range(1, args.iterations + 1) for m in methods if i > done[m]]
+    if not cells:
+        print("All uprobe benchmarks already complete")
+        return 0
+    print(f"\nRunning {len(cells)} uprobe runs as {run['run_id']} (tracefs {tracefs})...")
+    for n, (i, method) in enumerate(cells, 1):
+        try:
+            records = run_probed(tracefs, offsets, METHODS[method])
+        except RuntimeError as e:
+            print(f"\n{method} failed (iteration {i}): {e}")
+            return 1
+        failed = [p for p in PHASES if records[p]['validation'] != 'intercepted']
+        if failed:
+            print(f"\n  Probe hits short of the call count for {method} run {i} ({', '.join(failed)}), skipping")
+            continue
+        results_store.append_run(run, method, i, records, PHASES)
+        print(f"\r[{n}/{len(cells)}] {method} #{i}", end='', flush=True)
+    print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())